@@ -0,0 +1,47 @@
+# bench_arranque.py
+# --------------------------------------------------------------
+# Arranque en frío de main.py: cada medición es un proceso nuevo de
+# Python que corre "main.py --profile-startup" (hasta el primer
+# cuadro del menú y el audio cargado, ver main.perfilar_arranque).
+#
+#  - arranque.primer_cuadro: lo que informa main.py (ms hasta el
+#    primer cuadro, contando desde el primer import)
+#  - arranque.proceso: el proceso entero, de afuera (incluye
+#    levantar el intérprete y cerrar)
+#
+# Se toma la mediana de varias corridas.
+# --------------------------------------------------------------
+
+import os
+import re
+import subprocess
+import sys
+import time
+
+import comun
+
+# Línea "TOTAL hasta 1er cuadro   123.4 ms" de main.py
+PATRON_TOTAL = re.compile(r"TOTAL hasta 1er cuadro\s+([\d.]+) ms")
+
+
+def _una_vez():
+    entorno = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    inicio = time.perf_counter()
+    salida = subprocess.run(
+        [sys.executable, "main.py", "--profile-startup"],
+        cwd=comun.CARPETA_JUEGO, env=entorno, capture_output=True, text=True, check=True,
+    ).stdout
+    proceso = time.perf_counter() - inicio
+
+    encontrado = PATRON_TOTAL.search(salida)
+    if encontrado is None:
+        raise RuntimeError("main.py --profile-startup no informó el tiempo de arranque:\n" + salida)
+    return float(encontrado.group(1)), proceso * 1000
+
+
+def correr(rapido=False):
+    corridas = [_una_vez() for _ in range(3 if rapido else 7)]
+    return {
+        "arranque.primer_cuadro": comun.metrica(comun.mediana([c[0] for c in corridas]), "ms", mayor_es_mejor=False),
+        "arranque.proceso": comun.metrica(comun.mediana([c[1] for c in corridas]), "ms", mayor_es_mejor=False),
+    }
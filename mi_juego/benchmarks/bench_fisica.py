@@ -0,0 +1,62 @@
+# bench_fisica.py
+# --------------------------------------------------------------
+# Ticks de física por segundo, sin ventana.
+#
+#  - motor.py (Pelota / Raqueta, las reglas del juego) con las
+#    reglas originales (las del juego por defecto), con colisión
+#    continua y con colisión continua + IA predictiva (las opciones
+#    config.COLISION_CONTINUA e IA_PREDICTIVA prendidas)
+#  - simulador_lote.py con 1024 partidas a la vez
+#
+# Las dos raquetas las maneja la IA, así las partidas duran y se
+# mide siempre lo mismo. Si una partida termina se empieza otra.
+# --------------------------------------------------------------
+
+import random
+
+import comun
+
+import numpy as np
+
+import motor
+import simulador_lote
+
+
+def _ticks_motor(ticks, continua, ia_predictiva):
+    estado = motor.nuevo_estado("Normal", 0, continua=continua, ia_predictiva=ia_predictiva)
+    if ia_predictiva:
+        reaccion, error = motor.PERFILES_IA["Normal"]
+        estado.ia_1 = motor.IAPredictiva(reaccion, error, random.Random(1))
+    entradas = motor.Entradas(None, None)
+    eventos = []
+    step = motor.step
+
+    def correr():
+        for _ in range(ticks):
+            step(estado, entradas, eventos)
+            if estado.ganador is not None:
+                estado.reiniciar_partida()
+
+    return ticks / comun.mejor_tiempo(correr)
+
+
+def _ticks_lote(n, ticks):
+    ia_vel, velocidad_base, _ = motor.parametros("Normal")
+
+    def correr():
+        sim = simulador_lote.SimuladorLote(n, ia_vel, velocidad_base, semilla=0)
+        for _ in range(ticks):
+            # La raqueta izquierda sigue a la pelota (como Raqueta.mover_ia)
+            sim.step(np.sign(sim.pelota_y - sim.raqueta_1_y))
+
+    return n * ticks / comun.mejor_tiempo(correr)
+
+
+def correr(rapido=False):
+    ticks = 20_000 if rapido else 100_000
+    return {
+        "fisica.motor_discreta": comun.metrica(_ticks_motor(ticks, False, False), "ticks/s"),
+        "fisica.motor_continua": comun.metrica(_ticks_motor(ticks, True, False), "ticks/s"),
+        "fisica.motor_juego": comun.metrica(_ticks_motor(ticks, True, True), "ticks/s"),
+        "fisica.lote_1024": comun.metrica(_ticks_lote(1024, ticks // 100), "ticks/s"),
+    }
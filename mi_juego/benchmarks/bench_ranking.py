@@ -0,0 +1,64 @@
+# bench_ranking.py
+# --------------------------------------------------------------
+# Velocidad del ranking de texto (ranking.txt) según su tamaño:
+# 1.000, 100.000 y 1.000.000 de líneas.
+#
+#  - ranking.cargar_ranking(): líneas leídas por segundo
+#  - ranking.guardar_score(): puntajes guardados por segundo
+#
+# Se trabaja sobre un ranking.txt temporal (el del juego no se toca),
+# escribiendo en el momento (sin el hilo de escritura diferida) y sin
+# fsync: se mide el código, no el disco.
+# --------------------------------------------------------------
+
+import os
+import random
+import tempfile
+
+import comun
+
+import config
+import ranking
+
+TAMANOS = (1_000, 100_000, 1_000_000)
+
+# Puntajes que se guardan en cada medición de guardar_score
+GUARDADOS = 500
+
+
+def _crear(ruta, lineas):
+    rnd = random.Random(lineas)
+    with open(ruta, "w", encoding="utf-8") as f:
+        for _ in range(lineas):
+            f.write(f"Jugador{rnd.randrange(1000)}:{rnd.randrange(8)}\n")
+
+
+def _guardar(cantidad):
+    for i in range(cantidad):
+        ranking.guardar_score("Bench", i % 8)
+
+
+def correr(rapido=False):
+    config.RANKING_BACKEND = "texto"
+    config.RANKING_ESCRITURA_DIFERIDA = False
+    config.RANKING_FSYNC = False
+    ranking._almacen = None
+
+    original = ranking.RUTA_RANKING
+    metricas = {}
+    with tempfile.TemporaryDirectory() as carpeta:
+        ranking.RUTA_RANKING = os.path.join(carpeta, "ranking.txt")
+        try:
+            for lineas in TAMANOS[:2] if rapido else TAMANOS:
+                _crear(ranking.RUTA_RANKING, lineas)
+                repeticiones = 1 if lineas >= 1_000_000 else 3
+
+                segundos = comun.mejor_tiempo(ranking.cargar_ranking, repeticiones)
+                metricas[f"ranking.cargar_{lineas}"] = comun.metrica(lineas / segundos, "líneas/s")
+
+                segundos = comun.mejor_tiempo(lambda: _guardar(GUARDADOS), repeticiones)
+                metricas[f"ranking.guardar_{lineas}"] = comun.metrica(GUARDADOS / segundos, "puntajes/s")
+        finally:
+            ranking.RUTA_RANKING = original
+            ranking._almacen = None
+    return metricas
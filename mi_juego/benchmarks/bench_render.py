@@ -0,0 +1,77 @@
+# bench_render.py
+# --------------------------------------------------------------
+# Costo de un cuadro de game.game_loop con el video "dummy" de SDL.
+#
+# Se juega de verdad el loop del partido durante unos segundos, sin
+# tope de cuadros (FPS_RENDER = 0) y con el perfilador prendido, y
+# después se promedian las fases de cada cuadro. Las teclas se mandan
+# por la cola de eventos de pygame: ENTER para el nombre y un ESC
+# programado con un timer para salir.
+#
+# Se mide con el render completo (todo el fondo en cada cuadro) y con
+# el render "sucio" (solo lo que cambia), que es el del juego, y con
+# el backend de texturas (video.py) en una ventana de 800x600 y en
+# una de 1920x1080 (como en pantalla completa). Con el video "dummy"
+# no hay GPU: SDL usa su renderer por software, que en cada cuadro
+# copia el lienzo de 800x600 escalado a toda la ventana. En 1920x1080
+# esa copia es casi todo el cuadro (el dibujo en el lienzo es solo lo
+# que cambió); con placa de video la hace la GPU.
+# --------------------------------------------------------------
+
+import comun
+
+import pygame
+
+import config
+import game
+import perfilador
+import video
+
+
+def _jugar(segundos, sucio, backend="software", tamano=(800, 600)):
+    config.RENDER_SUCIO = sucio
+    config.BACKEND_RENDER = backend
+    config.TAMANO_VENTANA = tamano
+    config.FPS_RENDER = 0
+    config.GRABAR_PARTIDAS = False
+
+    pygame.init()
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r", mod=0))
+    escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, unicode="\x1b", mod=0)
+    pygame.time.set_timer(escape, int(segundos * 1000), 1)
+
+    perfil = perfilador.Perfilador(True, max_cuadros=1_000_000)
+    game.game_loop("Normal", perfil)
+    video.cerrar()
+
+    # Sin el primer cuadro (dibuja la pantalla entera al entrar)
+    cuadros = list(perfil.traza)[1:]
+    total = dibujo = 0.0
+    for _, _, fases in cuadros:
+        for fase, _, duracion in fases:
+            if fase != "espera":
+                total += duracion
+            if fase in ("blit", "flip"):
+                dibujo += duracion
+    n = max(len(cuadros), 1)
+    return total / n * 1000, dibujo / n * 1000
+
+
+def correr(rapido=False):
+    segundos = 1.0 if rapido else 3.0
+    completo, dibujo_completo = _jugar(segundos, False)
+    sucio, dibujo_sucio = _jugar(segundos, True)
+    texturas, dibujo_texturas = _jugar(segundos, True, "sdl2")
+    texturas_1080, dibujo_texturas_1080 = _jugar(segundos, True, "sdl2", (1920, 1080))
+    pygame.quit()
+    return {
+        "render.cuadro_completo": comun.metrica(completo, "ms", mayor_es_mejor=False),
+        "render.dibujo_completo": comun.metrica(dibujo_completo, "ms", mayor_es_mejor=False),
+        "render.cuadro_sucio": comun.metrica(sucio, "ms", mayor_es_mejor=False),
+        "render.dibujo_sucio": comun.metrica(dibujo_sucio, "ms", mayor_es_mejor=False),
+        "render.cuadro_texturas": comun.metrica(texturas, "ms", mayor_es_mejor=False),
+        "render.dibujo_texturas": comun.metrica(dibujo_texturas, "ms", mayor_es_mejor=False),
+        "render.cuadro_texturas_1080": comun.metrica(texturas_1080, "ms", mayor_es_mejor=False),
+        "render.dibujo_texturas_1080": comun.metrica(dibujo_texturas_1080, "ms", mayor_es_mejor=False),
+    }
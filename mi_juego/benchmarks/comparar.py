@@ -0,0 +1,90 @@
+# comparar.py
+# --------------------------------------------------------------
+# Compara dos resultados de benchmarks (JSON de correr.py) y falla
+# (código de salida 1) si alguna métrica empeoró más que el umbral.
+#
+# "Empeorar" depende de la métrica: menos ticks/s o más ms.
+# Las métricas que están en un solo archivo se informan pero no
+# hacen fallar (por ejemplo al agregar un benchmark nuevo).
+#
+# Uso:
+#   python comparar.py base.json nuevo.json
+#   python comparar.py base.json nuevo.json --umbral 0.05 --umbral-metrica render.cuadro_sucio=0.3
+# --------------------------------------------------------------
+
+import argparse
+import json
+import sys
+
+# Cuánto puede empeorar una métrica (0.10 = 10 %) antes de fallar
+UMBRAL = 0.10
+
+
+def cargar(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)["metricas"]
+
+
+def cambio(base, nuevo):
+    """
+    Cuánto empeoró "nuevo" respecto de "base" (0.15 = 15 % peor;
+    negativo = mejoró).
+    """
+    if base["valor"] == 0:
+        return 0.0
+    relativo = (nuevo["valor"] - base["valor"]) / base["valor"]
+    return -relativo if base["mayor_es_mejor"] else relativo
+
+
+def comparar(base, nuevo, umbral=UMBRAL, umbrales=None):
+    """
+    Imprime la tabla de cambios y devuelve la lista de métricas que
+    empeoraron más que su umbral.
+    """
+    umbrales = umbrales or {}
+    peores = []
+
+    print(f"{'métrica':<28} {'base':>14} {'nuevo':>14} {'mejora':>8}")
+    for nombre in sorted(set(base) | set(nuevo)):
+        if nombre not in base or nombre not in nuevo:
+            estado = "solo en base" if nombre in base else "nueva"
+            print(f"{nombre:<28} {estado:>38}")
+            continue
+
+        b = base[nombre]
+        n = nuevo[nombre]
+        peor = cambio(b, n)
+        limite = umbrales.get(nombre, umbral)
+        marca = ""
+        if peor > limite:
+            marca = f"  EMPEORÓ (más de {limite:.0%})"
+            peores.append(nombre)
+        print(f"{nombre:<28} {b['valor']:>14,.3f} {n['valor']:>14,.3f} {-peor:>+8.1%} {b['unidad']}{marca}")
+
+    return peores
+
+
+def _umbral_metrica(texto):
+    nombre, _, valor = texto.partition("=")
+    return nombre, float(valor)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara resultados de benchmarks contra una base.")
+    parser.add_argument("base", help="resultados guardados como referencia")
+    parser.add_argument("nuevo", help="resultados a revisar")
+    parser.add_argument("--umbral", type=float, default=UMBRAL,
+                        help="empeoramiento máximo aceptado (0.10 = 10%%)")
+    parser.add_argument("--umbral-metrica", type=_umbral_metrica, action="append", default=[],
+                        metavar="NOMBRE=UMBRAL", help="umbral propio de una métrica (se puede repetir)")
+    args = parser.parse_args(argv)
+
+    peores = comparar(cargar(args.base), cargar(args.nuevo), args.umbral, dict(args.umbral_metrica))
+    if peores:
+        print(f"{len(peores)} métricas empeoraron: {', '.join(peores)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
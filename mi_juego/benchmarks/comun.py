@@ -0,0 +1,48 @@
+# comun.py
+# --------------------------------------------------------------
+# Lo que comparten todos los benchmarks:
+#  - deja importar los módulos del juego (carpeta juego_pong)
+#  - fuerza el video y el audio "dummy" de SDL (sin ventana ni sonido)
+#  - mide tiempos y arma cada métrica con el mismo formato
+#
+# Cada métrica es un diccionario:
+#   {"valor": 123.4, "unidad": "ticks/s", "mayor_es_mejor": True}
+# --------------------------------------------------------------
+
+import os
+import statistics
+import sys
+import time
+
+# Antes de que alguien importe pygame
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+CARPETA_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+CARPETA_BASE = os.path.dirname(CARPETA_BENCHMARKS)
+CARPETA_JUEGO = os.path.join(CARPETA_BASE, "juego_pong")
+
+if CARPETA_JUEGO not in sys.path:
+    sys.path.insert(0, CARPETA_JUEGO)
+
+
+def metrica(valor, unidad, mayor_es_mejor=True):
+    return {"valor": valor, "unidad": unidad, "mayor_es_mejor": mayor_es_mejor}
+
+
+def mejor_tiempo(funcion, repeticiones=3):
+    """
+    Segundos que tarda funcion() en la mejor de varias repeticiones.
+    Para medir rendimiento se toma la mejor: el ruido de la máquina
+    (otros programas, el disco) solo puede hacerla más lenta.
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def mediana(valores):
+    return statistics.median(valores)
@@ -0,0 +1,106 @@
+# correr.py
+# --------------------------------------------------------------
+# Corre los benchmarks del juego y guarda los resultados en JSON.
+#
+#   fisica    → bench_fisica.py   (ticks de física por segundo)
+#   render    → bench_render.py   (ms por cuadro de game_loop)
+#   ranking   → bench_ranking.py  (ranking.txt de 1k, 100k y 1M líneas)
+#   arranque  → bench_arranque.py (main.py en frío hasta el 1er cuadro)
+#
+# Con --base compara contra resultados guardados (ver comparar.py) y
+# termina con código 1 si algo empeoró más que el umbral: sirve para
+# frenar un cambio que hace el juego más lento antes de publicarlo.
+#
+# Uso (desde cualquier carpeta):
+#   python benchmarks/correr.py --salida base.json        → guardar la referencia
+#   python benchmarks/correr.py --base base.json          → medir y comparar
+#   python benchmarks/correr.py --solo fisica,ranking --rapido
+# --------------------------------------------------------------
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import comun
+
+import bench_arranque
+import bench_fisica
+import bench_ranking
+import bench_render
+import comparar
+
+SUITES = {
+    "fisica": bench_fisica,
+    "render": bench_render,
+    "ranking": bench_ranking,
+    "arranque": bench_arranque,
+}
+
+# Dónde se guarda la última corrida si no se indica --salida
+SALIDA = os.path.join(comun.CARPETA_BENCHMARKS, "ultimo.json")
+
+
+def correr(nombres, rapido=False):
+    metricas = {}
+    for nombre in nombres:
+        inicio = time.perf_counter()
+        metricas.update(SUITES[nombre].correr(rapido))
+        print(f"{nombre}: {time.perf_counter() - inicio:.1f} s", file=sys.stderr)
+
+    import pygame
+    return {
+        "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "rapido": rapido,
+        "metricas": metricas,
+    }
+
+
+def _lista(texto):
+    nombres = texto.split(",")
+    for nombre in nombres:
+        if nombre not in SUITES:
+            raise argparse.ArgumentTypeError(f"no existe el benchmark {nombre!r} ({', '.join(SUITES)})")
+    return nombres
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del juego.")
+    parser.add_argument("--solo", type=_lista, default=list(SUITES),
+                        help="benchmarks a correr, separados por coma: " + ",".join(SUITES))
+    parser.add_argument("--rapido", action="store_true", help="menos repeticiones y sin el ranking de 1M")
+    parser.add_argument("--salida", default=SALIDA, help="archivo JSON de resultados")
+    parser.add_argument("--base", help="compara contra estos resultados y falla si algo empeoró")
+    parser.add_argument("--umbral", type=float, default=comparar.UMBRAL,
+                        help="empeoramiento máximo aceptado (0.10 = 10%%)")
+    parser.add_argument("--umbral-metrica", type=comparar._umbral_metrica, action="append", default=[],
+                        metavar="NOMBRE=UMBRAL", help="umbral propio de una métrica (se puede repetir)")
+    args = parser.parse_args(argv)
+
+    resultados = correr(args.solo, args.rapido)
+
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print(f"Resultados en {args.salida}", file=sys.stderr)
+
+    if args.base:
+        peores = comparar.comparar(comparar.cargar(args.base), resultados["metricas"], args.umbral,
+                                   dict(args.umbral_metrica))
+        if peores:
+            print(f"{len(peores)} métricas empeoraron: {', '.join(peores)}", file=sys.stderr)
+            return 1
+    else:
+        for nombre, m in resultados["metricas"].items():
+            print(f"{nombre:<28} {m['valor']:>14,.3f} {m['unidad']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
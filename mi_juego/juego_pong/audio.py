@@ -0,0 +1,132 @@
+# audio.py
+# --------------------------------------------------------------
+# Manejo de canales de sonido.
+#
+# Todos los sonidos del juego se reproducen desde acá:
+#
+#  - Cada categoría (rebote, punto, final, música) tiene sus
+#    propios canales reservados del mixer. Si están todos
+#    ocupados, el sonido nuevo corta al que empezó hace más tiempo
+#    (o se descarta, según la categoría): así nunca suenan más
+#    voces que las reservadas, pase lo que pase en el partido.
+#
+#  - Si el mismo sonido se pide otra vez dentro de una ventana
+#    corta de tiempo (por ejemplo varios rebotes en ticks
+#    seguidos) se junta con el anterior en vez de sonar de nuevo.
+#
+#  - El silencio / volumen (config.SONIDO_ACTIVO y config.VOLUMEN)
+#    se aplica una sola vez a los canales, no sonido por sonido.
+# --------------------------------------------------------------
+
+import time
+
+import pygame
+
+import config
+
+# Categoría → (cantidad de canales, ventana en segundos para juntar
+#              repetidos, si un sonido nuevo puede cortar a uno viejo)
+CATEGORIAS = {
+    "musica": (1, 0.0, False),
+    "final": (1, 0.0, True),
+    "punto": (1, 0.10, True),
+    "rebote": (2, 0.06, True),
+}
+
+# categoría → lista de pygame.mixer.Channel (se arman al primer uso)
+canales = {}
+
+# (categoría, sonido) → último momento en que sonó
+ultimo = {}
+
+# canal → momento en que empezó a sonar (para saber cuál cortar)
+inicio_canal = {}
+
+# categoría → {"reproducidos": n, "juntados": n, "cortados": n, "descartados": n}
+estadisticas = {
+    categoria: {"reproducidos": 0, "juntados": 0, "cortados": 0, "descartados": 0}
+    for categoria in CATEGORIAS
+}
+
+
+# Reserva los canales de cada categoría (hace falta el mixer iniciado)
+def _preparar():
+    if canales or not pygame.mixer.get_init():
+        return bool(canales)
+
+    total = sum(cantidad for cantidad, _, _ in CATEGORIAS.values())
+    if pygame.mixer.get_num_channels() < total:
+        pygame.mixer.set_num_channels(total)
+
+    # Los canales reservados no los usa Sound.play() de otras partes
+    pygame.mixer.set_reserved(total)
+
+    numero = 0
+    for categoria, (cantidad, _, _) in CATEGORIAS.items():
+        canales[categoria] = [pygame.mixer.Channel(numero + i) for i in range(cantidad)]
+        numero += cantidad
+
+    aplicar_volumen()
+    return True
+
+
+def volumen_actual():
+    return config.VOLUMEN if config.SONIDO_ACTIVO else 0.0
+
+
+def aplicar_volumen():
+    """
+    Aplica config.SONIDO_ACTIVO / config.VOLUMEN a todos los canales.
+    Llamarla después de cambiar cualquiera de los dos.
+    """
+    vol = volumen_actual()
+    for lista in canales.values():
+        for canal in lista:
+            canal.set_volume(vol)
+
+
+def reproducir(categoria, sonido, loops=0):
+    """
+    Reproduce un sonido en los canales de su categoría.
+    Devuelve True si sonó, False si se juntó con uno reciente o no
+    había canal libre. sonido puede ser None (no hace nada).
+    """
+    if sonido is None or not _preparar():
+        return False
+
+    cuenta = estadisticas[categoria]
+    _, ventana, cortar = CATEGORIAS[categoria]
+
+    # Repetido dentro de la ventana: ya está sonando, no se vuelve a tocar
+    ahora = time.monotonic()
+    clave = (categoria, sonido)
+    if ventana > 0 and ahora - ultimo.get(clave, -ventana) < ventana:
+        cuenta["juntados"] += 1
+        return False
+
+    libres = [canal for canal in canales[categoria] if not canal.get_busy()]
+    if libres:
+        canal = libres[0]
+    elif cortar:
+        # Todas las voces ocupadas: se corta la más vieja
+        canal = min(canales[categoria], key=lambda c: inicio_canal.get(c, 0.0))
+        cuenta["cortados"] += 1
+    else:
+        cuenta["descartados"] += 1
+        return False
+
+    canal.play(sonido, loops)
+    canal.set_volume(volumen_actual())
+    inicio_canal[canal] = ahora
+    ultimo[clave] = ahora
+    cuenta["reproducidos"] += 1
+    return True
+
+
+def detener(categoria):
+    for canal in canales.get(categoria, []):
+        canal.stop()
+
+
+def sonando(categoria):
+    return any(canal.get_busy() for canal in canales.get(categoria, []))
@@ -0,0 +1,71 @@
+# cache_texto.py
+# --------------------------------------------------------------
+# Cache de textos ya dibujados (superficies de fuente.render()).
+#
+# Dibujar un texto con una fuente es caro y casi siempre se dibuja
+# lo mismo: el puntaje, las opciones del menú, el título final...
+# Esta cache guarda las superficies por (fuente, texto, color,
+# antialias) y devuelve la misma superficie mientras no cambie.
+#
+# Es LRU con tamaño máximo: si se llena, se descarta el texto
+# que hace más tiempo que no se usa.
+#
+# IMPORTANTE: la superficie devuelta es compartida. Si hay que
+# modificarla (por ejemplo set_alpha para un fundido), usar .copy().
+# --------------------------------------------------------------
+
+from collections import OrderedDict
+
+# Cantidad máxima de textos guardados
+TAMANO_MAXIMO = 256
+
+
+class CacheTexto:
+    def __init__(self, tamano_maximo=TAMANO_MAXIMO):
+        self.tamano_maximo = tamano_maximo
+        self.superficies = OrderedDict()
+
+        # Contadores
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def render(self, fuente, texto, color, antialias=True):
+        clave = (fuente, texto, tuple(color), antialias)
+
+        superficie = self.superficies.get(clave)
+        if superficie is not None:
+            # Marca como usado recién
+            self.superficies.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+
+        self.fallos += 1
+        superficie = fuente.render(texto, antialias, color)
+        self.superficies[clave] = superficie
+
+        # Si se pasó del tamaño, descarta el menos usado
+        if len(self.superficies) > self.tamano_maximo:
+            self.superficies.popitem(last=False)
+            self.desalojos += 1
+
+        return superficie
+
+    def limpiar(self):
+        self.superficies.clear()
+
+    def estadisticas(self):
+        return {
+            "textos": len(self.superficies),
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }
+
+
+# Cache compartida por el menú, el partido y las pantallas finales
+cache = CacheTexto()
+
+
+def render(fuente, texto, color, antialias=True):
+    return cache.render(fuente, texto, color, antialias)
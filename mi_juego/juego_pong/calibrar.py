@@ -0,0 +1,496 @@
+# calibrar.py
+# --------------------------------------------------------------
+# Calibración automática de las dificultades.
+#
+# Los valores de cada dificultad (ia_vel, velocidad_base y velocidad
+# de la raqueta del jugador) estaban elegidos a mano, sin saber qué
+# porcentaje de partidas gana el jugador con cada uno. Este programa
+# lo mide: juega partidas sin ventana entre la IA del juego y un
+# jugador simulado "humano" (tarda en reaccionar, calcula mal dónde
+# llega la pelota y suelta la tecla cuando está cerca), para cada
+# combinación de una grilla de valores.
+#
+# Las partidas se juegan por rondas. Cada ronda es un solo lote de
+# simulador_lote.py con todas las partidas de todos los candidatos
+# vivos (el jugador simulado también está vectorizado: JugadoresLote),
+# repartido entre los procesos del pool si hay más de uno. Después
+# de cada ronda se calcula, para cada candidato, el intervalo de
+# confianza de Wilson de su porcentaje de victorias:
+#   - si el intervalo queda entero lejos del objetivo, se descarta
+#   - si el intervalo queda entero cerca del objetivo, esa dificultad
+#     ya está: se elige el candidato y no se juegan más partidas
+#   - si muchas de sus partidas no terminan (MAX_SIN_TERMINAR), se
+#     descarta
+# Así casi todas las partidas se gastan en los candidatos dudosos.
+# Con la grilla por defecto son unos minutos con un solo proceso.
+#
+# Al final cada dificultad tiene que ganarse menos que la anterior
+# (ordenar) y quedar cerca de su objetivo: si no se puede con la
+# grilla probada no se escribe nada (salvo con --forzar) y el juego
+# sigue con la tabla que tenía. Por defecto se juega con las reglas
+# del juego (config.COLISION_CONTINUA e IA_PREDICTIVA).
+#
+# El resultado es una tabla JSON (config.DIFICULTADES_CALIBRADAS)
+# que el menú carga al iniciar (motor.cargar_dificultades).
+#
+# Ejemplos:
+#   python calibrar.py
+#   python calibrar.py --objetivos 0.7,0.45,0.2 --procesos 4
+#   python calibrar.py --ia-vel 3,5,7 --velocidad 5,6 --vel-jugador 5 --salida /tmp/prueba.json
+# --------------------------------------------------------------
+
+import argparse
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import config
+import motor
+import simulador_lote
+
+# Carpeta base del proyecto (mi_juego); igual que recursos.CARPETA_BASE
+# pero sin importar pygame
+CARPETA_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dificultades que se calibran y porcentaje de partidas que debería
+# ganar el jugador simulado en cada una
+NIVELES = ("Facil", "Normal", "Dificil")
+OBJETIVOS = (0.80, 0.50, 0.25)
+
+# Grilla por defecto
+IA_VEL = [3, 4, 5, 6, 7, 8]
+VELOCIDADES = [4, 5, 6, 7, 8, 9]
+VEL_JUGADOR = [4, 5, 6]
+
+# Jugador simulado por defecto: reacción (s), error (pixeles) y zona
+# muerta (pixeles)
+JUGADOR = (0.20, 60, 10)
+
+# Partidas que pueden llegar a --max-ticks sin ganador. Con valores
+# muy parejos la pelota va y viene para siempre: esa dificultad no
+# es "difícil", es una partida que no termina, y se descarta
+MAX_SIN_TERMINAR = 0.05
+
+# Partidas mínimas de cada ronda (ver calibrar)
+PARTIDAS_RONDA = 2048
+
+# z del intervalo de confianza (1.96 → 95 %)
+Z = 1.96
+
+
+# --------------------------------------------------------------
+# JUGADOR SIMULADO
+# --------------------------------------------------------------
+
+class JugadoresLote:
+    """
+    Maneja la raqueta izquierda de cada partida de un SimuladorLote
+    como lo haría una persona con W/S.
+
+    Cada "reaccion" segundos vuelve a mirar la pelota y calcula dónde
+    va a llegar, con un error que crece con la distancia: de lejos
+    calcula peor y se va corrigiendo a medida que la pelota se acerca,
+    pero nunca queda exacto.
+    Solo puede apretar arriba, abajo o nada, y suelta la tecla cuando
+    la raqueta está a menos de "zona" pixeles de donde quiere llegar.
+    Así pierde los puntos por lo mismo que una persona: la pelota
+    llega antes de que alcance a corregir.
+
+    error: desvío típico (pixeles) con la pelota encima; con la pelota
+    a un ancho de pantalla es el doble.
+    """
+
+    def __init__(self, sim, reaccion, error, zona, gen):
+        self.sim = sim
+        self.ticks_reaccion = round(reaccion * motor.TICKS_BASE)
+        self.error = error
+        self.zona = zona
+        self.gen = gen
+
+        self.dir_vista = np.zeros(sim.n)
+        self.espera = np.zeros(sim.n, dtype=np.int64)
+        self.objetivo = np.full(sim.n, simulador_lote.H / 2)
+
+    # Dirección de este tick de cada partida, como la del teclado (-1, 0 o 1)
+    def direccion(self):
+        sim = self.sim
+
+        # Un cambio de sentido (golpe o punto) tarda en notarse
+        cambio = sim.dir_x != self.dir_vista
+        self.dir_vista = sim.dir_x.copy()
+        self.espera = np.where(cambio, self.ticks_reaccion, self.espera)
+
+        listas = np.flatnonzero(self.espera <= 0)
+        self.espera -= 1
+        self.espera[listas] = self.ticks_reaccion
+        if len(listas):
+            self.objetivo[listas] = self.estimar(listas)
+
+        distancia = self.objetivo - (sim.raqueta_1_y + simulador_lote.RH / 2)
+        return np.where(distancia > self.zona, 1, np.where(distancia < -self.zona, -1, 0))
+
+    # Altura a la que quieren llegar los jugadores de esas partidas
+    def estimar(self, indices):
+        sim = self.sim
+        x = sim.pelota_x[indices]
+        dir_x = sim.dir_x[indices]
+
+        # Si la pelota se aleja, vuelve al centro a esperar
+        acerca = (dir_x > 0) == (simulador_lote.RAQUETA_1_X > x)
+        plano_x = np.where(dir_x > 0, simulador_lote.RAQUETA_1_X - simulador_lote.PA,
+                           simulador_lote.RAQUETA_1_X + simulador_lote.RA)
+
+        y = motor.predecir_y(x, sim.pelota_y[indices], dir_x, sim.dir_y[indices], plano_x, simulador_lote.PH)
+        desvio = self.error * (1 + np.abs(plano_x - x) / motor.VENTANA_HORI)
+
+        # Solo se sortea el error de los que miran una pelota que se acerca
+        ruido = np.zeros(len(indices))
+        ruido[acerca] = self.gen.standard_normal(int(np.count_nonzero(acerca)))
+        return np.where(acerca, y + simulador_lote.PH / 2 + ruido * desvio, simulador_lote.H / 2)
+
+
+def jugar_lote(tarea):
+    """
+    Juega un lote de partidas jugador simulado contra la IA, todas a
+    la vez, y devuelve el arreglo "ganador" del lote
+    (simulador_lote.GANA_JUGADOR, GANA_IA o SIN_GANADOR).
+    Corre en los procesos del pool.
+
+    tarea: (valores, reacción de la IA, error de la IA, semilla,
+            (reacción, error, zona) del jugador, (continua, ia predictiva),
+            máximo de ticks). valores tiene una fila (ia_vel,
+            velocidad_base, vel_jugador) por partida, y la reacción (en
+            ticks) y el error de la IA un valor por partida.
+    """
+    valores, reaccion_ia, error_ia, semilla, jugador, opciones, max_ticks = tarea
+    continua, ia_predictiva = opciones
+    reaccion, error, zona = jugador
+
+    sim = simulador_lote.SimuladorLote(
+        len(valores), valores[:, 0], valores[:, 1], semilla,
+        reaccion_ia if ia_predictiva else None, error_ia, valores[:, 2], continua,
+    )
+    # Sorteos propios, derivados de la semilla del lote
+    humano = JugadoresLote(sim, reaccion, error, zona, np.random.default_rng(sim.gen.integers(2 ** 63)))
+
+    # Si se llega a max_ticks queda SIN_GANADOR: cuenta como que no ganó
+    ticks = 0
+    while ticks < max_ticks and sim.activas().any():
+        sim.step(humano.direccion())
+        ticks += 1
+
+    return sim.ganador
+
+
+# --------------------------------------------------------------
+# CANDIDATOS
+# --------------------------------------------------------------
+
+def wilson(ganadas, partidas, z=Z):
+    """Intervalo de confianza de Wilson (mínimo, máximo) de ganadas / partidas."""
+    if partidas == 0:
+        return 0.0, 1.0
+    p = ganadas / partidas
+    z2 = z * z
+    divisor = 1 + z2 / partidas
+    centro = (p + z2 / (2 * partidas)) / divisor
+    margen = z * math.sqrt(p * (1 - p) / partidas + z2 / (4 * partidas * partidas)) / divisor
+    return max(0.0, centro - margen), min(1.0, centro + margen)
+
+
+class Candidato:
+    """Unos valores de la grilla para una dificultad y lo que se jugó con ellos."""
+
+    def __init__(self, valores):
+        self.valores = valores
+        self.ganadas = 0
+        self.sin_terminar = 0
+        self.partidas = 0
+        self.descartado = False
+
+    def victorias(self):
+        return self.ganadas / self.partidas if self.partidas else 0.0
+
+    def intervalo(self):
+        return wilson(self.ganadas, self.partidas)
+
+    # True si casi todas sus partidas terminan (ver MAX_SIN_TERMINAR)
+    def termina(self):
+        return self.partidas > 0 and self.sin_terminar <= MAX_SIN_TERMINAR * self.partidas
+
+
+class Nivel:
+    """Búsqueda de una dificultad: sus candidatos y el elegido (cuando termina)."""
+
+    def __init__(self, nombre, objetivo, grilla):
+        self.nombre = nombre
+        self.objetivo = objetivo
+        self.candidatos = [Candidato(valores) for valores in grilla]
+        self.elegido = None
+
+        # True si el elegido tiene el intervalo entero cerca del objetivo
+        self.aceptado = False
+
+    def vivos(self):
+        return [c for c in self.candidatos if not c.descartado]
+
+    def distancia(self, candidato):
+        return abs(candidato.victorias() - self.objetivo)
+
+    def revisar(self, tolerancia, max_partidas):
+        """Descarta candidatos y, si ya se puede, elige uno (True = terminó)."""
+        minimo = self.objetivo - tolerancia
+        maximo = self.objetivo + tolerancia
+
+        aceptados = []
+        for candidato in self.vivos():
+            bajo, alto = candidato.intervalo()
+            if alto < minimo or bajo > maximo:
+                candidato.descartado = True
+            elif wilson(candidato.sin_terminar, candidato.partidas)[0] > MAX_SIN_TERMINAR:
+                candidato.descartado = True
+            elif bajo >= minimo and alto <= maximo:
+                aceptados.append(candidato)
+
+        if aceptados:
+            self.elegido = min(aceptados, key=self.distancia)
+            self.aceptado = True
+        elif not self.vivos():
+            # Ninguno llega al objetivo: el que más se acerca, si puede
+            # entre los que terminan sus partidas
+            terminan = [c for c in self.candidatos if c.termina()]
+            self.elegido = min(terminan or self.candidatos, key=self.distancia)
+        elif all(c.partidas >= max_partidas for c in self.vivos()):
+            self.elegido = min(self.vivos(), key=self.distancia)
+        return self.elegido is not None
+
+
+# --------------------------------------------------------------
+# BÚSQUEDA
+# --------------------------------------------------------------
+
+def calibrar(niveles, args, pool):
+    """
+    Juega rondas hasta que todos los niveles eligen un candidato. Cada
+    ronda es un lote de simulador_lote.py (uno por proceso) con las
+    partidas de todos los candidatos vivos, que avanzan juntas tick a
+    tick; una ronda dura lo que la partida más larga, así que cuando
+    quedan pocos candidatos se juegan más partidas de cada uno
+    (args.partidas_ronda repartidas entre los vivos, y al menos args.lote).
+    """
+    jugador = (args.reaccion, args.error, args.zona)
+    opciones = (args.continua, args.predictiva)
+    partidas = 0
+
+    for ronda in itertools.count():
+        pendientes = [nivel for nivel in niveles if nivel.elegido is None]
+        if not pendientes:
+            return partidas
+
+        # Una fila por partida: (nivel, candidato)
+        vivos = [(nivel, candidato) for nivel in pendientes for candidato in nivel.vivos()]
+        lote = max(args.lote, math.ceil(args.partidas_ronda / len(vivos)))
+        filas = [
+            (nivel, candidato)
+            for nivel, candidato in vivos
+            for _ in range(max(1, min(lote, args.max_partidas - candidato.partidas)))
+        ]
+        valores = np.array([candidato.valores for _, candidato in filas], dtype=float)
+        perfiles = [motor.PERFILES_IA.get(nivel.nombre, motor.PERFILES_IA["Dificil"]) for nivel, _ in filas]
+        reaccion_ia = np.array([round(segundos * motor.TICKS_BASE) for segundos, _ in perfiles])
+        error_ia = np.array([error for _, error in perfiles], dtype=float)
+
+        partes = np.array_split(np.arange(len(filas)), max(1, args.procesos))
+        tareas = [
+            (valores[p], reaccion_ia[p], error_ia[p], (args.semilla, ronda, numero), jugador, opciones,
+             args.max_ticks)
+            for numero, p in enumerate(partes)
+            if len(p)
+        ]
+
+        inicio = time.perf_counter()
+        if pool is not None:
+            resultados = pool.map(jugar_lote, tareas)
+        else:
+            resultados = map(jugar_lote, tareas)
+        ganadores = np.concatenate(list(resultados))
+        for (_, candidato), ganador in zip(filas, ganadores):
+            candidato.partidas += 1
+            candidato.ganadas += int(ganador == simulador_lote.GANA_JUGADOR)
+            candidato.sin_terminar += int(ganador == simulador_lote.SIN_GANADOR)
+        duracion = time.perf_counter() - inicio
+        partidas += len(filas)
+
+        for nivel in pendientes:
+            nivel.revisar(args.tolerancia, args.max_partidas)
+
+        resumen = ", ".join(f"{nivel.nombre} {len(nivel.vivos())}" for nivel in pendientes)
+        print(f"ronda {ronda + 1}: {len(filas)} partidas en {duracion:.1f} s "
+              f"({len(filas) / duracion if duracion > 0 else 0:,.0f}/s) — candidatos vivos: {resumen}",
+              file=sys.stderr)
+
+
+def ordenar(niveles):
+    """
+    Hace que cada dificultad se gane menos que la anterior: el
+    porcentaje de victorias del elegido tiene que ser estrictamente
+    menor que el de la dificultad anterior (dos niveles con el mismo
+    porcentaje, por ejemplo los dos en 0 %, no sirven), y el elegido
+    tiene que terminar sus partidas. Si no cumple se cambia por el
+    candidato que cumpla y esté más cerca del objetivo.
+    Devuelve los nombres de los niveles que no se pudieron ordenar.
+    """
+    fallidos = []
+    techo = math.inf
+    for nivel in niveles:
+        if not nivel.elegido.termina() or nivel.elegido.victorias() >= techo:
+            posibles = [c for c in nivel.candidatos if c.termina() and c.victorias() < techo]
+            if not posibles:
+                fallidos.append(nivel.nombre)
+                continue
+            nivel.elegido = min(posibles, key=nivel.distancia)
+            nivel.aceptado = False
+        techo = nivel.elegido.victorias()
+    return fallidos
+
+
+def tabla(niveles, args):
+    """Diccionario que se guarda como JSON (ver motor.cargar_dificultades)."""
+    dificultades = {}
+    for nivel in niveles:
+        c = nivel.elegido
+        ia_vel, velocidad_base, vel_jugador = c.valores
+        bajo, alto = c.intervalo()
+        dificultades[nivel.nombre] = {
+            "ia_vel": ia_vel,
+            "velocidad_base": velocidad_base,
+            "vel_jugador": vel_jugador,
+            "objetivo": nivel.objetivo,
+            "victorias": round(c.victorias(), 4),
+            "intervalo": [round(bajo, 4), round(alto, 4)],
+            "partidas": c.partidas,
+            "sin_terminar": c.sin_terminar,
+            "aceptado": nivel.aceptado,
+        }
+
+    return {
+        "jugador": {"reaccion": args.reaccion, "error": args.error, "zona": args.zona},
+        "opciones": {"ticks_por_segundo": motor.TICKS_BASE, "continua": args.continua,
+                     "ia_predictiva": args.predictiva},
+        "dificultades": dificultades,
+    }
+
+
+def guardar(datos, ruta):
+    # Temporal + reemplazo: el juego nunca ve una tabla a medio escribir
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(temporal, ruta)
+
+
+def _lista(texto):
+    return [float(x) if "." in x else int(x) for x in texto.split(",")]
+
+
+def main(argv=None):
+    reaccion, error, zona = JUGADOR
+
+    parser = argparse.ArgumentParser(description="Calibra las dificultades contra un jugador simulado.")
+    parser.add_argument("--ia-vel", type=_lista, default=IA_VEL, help="velocidades de la IA a probar")
+    parser.add_argument("--velocidad", type=_lista, default=VELOCIDADES,
+                        help="velocidades de pelota (velocidad_base) a probar")
+    parser.add_argument("--vel-jugador", type=_lista, default=VEL_JUGADOR,
+                        help="velocidades de la raqueta del jugador a probar")
+    parser.add_argument("--objetivos", type=_lista, default=list(OBJETIVOS),
+                        help="victorias buscadas del jugador en Facil,Normal,Dificil")
+    parser.add_argument("--tolerancia", type=float, default=0.08,
+                        help="distancia aceptada al objetivo (intervalo entero dentro)")
+    parser.add_argument("--lote", type=int, default=8, help="partidas mínimas por candidato en cada ronda")
+    parser.add_argument("--partidas-ronda", type=int, default=PARTIDAS_RONDA,
+                        help="partidas por ronda, repartidas entre los candidatos vivos")
+    parser.add_argument("--max-partidas", type=int, default=256,
+                        help="partidas máximas por candidato")
+    parser.add_argument("--reaccion", type=float, default=reaccion, help="reacción del jugador (segundos)")
+    parser.add_argument("--error", type=float, default=error, help="error de puntería del jugador (pixeles)")
+    parser.add_argument("--zona", type=float, default=zona, help="zona muerta del jugador (pixeles)")
+    # Por defecto las reglas con que juega el juego (config)
+    parser.add_argument("--continua", dest="continua", action="store_true", help="con colisión continua")
+    parser.add_argument("--discreta", dest="continua", action="store_false", help="sin colisión continua")
+    parser.add_argument("--predictiva", dest="predictiva", action="store_true", help="IA predictiva")
+    parser.add_argument("--clasica", dest="predictiva", action="store_false", help="IA que persigue la pelota")
+    parser.set_defaults(continua=config.COLISION_CONTINUA, predictiva=config.IA_PREDICTIVA)
+    parser.add_argument("--forzar", action="store_true",
+                        help="escribe la tabla aunque alguna dificultad no llegue a su objetivo "
+                             "(el juego no carga esas dificultades)")
+    parser.add_argument("--max-ticks", type=int, default=50_000, help="ticks máximos por partida")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(),
+                        help="procesos en paralelo (1 = sin pool)")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla de la primera partida")
+    parser.add_argument("--salida", default=os.path.join(CARPETA_BASE, config.DIFICULTADES_CALIBRADAS),
+                        help="archivo JSON donde se guarda la tabla")
+    args = parser.parse_args(argv)
+
+    if len(args.objetivos) != len(NIVELES):
+        parser.error(f"--objetivos necesita {len(NIVELES)} valores ({','.join(NIVELES)})")
+    if any(facil <= dificil for facil, dificil in zip(args.objetivos, args.objetivos[1:])):
+        parser.error("--objetivos tienen que ir de mayor a menor, sin repetir (Facil gana más que Dificil)")
+
+    grilla = list(itertools.product(args.ia_vel, args.velocidad, args.vel_jugador))
+    niveles = [Nivel(nombre, objetivo, grilla) for nombre, objetivo in zip(NIVELES, args.objetivos)]
+
+    pool = None
+    inicio = time.perf_counter()
+    try:
+        if args.procesos > 1:
+            pool = ProcessPoolExecutor(max_workers=args.procesos)
+        partidas = calibrar(niveles, args, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    duracion = time.perf_counter() - inicio
+    fallidos = ordenar(niveles)
+
+    print(f"{'nivel':<8} {'ia_vel':>6} {'pelota':>6} {'jugador':>7} {'objetivo':>8} "
+          f"{'gana':>6} {'intervalo':>15} {'partidas':>8}")
+    for nivel in niveles:
+        c = nivel.elegido
+        bajo, alto = c.intervalo()
+        print(f"{nivel.nombre:<8} {c.valores[0]:>6} {c.valores[1]:>6} {c.valores[2]:>7} "
+              f"{nivel.objetivo:>8.0%} {c.victorias():>6.1%} {f'{bajo:.0%} – {alto:.0%}':>15} {c.partidas:>8}")
+
+    lejos = [nivel.nombre for nivel in niveles if not nivel.aceptado]
+    for nivel in niveles:
+        if not nivel.aceptado:
+            print(f"{nivel.nombre}: ningún candidato de la grilla llega con seguridad al "
+                  f"{nivel.objetivo:.0%}; el más cercano es el de la tabla (probar con otra grilla)",
+                  file=sys.stderr)
+
+    if fallidos:
+        print(f"{', '.join(fallidos)}: ningún candidato de la grilla termina sus partidas y se gana "
+              f"menos que la dificultad anterior; no se escribe {args.salida} (probar con otra grilla)",
+              file=sys.stderr)
+        return 1
+
+    # Una tabla con dificultades lejos de su objetivo no reemplaza a la
+    # que usa el juego salvo que se pida (y el juego no carga esas)
+    if lejos and not args.forzar:
+        print(f"no se escribe {args.salida}: {', '.join(lejos)} no llega a su objetivo "
+              f"(--forzar la escribe igual)", file=sys.stderr)
+        return 1
+
+    guardar(tabla(niveles, args), args.salida)
+    print(f"{partidas} partidas en {duracion:.1f} s con {args.procesos} procesos → {args.salida}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,3 +21,148 @@ SONIDO_ACTIVO = True
 # El menú y el juego usan esta variable para ajustar el volumen
 # al cambiar el audio o silenciarlo.
 VOLUMEN = 1.0  # rango permitido: 0.0 a 1.0
+
+
+# TICKS_FISICA:
+# Cuántas veces por segundo se actualiza la física del partido.
+# Es independiente de los cuadros dibujados: bajar este valor ahorra CPU
+# en máquinas lentas sin cambiar la velocidad del juego
+# (el motor escala los movimientos, ver motor.TICKS_BASE).
+TICKS_FISICA = 60
+
+
+# FPS_RENDER:
+# Tope de cuadros por segundo del dibujado durante el partido.
+# Entre dos ticks de física se dibuja una posición interpolada,
+# así que se ve fluido aunque se dibuje más seguido que la física.
+# - 0 → sin tope (dibuja tan rápido como pueda)
+FPS_RENDER = 120
+
+
+# RENDER_SUCIO:
+# Si es True, durante el partido solo se vuelven a dibujar y enviar a la
+# pantalla las zonas que cambiaron (pelota, raquetas y puntaje).
+# Si es False, se dibuja el fondo completo en cada cuadro.
+RENDER_SUCIO = True
+
+
+# BACKEND_RENDER:
+# Cómo se llevan los cuadros a la pantalla (ver video.py).
+# - "software" → ventana fija de 800x600 dibujada con blits (el de siempre)
+# - "sdl2"     → texturas de SDL2: la ventana se puede agrandar o poner en
+#                pantalla completa y el juego (800x600) se escala solo.
+#                Usa la placa de video si hay; si no, el renderer por
+#                software de SDL. También con "python main.py --sdl2".
+BACKEND_RENDER = "software"
+
+# Tamaño inicial de la ventana con el backend "sdl2"
+TAMANO_VENTANA = (800, 600)
+
+# Pantalla completa (a la resolución del escritorio) con el backend "sdl2"
+PANTALLA_COMPLETA = False
+
+
+# COLISION_CONTINUA:
+# Si es True, la pelota calcula en qué momento exacto del tick toca
+# una pared o una raqueta (colisión "barrida"), así no puede atravesar
+# una raqueta aunque vaya muy rápido o TICKS_FISICA sea bajo.
+# Si es False (por defecto), se usan las reglas originales: mover y
+# después revisar. Cambia cómo rebota la pelota: es opcional.
+COLISION_CONTINUA = False
+
+
+# IA_PREDICTIVA:
+# Si es True, la raqueta de la computadora calcula dónde va a llegar la
+# pelota y va hacia ahí; la dificultad define cuánto tarda en reaccionar
+# y cuánto se equivoca (motor.PERFILES_IA).
+# Si es False (por defecto), persigue la pelota como antes. Cambia qué
+# tan difícil es cada dificultad: es opcional.
+IA_PREDICTIVA = False
+
+
+# PERFILADOR:
+# Si es True, durante el partido se mide cuánto tarda cada parte del
+# cuadro (eventos, física, textos, dibujo, pantalla y espera) y al salir
+# del partido se guarda en PERFILADOR_ARCHIVO.
+# Con F3 se muestra / oculta la tabla en pantalla (y se prende la
+# medición si estaba apagada); con F4 se guarda en el momento.
+PERFILADOR = False
+
+# Archivo donde se guarda la medición (relativo a la carpeta mi_juego).
+# .json → formato Chrome trace (chrome://tracing, ui.perfetto.dev)
+# .csv  → una fila por fase y cuadro
+PERFILADOR_ARCHIVO = "perfil_cuadros.json"
+
+
+# PRESUPUESTO_MEMORIA:
+# Si es True, durante el partido se mide cuánta memoria se reserva en
+# cada cuadro y cuántas veces corre el recolector de basura (y cuánto
+# tarda). Al salir del partido se imprime un reporte con las líneas del
+# código que más memoria reservaron. Hace el juego bastante más lento:
+# es solo para buscar problemas.
+PRESUPUESTO_MEMORIA = False
+
+
+# SONDA_LATENCIA:
+# Si es True, se mide cuánto tarda en verse en pantalla cada cambio de
+# las teclas W/S (desde que el juego lee la tecla hasta que termina de
+# mostrar el primer cuadro que la usó). Al salir del partido se imprime
+# la distribución (p50 / p95 / p99 / máximo).
+SONDA_LATENCIA = False
+
+
+# GRABAR_PARTIDAS:
+# Si es True, cada partida se guarda (semilla + un byte por tick) en
+# CARPETA_REPETICIONES al terminar o al salir con ESC. Se reproducen con
+# "python repeticion.py <archivo o carpeta>".
+GRABAR_PARTIDAS = True
+
+# Carpeta de las partidas grabadas (relativa a la carpeta mi_juego)
+CARPETA_REPETICIONES = "repeticiones"
+
+
+# DIFICULTADES_CALIBRADAS:
+# Tabla de dificultades medida con calibrar.py (relativa a la carpeta
+# mi_juego): qué velocidad de IA, de pelota y de raqueta usa cada
+# dificultad para que el jugador gane más o menos seguido.
+# Si el archivo existe, el menú la carga al iniciar; si no, se usan los
+# valores de fábrica (motor.DIFICULTADES). "" → no cargarla nunca.
+DIFICULTADES_CALIBRADAS = "dificultades.json"
+
+
+# FPS_MENU:
+# Tope de cuadros por segundo en las pantallas del menú.
+# Los menús solo se redibujan cuando cambia algo (una tecla, la
+# ventana que se destapa...); este valor limita cuántas veces por
+# segundo puede pasar eso. Con el menú quieto el juego queda dormido
+# esperando eventos.
+FPS_MENU = 30
+
+
+# RANKING_BACKEND:
+# Dónde se guardan los puntajes.
+# - "texto"  → ranking.txt, una línea "nombre:puntos" por partida (el de siempre)
+# - "sqlite" → ranking.db, indexado: agregar y pedir los mejores no
+#              recorre todo el archivo. La primera vez copia ranking.txt.
+RANKING_BACKEND = "texto"
+
+
+# RANKING_ESCRITURA_DIFERIDA:
+# Si es True, guardar un puntaje no frena el juego: se deja en una cola
+# y un hilo aparte lo escribe (juntando varios si llegan seguidos).
+# Al cerrar el juego se escribe todo lo pendiente.
+RANKING_ESCRITURA_DIFERIDA = True
+
+
+# RANKING_FSYNC:
+# Si es True, después de cada escritura del ranking se le pide al sistema
+# que lo grabe de verdad en el disco (os.fsync). Es más lento pero un
+# corte de luz no pierde puntajes ya guardados.
+RANKING_FSYNC = True
+
+
+# USAR_CACHE_RECURSOS:
+# Si es True y existe recursos.cache (creada con hornear_recursos.py),
+# las imágenes y sonidos se toman de ahí, ya escalados y decodificados.
+# Si la cache está vieja o no existe se usan los archivos originales.
+USAR_CACHE_RECURSOS = True
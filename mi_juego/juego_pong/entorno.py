@@ -0,0 +1,286 @@
+# entorno.py
+# --------------------------------------------------------------
+# Entorno de entrenamiento (estilo Gym) para IAs de la raqueta.
+#
+# Para entrenar una IA mejor que Raqueta.mover_ia hacen falta
+# millones de pasos de juego. Este archivo envuelve las reglas de
+# motor.py en la interfaz de siempre de estos entornos:
+#
+#   obs = entorno.reset()
+#   obs, recompensa, hecho, info = entorno.step(accion)
+#
+# El agente maneja la raqueta izquierda (la del jugador) y enfrente
+# juega la IA del juego con los valores de la dificultad elegida.
+# Sin ventana ni sonido: no se importa pygame.
+#
+# Por defecto los dos entornos juegan como el juego: los valores
+# de config.COLISION_CONTINUA y config.IA_PREDICTIVA al crearlos. Un
+# agente entrenado con otras reglas aprende otra física y otro rival
+# que los del juego.
+#
+#  - Entorno: una partida, con motor.py (mismo código que el juego).
+#  - EntornoLote: N partidas a la vez con simulador_lote.py; cada
+#    step avanza todas con operaciones de NumPy, sin loops de Python
+#    por partida. Las partidas que terminan vuelven a empezar solas.
+#
+# Acción: -1 (arriba), 0 (quieta) o 1 (abajo), como el teclado;
+# cualquier otra es un ValueError.
+# Observación: 6 números en float32, ver observar().
+# Recompensa: +1 cuando el agente hace un punto, -1 cuando lo recibe.
+# Con la misma semilla se repiten exactamente los mismos episodios.
+#
+# Uso (mide pasos por segundo con acciones al azar):
+#   python entorno.py
+#   python entorno.py --n 4096 --pasos 2000 --dificultad Dificil
+# --------------------------------------------------------------
+
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+
+import config
+import motor
+import simulador_lote
+
+# Tamaño de la observación
+OBSERVACION = 6
+
+# Escala de las velocidades en la observación
+VEL_MAXIMA = 10.0
+
+# Ticks máximos de un episodio (después se corta: info "truncado")
+MAX_TICKS = 60 * motor.TICKS_BASE * 5
+
+# Acciones posibles: arriba, quieta, abajo
+ACCIONES = (-1, 0, 1)
+
+
+def observar(pelota_x, pelota_y, dir_x, dir_y, raqueta_y, rival_y):
+    """
+    Observación del agente: pelota x / y, velocidad x / y, altura de
+    la raqueta propia y de la rival, todo llevado a más o menos [-1, 1].
+    Funciona con números (una partida) o con arreglos (N partidas).
+    """
+    return np.stack((
+        np.asarray(pelota_x) / motor.VENTANA_HORI,
+        np.asarray(pelota_y) / motor.VENTANA_VERTI,
+        np.asarray(dir_x) / VEL_MAXIMA,
+        np.asarray(dir_y) / VEL_MAXIMA,
+        np.asarray(raqueta_y) / motor.VENTANA_VERTI,
+        np.asarray(rival_y) / motor.VENTANA_VERTI,
+    ), axis=-1).astype(np.float32)
+
+
+# (continua, ia_predictiva) a usar: None → lo que diga config.py ahora
+def opciones(continua, ia_predictiva):
+    if continua is None:
+        continua = config.COLISION_CONTINUA
+    if ia_predictiva is None:
+        ia_predictiva = config.IA_PREDICTIVA
+    return continua, ia_predictiva
+
+
+# --------------------------------------------------------------
+# UNA PARTIDA
+# --------------------------------------------------------------
+
+class Entorno:
+    """
+    Una partida de motor.py contra la IA de la dificultad indicada.
+
+    semilla: de ahí salen las semillas de cada episodio; reset(semilla)
+    vuelve a empezar la secuencia.
+    continua / ia_predictiva: las mismas opciones que el juego; None
+    toma las de config.py en el momento de crear el entorno.
+    """
+
+    def __init__(self, dificultad="Normal", semilla=None, max_ticks=MAX_TICKS,
+                 continua=None, ia_predictiva=None):
+        self.dificultad = dificultad
+        self.max_ticks = max_ticks
+        self.continua, self.ia_predictiva = opciones(continua, ia_predictiva)
+        self.semillas = random.Random(semilla)
+
+        self.estado = None
+        self.entradas = motor.Entradas(0, None)
+        self.eventos = []
+
+    def reset(self, semilla=None):
+        if semilla is not None:
+            self.semillas.seed(semilla)
+        self.estado = motor.nuevo_estado(self.dificultad, self.semillas.getrandbits(63), motor.TICKS_BASE,
+                                         self.continua, self.ia_predictiva)
+        return self.observacion()
+
+    def observacion(self):
+        e = self.estado
+        return observar(e.pelota.x, e.pelota.y, e.pelota.dir_x, e.pelota.dir_y, e.raqueta_1.y, e.raqueta_2.y)
+
+    def step(self, accion):
+        if accion not in ACCIONES:
+            raise ValueError(f"acción inválida: {accion!r} (tiene que ser -1, 0 o 1)")
+        estado = self.estado
+        self.entradas.dir_1 = int(accion)
+        motor.step(estado, self.entradas, self.eventos)
+
+        recompensa = 0.0
+        for tipo, lado in self.eventos:
+            if tipo == motor.EV_PUNTO:
+                recompensa += 1.0 if lado == motor.JUGADOR else -1.0
+
+        truncado = estado.ganador is None and estado.tick >= self.max_ticks
+        hecho = estado.ganador is not None or truncado
+        info = {"ganador": estado.ganador, "truncado": truncado, "ticks": estado.tick}
+        return self.observacion(), recompensa, hecho, info
+
+
+# --------------------------------------------------------------
+# N PARTIDAS A LA VEZ
+# --------------------------------------------------------------
+
+class EntornoLote:
+    """
+    N partidas de simulador_lote.py avanzadas juntas.
+
+    step(acciones) recibe un arreglo de N acciones y devuelve arreglos
+    de N observaciones, recompensas y "hecho". Cuando una partida
+    termina, la observación devuelta ya es la de la partida nueva
+    (como los entornos vectorizados de Gym); el resultado de la que
+    terminó queda en info["ganador"].
+
+    continua / ia_predictiva: como en Entorno.
+    """
+
+    def __init__(self, n, dificultad="Normal", semilla=None, max_ticks=MAX_TICKS,
+                 continua=None, ia_predictiva=None):
+        self.n = n
+        self.dificultad = dificultad
+        self.max_ticks = max_ticks
+        self.continua, self.ia_predictiva = opciones(continua, ia_predictiva)
+        self.semillas = random.Random(semilla)
+        self.sim = None
+
+    def reset(self, semilla=None):
+        if semilla is not None:
+            self.semillas.seed(semilla)
+
+        ia_vel, velocidad_base, vel_jugador = motor.parametros(self.dificultad)
+        reaccion, error = None, 0.0
+        if self.ia_predictiva:
+            segundos, error = motor.PERFILES_IA.get(self.dificultad, motor.PERFILES_IA["Dificil"])
+            reaccion = round(segundos * motor.TICKS_BASE)
+
+        self.sim = simulador_lote.SimuladorLote(
+            self.n, ia_vel, velocidad_base, self.semillas.getrandbits(63),
+            reaccion, error, vel_jugador, self.continua,
+        )
+        return self.observacion()
+
+    def observacion(self):
+        s = self.sim
+        return observar(s.pelota_x, s.pelota_y, s.dir_x, s.dir_y, s.raqueta_1_y, s.raqueta_2_y)
+
+    def step(self, acciones):
+        sim = self.sim
+        puntos = sim.puntuacion.copy()
+        puntos_ia = sim.puntuacion_ia.copy()
+
+        acciones = np.asarray(acciones)
+        if acciones.shape != (self.n,) or not np.isin(acciones, ACCIONES).all():
+            raise ValueError(f"se esperaban {self.n} acciones entre -1, 0 y 1")
+        sim.step(acciones)
+
+        recompensa = ((sim.puntuacion - puntos) - (sim.puntuacion_ia - puntos_ia)).astype(np.float32)
+
+        ganador = sim.ganador.copy()
+        truncado = (ganador == simulador_lote.SIN_GANADOR) & (sim.ticks >= self.max_ticks)
+        hecho = (ganador != simulador_lote.SIN_GANADOR) | truncado
+        if hecho.any():
+            self._reiniciar(hecho)
+
+        info = {"ganador": ganador, "truncado": truncado}
+        return self.observacion(), recompensa, hecho, info
+
+    # Vuelve a empezar las partidas marcadas como una partida nueva:
+    # marcador, pelota, raquetas, estadísticas y la IA predictiva
+    # (como el motor.IAPredictiva nuevo de Entorno.reset)
+    def _reiniciar(self, mascara):
+        sim = self.sim
+        sim.reiniciar_partida(mascara)
+        sim.raqueta_1_y[mascara] = simulador_lote.RAQUETA_Y0
+        sim.raqueta_2_y[mascara] = simulador_lote.RAQUETA_Y0
+        sim.ticks[mascara] = 0
+        sim.toques[mascara] = 0
+
+        if sim.predictiva:
+            sim.ia_objetivo[mascara] = simulador_lote.H / 2
+            sim.ia_pendiente[mascara] = False
+            sim.ia_espera[mascara] = 0
+            sim.ia_dir_vista[mascara] = 0
+
+
+# --------------------------------------------------------------
+# MEDICIÓN
+# --------------------------------------------------------------
+
+def medir(entorno, pasos, semilla=0):
+    """
+    Juega "pasos" llamadas a step con acciones al azar y devuelve
+    (pasos de partida por segundo, episodios terminados).
+    En EntornoLote cada llamada cuenta como N pasos.
+    """
+    gen = np.random.default_rng(semilla)
+    n = entorno.n if isinstance(entorno, EntornoLote) else None
+    entorno.reset(semilla)
+
+    episodios = 0
+    inicio = time.perf_counter()
+    if n is None:
+        for accion in gen.integers(-1, 2, size=pasos):
+            _, _, hecho, _ = entorno.step(accion)
+            if hecho:
+                episodios += 1
+                entorno.reset()
+    else:
+        for _ in range(pasos):
+            _, _, hecho, _ = entorno.step(gen.integers(-1, 2, size=n))
+            episodios += int(hecho.sum())
+    duracion = time.perf_counter() - inicio
+
+    total = pasos * (n or 1)
+    return (total / duracion if duracion > 0 else 0.0), episodios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide los pasos por segundo de los entornos de entrenamiento.")
+    parser.add_argument("--dificultad", default="Normal", choices=sorted(motor.DIFICULTADES))
+    parser.add_argument("--n", type=int, default=1024, help="partidas de EntornoLote")
+    parser.add_argument("--pasos", type=int, default=1000, help="llamadas a step de EntornoLote")
+    parser.add_argument("--pasos-uno", type=int, default=20_000, help="llamadas a step de Entorno")
+    # Por defecto las reglas del juego (config)
+    parser.add_argument("--continua", dest="continua", action="store_true", help="con colisión continua")
+    parser.add_argument("--discreta", dest="continua", action="store_false", help="sin colisión continua")
+    parser.add_argument("--predictiva", dest="ia_predictiva", action="store_true", help="IA rival predictiva")
+    parser.add_argument("--clasica", dest="ia_predictiva", action="store_false",
+                        help="IA rival que persigue la pelota")
+    parser.set_defaults(continua=None, ia_predictiva=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    reglas = {"continua": args.continua, "ia_predictiva": args.ia_predictiva}
+
+    uno = Entorno(args.dificultad, **reglas)
+    por_segundo, episodios = medir(uno, args.pasos_uno, args.semilla)
+    print(f"Entorno:          {por_segundo:>12,.0f} pasos/s ({episodios} episodios)")
+
+    lote = EntornoLote(args.n, args.dificultad, **reglas)
+    por_segundo, episodios = medir(lote, args.pasos, args.semilla)
+    print(f"EntornoLote x{args.n:<5} {por_segundo:>12,.0f} pasos/s ({episodios} episodios)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+# fusionar_ranking.py
+# --------------------------------------------------------------
+# Herramienta de línea de comandos para juntar los ranking.txt
+# de muchas máquinas en un solo ranking global.
+#
+# Lee los archivos de a una línea (nunca los carga enteros) e
+# ignora las líneas corruptas igual que ranking.cargar_ranking().
+#
+# Dos modos:
+#   --top K          → solo los K mejores, con un heap de tamaño K
+#   --salida ARCHIVO → ranking completo ordenado, con ordenamiento
+#                      externo: se ordenan tandas de --memoria líneas,
+#                      se guardan en archivos temporales y se mezclan
+#                      (merge) de a MAX_TANDAS por vez, en varias pasadas
+#                      si hace falta, hasta quedar en un solo archivo.
+#
+# Ejemplos:
+#   python fusionar_ranking.py maquina1.txt maquina2.txt --top 20
+#   python fusionar_ranking.py rankings/*.txt --salida global.txt
+# --------------------------------------------------------------
+
+import argparse
+import contextlib
+import heapq
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+import ranking
+
+# Tandas que se mezclan juntas (archivos abiertos a la vez): con más
+# tandas se mezcla en varias pasadas
+MAX_TANDAS = 64
+
+
+class Contador:
+    """Cuenta líneas leídas y descartadas para el reporte final."""
+
+    def __init__(self):
+        self.lineas = 0
+        self.corruptas = 0
+
+
+def leer_puntajes(rutas, contador):
+    """
+    Recorre todos los archivos y va devolviendo (puntos, orden, nombre).
+    "orden" numera los puntajes en el orden en que aparecen, para que a
+    igual puntaje quede primero el más viejo (como en cargar_ranking).
+    """
+    orden = itertools.count()
+    for ruta in rutas:
+        with open(ruta, "r", encoding="utf-8", errors="replace") as f:
+            for linea in f:
+                contador.lineas += 1
+                dato = ranking.parsear_linea(linea)
+                if dato is None:
+                    contador.corruptas += 1
+                    continue
+                nombre, puntos = dato
+                yield (puntos, next(orden), nombre)
+
+
+def top_k(rutas, k, contador):
+    """
+    Los k mejores puntajes de todos los archivos.
+    Usa un heap de tamaño k: la memoria no depende del total de líneas.
+    """
+    if k <= 0:
+        return []
+
+    heap = []
+    for puntos, orden, nombre in leer_puntajes(rutas, contador):
+        # En el heap queda arriba el "peor" de los k mejores
+        item = (puntos, -orden, nombre)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    heap.sort(reverse=True)
+    return [(nombre, puntos) for puntos, _, nombre in heap]
+
+
+def _entero_positivo(texto):
+    valor = int(texto)
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"tiene que ser 1 o más (se pasó {valor})")
+    return valor
+
+
+def _guardar_tanda(tanda, carpeta):
+    tanda.sort()
+    return _escribir_tanda(tanda, carpeta)
+
+
+def _escribir_tanda(items, carpeta):
+    # Cada línea: -puntos, orden y nombre separados por tabulador
+    fd, ruta = tempfile.mkstemp(prefix="tanda_", suffix=".txt", dir=carpeta)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for menos_puntos, orden, nombre in items:
+            f.write(f"{menos_puntos}\t{orden}\t{nombre}\n")
+    return ruta
+
+
+def _mezclar(rutas):
+    """Mezcla tandas ya ordenadas (cada una queda abierta mientras se lee)."""
+    with contextlib.ExitStack() as pila:
+        archivos = [pila.enter_context(open(r, "r", encoding="utf-8")) for r in rutas]
+        yield from heapq.merge(*[_leer_tanda(f) for f in archivos])
+
+
+def _leer_tanda(f):
+    for linea in f:
+        menos_puntos, orden, nombre = linea.rstrip("\n").split("\t", 2)
+        yield (int(menos_puntos), int(orden), nombre)
+
+
+def ordenar_todo(rutas, salida, memoria, contador, max_tandas=MAX_TANDAS):
+    """
+    Escribe en "salida" todos los puntajes ordenados de mayor a menor,
+    en formato nombre:puntos. Nunca tiene más de "memoria" puntajes
+    en memoria a la vez (más uno por tanda durante la mezcla) ni más
+    de max_tandas tandas abiertas, tenga los archivos que tenga.
+    Devuelve la cantidad de puntajes escritos.
+    """
+    escritos = 0
+    carpeta = os.path.dirname(os.path.abspath(salida))
+
+    with tempfile.TemporaryDirectory(dir=carpeta) as temporal:
+        tandas = []
+        tanda = []
+        for puntos, orden, nombre in leer_puntajes(rutas, contador):
+            tanda.append((-puntos, orden, nombre))
+            if len(tanda) >= memoria:
+                tandas.append(_guardar_tanda(tanda, temporal))
+                tanda = []
+        if tanda:
+            tandas.append(_guardar_tanda(tanda, temporal))
+
+        # Pasadas intermedias: cada grupo de max_tandas queda en una tanda
+        while len(tandas) > max_tandas:
+            siguientes = []
+            for i in range(0, len(tandas), max_tandas):
+                grupo = tandas[i:i + max_tandas]
+                siguientes.append(_escribir_tanda(_mezclar(grupo), temporal))
+                for ruta in grupo:
+                    os.remove(ruta)
+            tandas = siguientes
+
+        with open(salida, "w", encoding="utf-8") as f:
+            for menos_puntos, _, nombre in _mezclar(tandas):
+                f.write(f"{nombre}:{-menos_puntos}\n")
+                escritos += 1
+
+    return escritos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Junta varios ranking.txt en un ranking global.")
+    parser.add_argument("archivos", nargs="+", help="archivos ranking.txt a juntar")
+    parser.add_argument("--top", type=_entero_positivo, default=10, help="cuántos mejores mostrar (por defecto 10)")
+    parser.add_argument("--salida", help="escribe el ranking completo ordenado en este archivo")
+    parser.add_argument("--memoria", type=_entero_positivo, default=1_000_000,
+                        help="puntajes por tanda al ordenar todo (por defecto 1000000)")
+    args = parser.parse_args(argv)
+
+    contador = Contador()
+    inicio = time.perf_counter()
+
+    if args.salida:
+        escritos = ordenar_todo(args.archivos, args.salida, args.memoria, contador)
+        print(f"{escritos} puntajes escritos en {args.salida}")
+    else:
+        for i, (nombre, puntos) in enumerate(top_k(args.archivos, args.top, contador), 1):
+            print(f"{i:>3}. {nombre} - {puntos}")
+
+    duracion = time.perf_counter() - inicio
+    por_segundo = contador.lineas / duracion if duracion > 0 else 0
+    print(
+        f"{contador.lineas} líneas ({contador.corruptas} ignoradas) "
+        f"en {duracion:.2f} s → {por_segundo:,.0f} líneas/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
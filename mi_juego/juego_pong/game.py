@@ -1,182 +1,100 @@
 # game.py
 import pygame
 from pygame.locals import *
-import random
 import os
+import time
 import ranking
 import config
-
-# --------------------------------------------------------------
-# RUTAS DE ARCHIVOS
-# --------------------------------------------------------------
-
-# Obtiene la carpeta base (donde está tu proyecto "mi_juego")
-CARPETA_BASE = os.path.dirname(os.path.dirname(__file__))
-
-# Carpeta donde guardás las imágenes (assets/)
-CARPETA_ASSETS = os.path.join(CARPETA_BASE, "assets")
-
-# Carpeta donde guardás los sonidos (sounds/)
-CARPETA_SONIDOS = os.path.join(CARPETA_BASE, "sounds")
+import motor
+import render
+import cache_texto
+import recursos
+import audio
+import perfilador
+import repeticion
+import video
 
 # --------------------------------------------------------------
 # CONSTANTES
 # --------------------------------------------------------------
 
-VENTANA_HORI = 800
-VENTANA_VERTI = 600
-FPS = 60
+VENTANA_HORI = motor.VENTANA_HORI
+VENTANA_VERTI = motor.VENTANA_VERTI
 COLOR = (255, 255, 255)
 NEGRO = (0, 0, 0)
 
-# --------------------------------------------------------------
-# SONIDOS
-# --------------------------------------------------------------
-
-pygame.mixer.init()
-
-# Función para cargar un sonido sin que el juego se rompa si falta un archivo
-def cargar_sound(nombre):
-    ruta = os.path.join(CARPETA_SONIDOS, nombre)
-    try:
-        s = pygame.mixer.Sound(ruta)
-        # Respeta si el sonido está activado o muteado (config.py)
-        s.set_volume(config.VOLUMEN if config.SONIDO_ACTIVO else 0.0)
-        return s
-    except Exception as e:
-        print("No se pudo cargar sonido:", ruta, e)
-        return None
-
-# Cargar sonidos del juego
-sonido_rebote = cargar_sound("rebote.mp3")
-sonido_punto = cargar_sound("punto.mp3")
-sonido_victoria = cargar_sound("victoria.mp3")
-sonido_derrota = cargar_sound("derrota.mp3")
-
+# Máximo tiempo de un cuadro que se le pasa a la física.
+# Si el dibujado se traba (por ejemplo al mover la ventana), no se
+# intenta "alcanzar" todo el tiempo perdido de golpe.
+MAX_FRAME = 0.25
 
 # --------------------------------------------------------------
-# CLASE PELOTA
+# SONIDOS
 # --------------------------------------------------------------
-class PelotaPong:
-    def __init__(self, nombre_imagen):
 
-        # Carga la imagen de la pelota
-        ruta_imagen = os.path.join(CARPETA_ASSETS, nombre_imagen)
-        original = pygame.image.load(ruta_imagen).convert_alpha()
+# Sonidos del partido: el menú los manda a cargar en segundo plano
+SONIDOS_PARTIDO = ("rebote.mp3", "punto.mp3", "victoria.mp3", "derrota.mp3")
 
-        # Achica la pelota a 30x30
-        self.imagen = pygame.transform.scale(original, (30, 30))
-        self.ancho, self.alto = self.imagen.get_size()
+# Los sonidos se cargan la primera vez que se usan (ver recursos.py).
+# Si falta un archivo, recursos.sonido() devuelve None y no suena nada.
 
-        # Posición inicial al centro
-        self.x = VENTANA_HORI / 2 - self.ancho / 2
-        self.y = VENTANA_VERTI / 2 - self.alto / 2
+# Reproduce el sonido que corresponde a cada evento del motor.
+# audio.py limita las voces y junta los rebotes repetidos.
+def reproducir_eventos(eventos):
+    for tipo, _ in eventos:
+        if tipo in (motor.EV_REBOTE_PARED, motor.EV_REBOTE_RAQUETA):
+            audio.reproducir("rebote", recursos.sonido("rebote.mp3"))
+        elif tipo == motor.EV_PUNTO:
+            audio.reproducir("punto", recursos.sonido("punto.mp3"))
 
-        # Movimiento inicial random
-        self.dir_x = random.choice([-5, 5])
-        self.dir_y = random.choice([-5, 5])
 
-        # Puntajes
-        self.puntuacion = 0
-        self.puntuacion_ia = 0
+# Dirección de la raqueta del jugador según las teclas apretadas ahora:
+# -1 (W, arriba), 1 (S, abajo) o 0 (ninguna o las dos)
+def direccion_teclado():
+    teclas = pygame.key.get_pressed()
+    return teclas[pygame.K_s] - teclas[pygame.K_w]
 
-    # Mueve la pelota cada frame
-    def mover(self):
-        self.x += self.dir_x
-        self.y += self.dir_y
 
-    # Revisa rebotes y puntos
-    def rebotar(self):
+# Posiciones de la pelota y las raquetas en un momento dado.
+# Se reusan los mismos objetos en cada tick (no se crean tuplas nuevas).
+class Posiciones:
+    __slots__ = ("pelota_x", "pelota_y", "raqueta_1_y", "raqueta_2_y")
 
+    def __init__(self):
+        self.pelota_x = self.pelota_y = 0.0
+        self.raqueta_1_y = self.raqueta_2_y = 0.0
 
-        # Si sale por la izquierda → punto para IA
-        if self.x <= 0:
-            self.reiniciar()
-            self.puntuacion_ia += 1
-            if sonido_punto:
-                sonido_punto.play()
-
-        # Si sale por la derecha → punto para jugador
-        if self.x + self.ancho >= VENTANA_HORI:
-            self.reiniciar()
-            self.puntuacion += 1
-            if sonido_punto:
-                sonido_punto.play()
-
-        # Rebotes arriba/abajo
-        if self.y <= 0 or self.y + self.alto >= VENTANA_VERTI:
-            self.dir_y = -self.dir_y
-            if sonido_rebote:
-                sonido_rebote.play()
+    def copiar(self, estado):
+        self.pelota_x = estado.pelota.x
+        self.pelota_y = estado.pelota.y
+        self.raqueta_1_y = estado.raqueta_1.y
+        self.raqueta_2_y = estado.raqueta_2.y
 
-    # Reinicia pelota tras un punto
-    def reiniciar(self):
-        self.x = VENTANA_HORI / 2 - self.ancho / 2
-        self.y = VENTANA_VERTI / 2 - self.alto / 2
+    def igualar(self, otras):
+        self.pelota_x = otras.pelota_x
+        self.pelota_y = otras.pelota_y
+        self.raqueta_1_y = otras.raqueta_1_y
+        self.raqueta_2_y = otras.raqueta_2_y
 
-        # Invierte la dirección para variar
-        self.dir_x = -self.dir_x
-        self.dir_y = random.choice([-5, 5])
+    # Posición intermedia entre dos ticks de física (alpha entre 0 y 1)
+    def interpolar(self, anterior, actual, alpha):
+        self.pelota_x = anterior.pelota_x + (actual.pelota_x - anterior.pelota_x) * alpha
+        self.pelota_y = anterior.pelota_y + (actual.pelota_y - anterior.pelota_y) * alpha
+        self.raqueta_1_y = anterior.raqueta_1_y + (actual.raqueta_1_y - anterior.raqueta_1_y) * alpha
+        self.raqueta_2_y = anterior.raqueta_2_y + (actual.raqueta_2_y - anterior.raqueta_2_y) * alpha
 
 
 # --------------------------------------------------------------
-# CLASE RAQUETA
+# FUENTES
+# Se crea una sola fuente por tamaño: así los textos guardados en
+# cache_texto siguen sirviendo al volver a entrar al juego.
 # --------------------------------------------------------------
-class Raquetapong:
-    def __init__(self):
-
-        # Cargar imagen de la raqueta
-        ruta_raqueta = os.path.join(CARPETA_ASSETS, "raqueta.png")
-        self.imagen = pygame.image.load(ruta_raqueta).convert_alpha()
+fuentes = {}
 
-        self.ancho, self.alto = self.imagen.get_size()
-
-        # Posición inicial a mitad de pantalla
-        self.x = 0
-        self.y = VENTANA_VERTI / 2 - self.alto / 2
-
-        self.dir_y = 0
-
-    # Mover raqueta del jugador
-    def mover(self):
-        self.y += self.dir_y
-
-        # Limites de pantalla
-        if self.y <= 0:
-            self.y = 0
-        if self.y + self.alto >= VENTANA_VERTI:
-            self.y = VENTANA_VERTI - self.alto
-
-    # Mover raqueta de la IA
-    def mover_ia(self, pelota, velocidad):
-        if self.y > pelota.y:
-            self.dir_y = -velocidad
-        elif self.y < pelota.y:
-            self.dir_y = velocidad
-        else:
-            self.dir_y = 0
-
-        self.y += self.dir_y
-
-    # Detecta colisión con la pelota
-    def colision(self, pelota):
-
-        if (
-            pelota.x < self.x + self.ancho
-            and pelota.x + pelota.ancho > self.x
-            and pelota.y + pelota.alto > self.y
-            and pelota.y < self.y + self.alto
-        ):
-            pelota.dir_x = -pelota.dir_x
-
-            # Evita múltiples colisiones seguidas
-            if pelota.x < VENTANA_HORI / 2:
-                pelota.x = self.x + self.ancho
-            else:
-                pelota.x = self.x - pelota.ancho
-
-            if sonido_rebote:
-                sonido_rebote.play()
+def obtener_fuente(tamano):
+    if tamano not in fuentes:
+        fuentes[tamano] = pygame.font.Font(None, tamano)
+    return fuentes[tamano]
 
 
 # --------------------------------------------------------------
@@ -187,6 +105,9 @@ def pedir_nombre(ventana, fuente):
     activo = True
     clock = pygame.time.Clock()
 
+    # El primer cuadro se muestra entero; después solo cambia la caja
+    zonas = None
+
     while activo:
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
@@ -210,20 +131,21 @@ def pedir_nombre(ventana, fuente):
         ventana.fill((20, 20, 40))
 
         # Texto superior
-        titulo = fuente.render("Ingresa tu nombre (ENTER):", True, (255, 255, 255))
+        titulo = cache_texto.render(fuente, "Ingresa tu nombre (ENTER):", (255, 255, 255))
         ventana.blit(titulo, (VENTANA_HORI // 2 - titulo.get_width() // 2, 140))
 
         # Caja de texto
         caja = pygame.Rect(VENTANA_HORI // 2 - 200, 260, 400, 60)
         pygame.draw.rect(ventana, (230, 230, 230), caja)
 
-        texto = fuente.render(nombre, True, (10, 10, 10))
+        texto = cache_texto.render(fuente, nombre, (10, 10, 10))
         ventana.blit(texto, (caja.x + 10, caja.y + 10))
 
-        ayuda = pygame.font.Font(None, 24).render("Max 12 chars", True, (180, 180, 180))
+        ayuda = cache_texto.render(obtener_fuente(24), "Max 12 chars", (180, 180, 180))
         ventana.blit(ayuda, (VENTANA_HORI // 2 - ayuda.get_width() // 2, caja.y + 70))
 
-        pygame.display.flip()
+        video.mostrar(zonas)
+        zonas = [caja]
         clock.tick(30)
 
 
@@ -233,51 +155,56 @@ def pedir_nombre(ventana, fuente):
 def animacion_final(ventana, texto, subtitulo=None, sonido=None):
 
     clock = pygame.time.Clock()
-    fuente_big = pygame.font.Font(None, 120)
-    fuente_small = pygame.font.Font(None, 36)
+    fuente_big = obtener_fuente(120)
+    fuente_small = obtener_fuente(36)
 
     # Reproducir sonido final
-    if sonido and config.SONIDO_ACTIVO:
-        try:
-            sonido.play()
-        except:
-            pass
+    audio.reproducir("final", sonido)
+
+    # Los textos se dibujan una sola vez; se copian porque el fundido
+    # les cambia el alpha y las superficies de la cache son compartidas
+    surf = cache_texto.render(fuente_big, texto, (255, 255, 255)).copy()
+    rect = surf.get_rect(center=(VENTANA_HORI // 2, VENTANA_VERTI // 2 - 30))
+
+    if subtitulo:
+        sub = cache_texto.render(fuente_small, subtitulo, (200, 200, 200)).copy()
+        rect2 = sub.get_rect(center=(VENTANA_HORI // 2, VENTANA_VERTI // 2 + 50))
 
-    # Animación: fade + zoom
+    # Animación: fade + zoom (después del primer cuadro solo cambian los textos)
+    zonas = None
     for alpha in range(0, 256, 8):
         ventana.fill((0, 0, 0))
-        surf = fuente_big.render(texto, True, (255, 255, 255))
         surf.set_alpha(alpha)
-        rect = surf.get_rect(center=(VENTANA_HORI // 2, VENTANA_VERTI // 2 - 30))
         ventana.blit(surf, rect)
 
         if subtitulo:
-            sub = fuente_small.render(subtitulo, True, (200, 200, 200))
             sub.set_alpha(alpha)
-            rect2 = sub.get_rect(center=(VENTANA_HORI // 2, VENTANA_VERTI // 2 + 50))
             ventana.blit(sub, rect2)
 
-        pygame.display.flip()
+        video.mostrar(zonas)
+        zonas = [rect, rect2] if subtitulo else [rect]
         clock.tick(60)
 
     pygame.time.delay(800)
 
-    # Menú final
+    # Menú final: después del primer cuadro no cambia nada
+    zonas = None
     while True:
         ventana.fill((10, 10, 10))
         ventana.blit(surf, rect)
         if subtitulo:
             ventana.blit(sub, rect2)
 
-        info = fuente_small.render(
+        info = cache_texto.render(
+            fuente_small,
             "R - Reintentar    |    ESC - Volver al menú",
-            True,
             (230, 230, 230)
         )
         vent_rect = info.get_rect(center=(VENTANA_HORI // 2, VENTANA_VERTI - 80))
         ventana.blit(info, vent_rect)
 
-        pygame.display.flip()
+        video.mostrar(zonas)
+        zonas = []
 
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
@@ -295,152 +222,281 @@ def animacion_final(ventana, texto, subtitulo=None, sonido=None):
 # --------------------------------------------------------------
 # LOOP PRINCIPAL DEL JUEGO
 # --------------------------------------------------------------
-def game_loop(dificultad):
+def game_loop(dificultad, perfil=None, memoria=None, sonda=None):
+
+    # El audio se puede estar cargando en segundo plano (ver menu.iniciar)
+    recursos.esperar_audio()
 
     pygame.init()
-    ventana = pygame.display.set_mode((VENTANA_HORI, VENTANA_VERTI))
-    pygame.display.set_caption("Pong")
+    ventana = video.iniciar("Pong")
 
     # Cargar fondo
-    ruta_fondo = os.path.join(CARPETA_ASSETS, "fondo.png")
-    fondo = pygame.image.load(ruta_fondo).convert()
-    fondo = pygame.transform.scale(fondo, (VENTANA_HORI, VENTANA_VERTI))
+    fondo = recursos.imagen("fondo.png", (VENTANA_HORI, VENTANA_VERTI), alpha=False)
 
-    fuente = pygame.font.Font(None, 60)
+    fuente = obtener_fuente(60)
 
     # Pedir nombre del jugador
     nombre_jugador = pedir_nombre(ventana, fuente)
 
-    pelota = PelotaPong("pelota.png")
+    # Imágenes de la pelota y de las raquetas (ambas usan la misma)
+    # (se cargan del disco solo la primera vez, ver recursos.py)
+    imagen_pelota = recursos.imagen("pelota.png", (motor.PELOTA_ANCHO, motor.PELOTA_ALTO))
+    imagen_raqueta = recursos.imagen("raqueta.png")
 
-    # -------- CONFIGURAR DIFICULTAD --------
-    if dificultad == "Facil":
-        ia_vel = 3
-        velocidad_base = 4
-    elif dificultad == "Normal":
-        ia_vel = 5
-        velocidad_base = 6
-    else:
-        ia_vel = 7
-        velocidad_base = 7
+    # Entradas del jugador: la raqueta derecha la maneja la IA
+    entradas = motor.Entradas()
 
-    # Ajusta velocidad real de la pelota
-    pelota.dir_x = velocidad_base if pelota.dir_x > 0 else -velocidad_base
-    pelota.dir_y = velocidad_base if pelota.dir_y > 0 else -velocidad_base
+    # Medición de tiempos por fase (apagada salvo config.PERFILADOR o F3)
+    if perfil is None:
+        perfil = perfilador.Perfilador(config.PERFILADOR)
+    fuente_hud = obtener_fuente(20)
 
-    # Raqueta jugador (izquierda)
-    raqueta_1 = Raquetapong()
-    raqueta_1.x = 60
-
-    # Raqueta IA (derecha)
-    raqueta_2 = Raquetapong()
-    raqueta_2.x = VENTANA_HORI - 60 - raqueta_2.ancho
+    # Dibuja solo lo que cambia (o todo, según config.RENDER_SUCIO);
+    # con el backend "sdl2" dibuja con texturas (ver video.py)
+    if video.usa_texturas():
+        renderer = render.RendererTexturas(
+            video.renderer_sdl, video.lienzo, video.presentar, fondo, config.RENDER_SUCIO, perfil,
+        )
+    else:
+        renderer = render.Renderer(ventana, fondo, config.RENDER_SUCIO, perfil)
+
+    # Todo lo que usa el loop se crea acá, una sola vez: en cada cuadro
+    # solo se actualiza (así el recolector de basura no tiene trabajo
+    # y no hay tirones en partidas largas)
+    xc = VENTANA_HORI // 2
+    sprite_pelota = render.Sprite("pelota", imagen_pelota)
+    sprite_raqueta_1 = render.Sprite("raqueta_1", imagen_raqueta)
+    sprite_raqueta_2 = render.Sprite("raqueta_2", imagen_raqueta)
+    sprite_izq = render.Sprite("puntaje_izq")
+    sprite_sep = render.Sprite("puntaje_sep", cache_texto.render(fuente, ":", NEGRO))
+    sprite_der = render.Sprite("puntaje_der")
+    sprite_hud = render.Sprite("hud", visible=False)
+    sprite_izq.mover(xc - 50, 40)
+    sprite_sep.mover(xc - 12, 40)
+    sprite_der.mover(xc + 30, 40)
+    sprite_hud.mover(8, 8)
+    sprites = [
+        sprite_pelota, sprite_raqueta_1, sprite_raqueta_2,
+        sprite_izq, sprite_sep, sprite_der, sprite_hud,
+    ]
+
+    # Posiciones del tick anterior, del actual y las que se dibujan
+    anterior = Posiciones()
+    actual = Posiciones()
+    dibujo = Posiciones()
+
+    # Lista de eventos que reusa motor.step en cada tick
+    eventos = []
 
     clock = pygame.time.Clock()
 
+    # Duración fija de cada tick de física (en segundos)
+    dt = 1.0 / config.TICKS_FISICA
+
     # Loop para permitir "reintentar"
     while True:
 
-        pelota.puntuacion = 0
-        pelota.puntuacion_ia = 0
-        pelota.reiniciar()
+        # Cada partida (también al reintentar) tiene su propia semilla y
+        # se graba tick a tick para poder repetirla (ver repeticion.py)
+        grabacion = repeticion.Grabacion(
+            dificultad,
+            ticks_por_segundo=config.TICKS_FISICA,
+            continua=config.COLISION_CONTINUA,
+            ia_predictiva=config.IA_PREDICTIVA,
+        )
+
+        # Estado de la partida (toda la física vive en motor.py)
+        estado = grabacion.estado_inicial()
+        pelota = estado.pelota
+        raqueta_1 = estado.raqueta_1
+        raqueta_2 = estado.raqueta_2
+
+        # Se viene de otra pantalla (nombre o final): dibujar todo
+        renderer.forzar_completo()
+
+        # Tiempo real acumulado que la física todavía no simuló
+        acumulador = 0.0
+        ultimo = time.perf_counter()
+        actual.copiar(estado)
+        anterior.igualar(actual)
+
+        # Puntaje dibujado (el texto se vuelve a armar solo si cambia)
+        puntos_izq = puntos_der = None
+
+        # Teclas que ya estaban apretadas al empezar (por ej. al reintentar)
+        entradas.dir_1 = direccion_teclado()
 
         jugando = True
 
         # Loop principal
         while jugando:
 
-            # Movimiento y colisiones
-            pelota.mover()
-            pelota.rebotar()
-            raqueta_1.mover()
-            raqueta_2.mover_ia(pelota, ia_vel)
-            raqueta_1.colision(pelota)
-            raqueta_2.colision(pelota)
+            perfil.empezar_cuadro()
+            if memoria is not None:
+                memoria.cuadro()
+
+            # ---------------- EVENTOS Y ENTRADA ----------------
+            # Se leen justo antes de simular, así la tecla apretada
+            # durante la espera ya mueve la raqueta en este cuadro.
+            # (peek() evita armar una lista vacía en cada cuadro)
+            hubo_eventos = pygame.event.peek()
+            for event in pygame.event.get() if hubo_eventos else ():
+
+                if event.type == QUIT:
+                    guardar_repeticion(grabacion, estado)
+                    return
+
+                renderer.procesar_evento(event)
+
+                if event.type == pygame.KEYDOWN:
+
+                    # Tecla M → silenciar
+                    if event.key == pygame.K_m:
+                        config.SONIDO_ACTIVO = not config.SONIDO_ACTIVO
+                        audio.aplicar_volumen()
+
+                    # ESC → volver al menú
+                    if event.key == pygame.K_ESCAPE:
+                        guardar_repeticion(grabacion, estado)
+                        return
 
-            # Dibujar elementos
-            ventana.blit(fondo, (0, 0))
-            ventana.blit(pelota.imagen, (pelota.x, pelota.y))
-            ventana.blit(raqueta_1.imagen, (raqueta_1.x, raqueta_1.y))
-            ventana.blit(raqueta_2.imagen, (raqueta_2.x, raqueta_2.y))
+                    # F3 → mostrar / ocultar los tiempos por fase
+                    if event.key == pygame.K_F3:
+                        perfil.hud = not perfil.hud
+                        if perfil.hud and not perfil.activo:
+                            perfil.alternar()
+
+                    # F4 → guardar la medición
+                    if event.key == pygame.K_F4 and perfil.cuadros:
+                        exportar_perfil(perfil)
+
+            # Movimiento jugador: estado actual de W/S (solo cambia con eventos)
+            if hubo_eventos:
+                direccion = direccion_teclado()
+                if direccion != entradas.dir_1:
+                    entradas.dir_1 = direccion
+                    if sonda is not None:
+                        sonda.entrada()
+
+            perfil.marcar("eventos")
+
+            ahora = time.perf_counter()
+            acumulador += min(ahora - ultimo, MAX_FRAME)
+            ultimo = ahora
+
+            # Movimiento y colisiones: tantos ticks fijos como entren
+            # en el tiempo que pasó desde el cuadro anterior
+            while acumulador >= dt and estado.ganador is None:
+                anterior.igualar(actual)
+                grabacion.registrar(entradas)
+                motor.step(estado, entradas, eventos)
+                reproducir_eventos(eventos)
+                actual.copiar(estado)
+                acumulador -= dt
+
+                if sonda is not None:
+                    sonda.tick()
+
+                # Tras un punto la pelota "salta" al centro: no interpolar
+                for tipo, _ in eventos:
+                    if tipo == motor.EV_PUNTO:
+                        anterior.igualar(actual)
+
+            perfil.marcar("fisica")
+
+            # Dibujar elementos (entre el tick anterior y el actual)
+            dibujo.interpolar(anterior, actual, min(acumulador / dt, 1.0))
+            sprite_pelota.mover(dibujo.pelota_x, dibujo.pelota_y)
+            sprite_raqueta_1.mover(raqueta_1.x, dibujo.raqueta_1_y)
+            sprite_raqueta_2.mover(raqueta_2.x, dibujo.raqueta_2_y)
 
             # Puntaje
-            izq = fuente.render(str(pelota.puntuacion), True, NEGRO)
-            der = fuente.render(str(pelota.puntuacion_ia), True, NEGRO)
-            sep = fuente.render(":", True, NEGRO)
+            if pelota.puntuacion != puntos_izq:
+                puntos_izq = pelota.puntuacion
+                sprite_izq.superficie = cache_texto.render(fuente, str(puntos_izq), NEGRO)
+            if pelota.puntuacion_ia != puntos_der:
+                puntos_der = pelota.puntuacion_ia
+                sprite_der.superficie = cache_texto.render(fuente, str(puntos_der), NEGRO)
+
+            perfil.marcar("texto")
+
+            # Tabla de tiempos (F3)
+            sprite_hud.visible = perfil.hud
+            if perfil.hud:
+                sprite_hud.superficie = perfil.superficie_hud(fuente_hud)
+                perfil.marcar("hud")
+
+            renderer.dibujar(sprites)
 
-            xc = VENTANA_HORI // 2
-            ventana.blit(izq, (xc - 50, 40))
-            ventana.blit(sep, (xc - 12, 40))
-            ventana.blit(der, (xc + 30, 40))
+            if sonda is not None:
+                sonda.mostrado()
 
             # ---------------- GANAR O PERDER ----------------
 
-            if pelota.puntuacion >= 7:
+            if estado.ganador is not None:
+                guardar_repeticion(grabacion, estado)
+
+            if estado.ganador == motor.JUGADOR:
                 ranking.guardar_score(nombre_jugador, pelota.puntuacion)
                 accion = animacion_final(
                     ventana,
                     "VICTORIA",
                     f"{nombre_jugador} {pelota.puntuacion} pts",
-                    sonido_victoria
+                    recursos.sonido("victoria.mp3")
                 )
                 if accion == "retry":
                     break
                 else:
                     return  # Volver al menú
 
-            if pelota.puntuacion_ia >= 7:
+            if estado.ganador == motor.IA:
                 ranking.guardar_score("IA", pelota.puntuacion_ia)
                 accion = animacion_final(
                     ventana,
                     "GAME OVER",
                     f"IA {pelota.puntuacion_ia} pts",
-                    sonido_derrota
+                    recursos.sonido("derrota.mp3")
                 )
                 if accion == "retry":
                     break
                 else:
                     return
 
-            # ---------------- EVENTOS ----------------
-            for event in pygame.event.get():
+            clock.tick(config.FPS_RENDER)
 
-                if event.type == QUIT:
-                    return
+            perfil.marcar("espera")
 
-                if event.type == pygame.KEYDOWN:
 
-                    # Tecla M → silenciar
-                    if event.key == pygame.K_m:
-                        config.SONIDO_ACTIVO = not config.SONIDO_ACTIVO
-                        vol = config.VOLUMEN if config.SONIDO_ACTIVO else 0.0
-
-                        # Modificar volumen de todos los sonidos cargados
-                        for s in (sonido_rebote, sonido_punto, sonido_victoria, sonido_derrota):
-                            if s:
-                                try:
-                                    s.set_volume(vol)
-                                except:
-                                    pass
+# Guarda la partida grabada en config.CARPETA_REPETICIONES
+def guardar_repeticion(grabacion, estado):
+    if not config.GRABAR_PARTIDAS or not grabacion.entradas:
+        return
 
-                    # ESC → volver al menú
-                    if event.key == pygame.K_ESCAPE:
-                        return
-
-                    # Movimiento jugador
-                    if event.key == pygame.K_w:
-                        raqueta_1.dir_y = -5
-                    if event.key == pygame.K_s:
-                        raqueta_1.dir_y = 5
+    carpeta = os.path.join(recursos.CARPETA_BASE, config.CARPETA_REPETICIONES)
+    try:
+        grabacion.guardar(repeticion.ruta_nueva(carpeta, grabacion), estado)
+    except OSError as e:
+        print("No se pudo guardar la repetición:", e)
 
-                if event.type == pygame.KEYUP:
-                    if event.key in (pygame.K_w, pygame.K_s):
-                        raqueta_1.dir_y = 0
 
-            pygame.display.flip()
-            clock.tick(FPS)
+# Guarda la medición del perfilador en config.PERFILADOR_ARCHIVO
+def exportar_perfil(perfil):
+    ruta = os.path.join(recursos.CARPETA_BASE, config.PERFILADOR_ARCHIVO)
+    cuadros = perfil.exportar(ruta)
+    print(f"Perfil de {cuadros} cuadros guardado en {ruta}")
 
 
 def jugar(dificultad):
-    game_loop(dificultad)
+    perfil = perfilador.Perfilador(config.PERFILADOR)
+    memoria = perfilador.MedidorMemoria() if config.PRESUPUESTO_MEMORIA else None
+    sonda = perfilador.SondaLatencia() if config.SONDA_LATENCIA else None
+    try:
+        game_loop(dificultad, perfil, memoria, sonda)
+    finally:
+        if config.PERFILADOR and perfil.cuadros:
+            exportar_perfil(perfil)
+        if memoria is not None:
+            print("\n".join(memoria.terminar()))
+        if sonda is not None:
+            print("\n".join(sonda.reporte()))
 
@@ -0,0 +1,128 @@
+# hornear_recursos.py
+# --------------------------------------------------------------
+# "Hornea" las imágenes y sonidos del juego en un solo archivo
+# (recursos.cache) para que el arranque no tenga que decodificar
+# PNG ni MP3.
+#
+#  - Imágenes: ya escaladas al tamaño que usa el juego, como
+#    pixeles crudos RGBA (o RGB si no tienen transparencia).
+#  - Sonidos: muestras PCM ya decodificadas, en el formato del
+#    mixer (frecuencia, bits y canales quedan anotados).
+#
+# Cada archivo fuente se anota con su tamaño, su fecha y su huella
+# (sha256): si después se cambia un PNG o un MP3, el juego detecta
+# que la cache está vieja y usa los originales hasta que se vuelva
+# a hornear.
+#
+# Uso:
+#   python hornear_recursos.py
+# --------------------------------------------------------------
+
+import json
+import os
+
+# No hace falta ventana ni parlantes para hornear
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import recursos
+
+# Cada bloque de datos empieza en un múltiplo de ALINEACION bytes
+ALINEACION = 64
+
+
+def _relativa(ruta):
+    return os.path.relpath(ruta, recursos.CARPETA_BASE).replace(os.sep, "/")
+
+
+def hornear(ruta_salida=recursos.RUTA_CACHE):
+    pygame.mixer.init()
+
+    fuentes = {}
+    bloques = []
+    imagenes = []
+    sonidos = []
+
+    # ---- Imágenes ----
+    for nombre, tamano, alpha in recursos.IMAGENES_HORNEADAS:
+        ruta = os.path.join(recursos.CARPETA_ASSETS, nombre)
+        superficie = pygame.image.load(ruta)
+        if tamano is not None and superficie.get_size() != tamano:
+            superficie = pygame.transform.scale(superficie, tamano)
+
+        formato = "RGBA" if alpha else "RGB"
+        datos = pygame.image.tobytes(superficie, formato)
+
+        fuentes[_relativa(ruta)] = recursos.firma_fuente(ruta)
+        imagenes.append({
+            "nombre": nombre,
+            "tamano": list(tamano) if tamano else None,
+            "alpha": alpha,
+            "w": superficie.get_width(),
+            "h": superficie.get_height(),
+        })
+        bloques.append(datos)
+
+    # ---- Sonidos ----
+    for nombre in sorted(os.listdir(recursos.CARPETA_SONIDOS)):
+        if not nombre.lower().endswith(recursos.EXTENSIONES_SONIDO):
+            continue
+        ruta = os.path.join(recursos.CARPETA_SONIDOS, nombre)
+        try:
+            datos = pygame.mixer.Sound(ruta).get_raw()
+        except Exception as e:
+            print("No se pudo hornear", ruta, e)
+            continue
+
+        fuentes[_relativa(ruta)] = recursos.firma_fuente(ruta)
+        sonidos.append({"nombre": nombre})
+        bloques.append(datos)
+
+    # ---- Ubicación de cada bloque dentro del archivo ----
+    indice = {
+        "fuentes": fuentes,
+        "mixer": list(pygame.mixer.get_init()),
+        "imagenes": imagenes,
+        "sonidos": sonidos,
+    }
+
+    # El encabezado depende de los offsets y los offsets del largo del
+    # encabezado: se reserva espacio de sobra y se rellena con espacios
+    items = imagenes + sonidos
+    for item in items:
+        item["offset"] = 0
+        item["largo"] = 0
+    reserva = len(json.dumps(indice).encode("utf-8")) + 32 * len(items) + 64
+
+    posicion = _alinear(recursos.ENCABEZADO.size + reserva)
+    for item, datos in zip(items, bloques):
+        item["offset"] = posicion
+        item["largo"] = len(datos)
+        posicion = _alinear(posicion + len(datos))
+
+    encabezado = json.dumps(indice).encode("utf-8")
+    encabezado += b" " * (reserva - len(encabezado))
+
+    # Se escribe en un temporal y se reemplaza de una vez: el juego
+    # nunca ve una cache a medio escribir
+    temporal = ruta_salida + ".tmp"
+    with open(temporal, "wb") as f:
+        f.write(recursos.ENCABEZADO.pack(recursos.MAGIA, recursos.VERSION_CACHE, reserva))
+        f.write(encabezado)
+        for item, datos in zip(items, bloques):
+            f.seek(item["offset"])
+            f.write(datos)
+    os.replace(temporal, ruta_salida)
+
+    total = os.path.getsize(ruta_salida)
+    print(f"{len(imagenes)} imágenes y {len(sonidos)} sonidos → {ruta_salida} ({total / 1024:.0f} KiB)")
+
+
+def _alinear(n):
+    return (n + ALINEACION - 1) // ALINEACION * ALINEACION
+
+
+if __name__ == "__main__":
+    hornear()
@@ -3,11 +3,78 @@
 # Este archivo es el punto de entrada del juego.
 # Es decir, cuando ejecutás "python main.py", lo primero
 # que se corre es este archivo.
+#
+# Con "python main.py --profile-startup" el juego arranca,
+# muestra el primer cuadro del menú, espera a que termine de
+# cargarse el audio e imprime cuánto tardó cada parte, y cuánto
+# tardó en cargarse y cuánta memoria ocupa cada imagen y sonido.
+#
+# Con "python main.py --sdl2" la ventana usa el backend de
+# texturas (ver video.py): se puede agrandar o poner en pantalla
+# completa y el juego se escala solo.
 # ------------------------------------------
 
+import time
+
+# Momento en que empezó el programa (para medir el arranque)
+INICIO = time.perf_counter()
+
+import sys
+
 # Importamos el archivo "menu.py"
 # Esto nos permite usar su función principal: main_menu()
+# (importarlo no abre la ventana ni carga sonidos: eso lo hace menu.iniciar())
 import menu
+import config
+
+FIN_IMPORTS = time.perf_counter()
+
+
+# Arranca hasta el primer cuadro e imprime el tiempo de cada fase
+def perfilar_arranque():
+    import pygame
+    import recursos
+    import video
+
+    fases = [("importar módulos", FIN_IMPORTS - INICIO)]
+
+    t = time.perf_counter()
+    menu.iniciar()
+    fases.append(("ventana y fuentes", time.perf_counter() - t))
+
+    t = time.perf_counter()
+    menu.dibujar_menu_principal()
+    video.mostrar()
+    fases.append(("primer cuadro", time.perf_counter() - t))
+
+    hasta_primer_cuadro = time.perf_counter() - INICIO
+
+    # El audio se cargó en paralelo; se espera solo para poder medirlo
+    t = time.perf_counter()
+    recursos.esperar_audio()
+    espera_audio = time.perf_counter() - t
+
+    print("Arranque (hilo principal):")
+    for nombre, segundos in fases:
+        print(f"  {nombre:<24} {segundos * 1000:8.1f} ms")
+    print(f"  {'TOTAL hasta 1er cuadro':<24} {hasta_primer_cuadro * 1000:8.1f} ms")
+
+    print("Audio (segundo plano):")
+    for nombre, segundos in recursos.tiempos_audio.items():
+        print(f"  {nombre:<24} {segundos * 1000:8.1f} ms")
+    print(f"  {'listo después de':<24} {espera_audio * 1000:8.1f} ms del 1er cuadro")
+
+    # Las imágenes del partido se cargan al entrar a jugar; se cargan
+    # acá (fuera de los tiempos de arriba) para que entren en el reporte
+    for nombre, tamano, alpha in recursos.IMAGENES_HORNEADAS:
+        recursos.imagen(nombre, tamano, alpha)
+
+    print("Recursos (carga y memoria):")
+    for linea in recursos.reporte():
+        print("  " + linea)
+
+    pygame.quit()
+
 
 # Esta condición se ejecuta SOLO cuando este archivo
 # es ejecutado directamente desde la terminal.
@@ -17,7 +84,13 @@ import menu
 # Sirve para evitar que el juego se abra automáticamente
 # cuando se hagan importaciones internas en Python.
 if __name__ == "__main__":
-    
-    # Llamamos a la función principal del menú.
-    # Esto inicia la pantalla del menú de inicio del juego.
-    menu.main_menu()
+
+    if "--sdl2" in sys.argv[1:]:
+        config.BACKEND_RENDER = "sdl2"
+
+    if "--profile-startup" in sys.argv[1:]:
+        perfilar_arranque()
+    else:
+        # Llamamos a la función principal del menú.
+        # Esto inicia la pantalla del menú de inicio del juego.
+        menu.main_menu()
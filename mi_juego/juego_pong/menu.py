@@ -9,103 +9,167 @@
 #  - Navegación hacia el juego
 # --------------------------------------------------------------
 
+import os
 import pygame
 import sys
 import game
-import os
 import ranking
 import config
-
-# Carpeta base: obtiene la carpeta raíz del proyecto (mi_juego)
-CARPETA_BASE = os.path.dirname(os.path.dirname(__file__))
-
-# Carpeta donde se guardan los sonidos
-CARPETA_SONIDOS = os.path.join(CARPETA_BASE, "sounds")
-
-pygame.init()
-pygame.mixer.init()
-
-# --------------------------------------------------------------
-# Función para cargar sonidos del menú
-# Retorna un objeto pygame.mixer.Sound si existe
-# Caso contrario no rompe el juego, devuelve None
-# --------------------------------------------------------------
-def cargar_sound(nombre):
-    ruta = os.path.join(CARPETA_SONIDOS, nombre)
-    try:
-        s = pygame.mixer.Sound(ruta)
-        # Aplica el volumen global (ON/OFF)
-        s.set_volume(config.VOLUMEN if config.SONIDO_ACTIVO else 0.0)
-        return s
-    except Exception as e:
-        print("No se pudo cargar sonido de menú:", ruta, e)
-        return None
-
-# Carga y reproduce la música del menú (en loop infinito)
-sonido_menu = cargar_sound("menu.mp3")
-if sonido_menu:
-    sonido_menu.play(-1)
+import cache_texto
+import recursos
+import audio
+import motor
+import video
 
 # Tamaño de la ventana del menú
 ANCHO = 800
 ALTO = 600
-pantalla = pygame.display.set_mode((ANCHO, ALTO))
-pygame.display.set_caption("Menu Principal - Pong")
 
 # Colores usados
 BLANCO = (255, 255, 255)
 NEGRO = (0, 0, 0)
 
-# Fuentes principales del menú
-fuente = pygame.font.Font(None, 60)
-fuente_peque = pygame.font.Font(None, 40)
-
 # Dificultad por defecto
 DIFICULTAD = "Normal"
 
+# Dificultades calibradas (calibrar.py): nombre → datos de la medición
+dificultades_medidas = {}
+
+# Se crean en iniciar() (importar este archivo no abre nada)
+pantalla = None
+fuente = None
+fuente_peque = None
+
+# Música del menú: queda en None hasta que termine de cargarse
+sonido_menu = None
+
+# --------------------------------------------------------------
+# Arranque: abre la ventana y crea las fuentes.
+# El audio (mixer, música del menú y sonidos del partido) se
+# inicia en segundo plano: el menú aparece sin esperarlo.
+# --------------------------------------------------------------
+def iniciar():
+    global pantalla, fuente, fuente_peque
+
+    pygame.display.init()
+    pygame.font.init()
+
+    pantalla = video.iniciar("Menu Principal - Pong")
+
+    # Fuentes principales del menú
+    fuente = pygame.font.Font(None, 60)
+    fuente_peque = pygame.font.Font(None, 40)
+
+    cargar_dificultades()
+
+    recursos.iniciar_audio_en_segundo_plano(("menu.mp3",) + game.SONIDOS_PARTIDO)
+
+# Carga la tabla de config.DIFICULTADES_CALIBRADAS (si hay una):
+# desde ahí las partidas usan esos valores
+def cargar_dificultades():
+    global dificultades_medidas
+
+    if config.DIFICULTADES_CALIBRADAS:
+        ruta = os.path.join(recursos.CARPETA_BASE, config.DIFICULTADES_CALIBRADAS)
+        dificultades_medidas = motor.cargar_dificultades(ruta)
+
+# Se llama en el hilo principal al recibir recursos.AUDIO_LISTO
+# (ya está todo cargado): reproduce la música del menú (en loop infinito)
+def musica_lista():
+    global sonido_menu
+
+    # recursos.sonido() devuelve None si el archivo no existe
+    sonido_menu = recursos.sonido("menu.mp3")
+    audio.reproducir("musica", sonido_menu, -1)
+
 # --------------------------------------------------------------
 # Dibuja un texto centrado automáticamente en x,y
 # --------------------------------------------------------------
 def dibujar_texto(texto, fuente, color, x, y):
-    render = fuente.render(texto, True, color)
+    render = cache_texto.render(fuente, texto, color)
     rect = render.get_rect(center=(x, y))
     pantalla.blit(render, rect)
 
+# --------------------------------------------------------------
+# Bucle genérico de las pantallas del menú
+#
+# En vez de redibujar sin parar (100% de CPU con la pantalla quieta),
+# se queda dormido esperando un evento con pygame.event.wait().
+# Solo se redibuja cuando algo cambió.
+#
+#  - dibujar(): pinta la pantalla completa
+#  - manejar(evento): devuelve SALIR para cerrar la pantalla,
+#    REDIBUJAR si cambió algo que se ve, o None si no pasó nada
+# --------------------------------------------------------------
+SALIR = "salir"
+REDIBUJAR = "redibujar"
+
+def bucle_escena(dibujar, manejar):
+    clock = pygame.time.Clock()
+    sucio = True
+
+    while True:
+        if sucio:
+            dibujar()
+            video.mostrar()
+            sucio = False
+
+            # Tope de cuadros: aunque lleguen muchos eventos seguidos
+            # no se redibuja más de FPS_MENU veces por segundo
+            clock.tick(config.FPS_MENU)
+
+        evento = pygame.event.wait()
+
+        if evento.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+
+        # Terminó de cargarse el audio en segundo plano
+        if evento.type == recursos.AUDIO_LISTO:
+            musica_lista()
+            continue
+
+        # La ventana se tapó/destapó o cambió de tamaño: hay que volver a pintarla
+        if evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+            sucio = True
+            continue
+
+        resultado = manejar(evento)
+        if resultado == SALIR:
+            return
+        if resultado == REDIBUJAR:
+            sucio = True
+
 # --------------------------------------------------------------
 # Muestra el ranking guardado en el archivo ranking.txt
 # Se puede volver con ESC
 # --------------------------------------------------------------
 def mostrar_ranking():
-    while True:
+
+    def dibujar():
         pantalla.fill((5, 5, 5))
 
         dibujar_texto("RANKING", fuente, BLANCO, ANCHO // 2, 80)
 
-        # Carga lista de [(nombre, puntos)]
-        datos = ranking.cargar_ranking()
+        # Los mejores 10 [(nombre, puntos)] (se leen de la vista en memoria)
+        datos = ranking.obtener_top(10)
 
         if len(datos) == 0:
             dibujar_texto("No hay puntuaciones guardadas", fuente_peque, BLANCO, ANCHO // 2, 300)
         else:
             y = 180
-            # Muestra solo los mejores 10
-            for nombre, puntos in datos[:10]:
+            for nombre, puntos in datos:
                 dibujar_texto(f"{nombre} - {puntos}", fuente_peque, BLANCO, ANCHO // 2, y)
                 y += 45
 
         dibujar_texto("ESC para volver", fuente_peque, BLANCO, ANCHO // 2, 550)
 
-        # Manejo de eventos
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if evento.type == pygame.KEYDOWN:
-                if evento.key == pygame.K_ESCAPE:
-                    return  # vuelve al menú
+    def manejar(evento):
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return SALIR  # vuelve al menú
 
-        pygame.display.flip()
+    bucle_escena(dibujar, manejar)
 
 # --------------------------------------------------------------
 # Submenú de opciones
@@ -115,7 +179,8 @@ def mostrar_ranking():
 #  3) Volver
 # --------------------------------------------------------------
 def menu_opciones():
-    while True:
+
+    def dibujar():
         pantalla.fill((20, 20, 20))
 
         dibujar_texto("OPCIONES", fuente, BLANCO, ANCHO // 2, 100)
@@ -123,140 +188,153 @@ def menu_opciones():
         dibujar_texto("2 - Selector de dificultad", fuente_peque, BLANCO, ANCHO // 2, 320)
         dibujar_texto("3 - Volver", fuente_peque, BLANCO, ANCHO // 2, 390)
 
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    def manejar(evento):
+        if evento.type == pygame.KEYDOWN:
 
-            if evento.type == pygame.KEYDOWN:
+            # Alternar sonido (el mixer se usa recién cuando terminó de cargarse)
+            if evento.key == pygame.K_1:
+                config.SONIDO_ACTIVO = not config.SONIDO_ACTIVO
+                recursos.esperar_audio()
+                audio.aplicar_volumen()
 
-                # Alternar sonido
-                if evento.key == pygame.K_1:
-                    config.SONIDO_ACTIVO = not config.SONIDO_ACTIVO
-                    vol = config.VOLUMEN if config.SONIDO_ACTIVO else 0.0
-                    if sonido_menu:
-                        sonido_menu.set_volume(vol)
+            # Abrir menú de dificultad (al volver hay que repintar)
+            if evento.key == pygame.K_2:
+                menu_dificultad()
+                return REDIBUJAR
 
-                # Abrir menú de dificultad
-                if evento.key == pygame.K_2:
-                    menu_dificultad()
+            # Volver
+            if evento.key == pygame.K_3:
+                return SALIR
 
-                # Volver
-                if evento.key == pygame.K_3:
-                    return
-
-        pygame.display.flip()
+    bucle_escena(dibujar, manejar)
 
 # --------------------------------------------------------------
 # Selector de dificultad
 # Cambia la variable global DIFICULTAD
+# Si hay tabla calibrada (calibrar.py) se vuelve a leer al entrar y
+# se muestra cuántas partidas gana un jugador promedio en cada una
 # --------------------------------------------------------------
 def menu_dificultad():
-    global DIFICULTAD
 
-    while True:
+    cargar_dificultades()
+
+    def opcion(texto, nombre):
+        medida = dificultades_medidas.get(nombre)
+        if medida is not None:
+            texto += f"  (se gana el {medida['victorias']:.0%})"
+        return texto
+
+    def dibujar():
         pantalla.fill((15, 15, 15))
 
         dibujar_texto("DIFICULTAD", fuente, BLANCO, ANCHO // 2, 100)
-        dibujar_texto("1 - Fácil", fuente_peque, BLANCO, ANCHO // 2, 240)
-        dibujar_texto("2 - Normal", fuente_peque, BLANCO, ANCHO // 2, 310)
-        dibujar_texto("3 - Difícil", fuente_peque, BLANCO, ANCHO // 2, 380)
+        dibujar_texto(opcion("1 - Fácil", "Facil"), fuente_peque, BLANCO, ANCHO // 2, 240)
+        dibujar_texto(opcion("2 - Normal", "Normal"), fuente_peque, BLANCO, ANCHO // 2, 310)
+        dibujar_texto(opcion("3 - Difícil", "Dificil"), fuente_peque, BLANCO, ANCHO // 2, 380)
         dibujar_texto("4 - Volver", fuente_peque, BLANCO, ANCHO // 2, 450)
 
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if evento.type == pygame.KEYDOWN:
-                # Cambia dificultad global
-                if evento.key == pygame.K_1:
-                    DIFICULTAD = "Facil"
-                    return
-                if evento.key == pygame.K_2:
-                    DIFICULTAD = "Normal"
-                    return
-                if evento.key == pygame.K_3:
-                    DIFICULTAD = "Dificil"
-                    return
-                if evento.key == pygame.K_4:
-                    return  # volver sin cambiar
-
-        pygame.display.flip()
+    def manejar(evento):
+        global DIFICULTAD
+
+        if evento.type == pygame.KEYDOWN:
+            # Cambia dificultad global
+            if evento.key == pygame.K_1:
+                DIFICULTAD = "Facil"
+                return SALIR
+            if evento.key == pygame.K_2:
+                DIFICULTAD = "Normal"
+                return SALIR
+            if evento.key == pygame.K_3:
+                DIFICULTAD = "Dificil"
+                return SALIR
+            if evento.key == pygame.K_4:
+                return SALIR  # volver sin cambiar
+
+    bucle_escena(dibujar, manejar)
 
 # --------------------------------------------------------------
 # Menú principal del juego
 # Contiene todas las opciones principales
 # --------------------------------------------------------------
+def dibujar_menu_principal():
+    pantalla.fill(NEGRO)
+
+    # Títulos y opciones
+    dibujar_texto("PONG", fuente, BLANCO, ANCHO // 2, 120)
+    dibujar_texto("1 - Jugar", fuente_peque, BLANCO, ANCHO // 2, 250)
+    dibujar_texto("2 - Opciones", fuente_peque, BLANCO, ANCHO // 2, 320)
+    dibujar_texto("3 - Score guardado / Ranking", fuente_peque, BLANCO, ANCHO // 2, 390)
+    dibujar_texto("4 - Créditos", fuente_peque, BLANCO, ANCHO // 2, 460)
+    dibujar_texto("5 - Salir", fuente_peque, BLANCO, ANCHO // 2, 530)
+
 def main_menu():
-    while True:
-        pantalla.fill(NEGRO)
-
-        # Títulos y opciones
-        dibujar_texto("PONG", fuente, BLANCO, ANCHO // 2, 120)
-        dibujar_texto("1 - Jugar", fuente_peque, BLANCO, ANCHO // 2, 250)
-        dibujar_texto("2 - Opciones", fuente_peque, BLANCO, ANCHO // 2, 320)
-        dibujar_texto("3 - Score guardado / Ranking", fuente_peque, BLANCO, ANCHO // 2, 390)
-        dibujar_texto("4 - Créditos", fuente_peque, BLANCO, ANCHO // 2, 460)
-        dibujar_texto("5 - Salir", fuente_peque, BLANCO, ANCHO // 2, 530)
-
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    if pantalla is None:
+        iniciar()
+
+    def manejar(evento):
+        global sonido_menu
 
-            if evento.type == pygame.KEYDOWN:
+        if evento.type == pygame.KEYDOWN:
 
-                # 1 - Iniciar juego
-                if evento.key == pygame.K_1:
-                    # Detiene música del menú antes de entrar al juego
-                    if sonido_menu:
-                        sonido_menu.stop()
+            # 1 - Iniciar juego
+            if evento.key == pygame.K_1:
+                # Si la música todavía se está cargando, se espera
+                # (si no, podría empezar a sonar durante el partido)
+                recursos.esperar_audio()
 
-                    # Ejecuta el juego usando la dificultad actual
-                    game.jugar(DIFICULTAD)
+                # El aviso AUDIO_LISTO puede estar todavía en la cola
+                # (y el partido lo descartaría): la música se busca acá
+                sonido_menu = recursos.sonido("menu.mp3")
 
-                    # Al volver del juego, si el sonido está activo, reproduce música del menú de nuevo
-                    if sonido_menu and config.SONIDO_ACTIVO:
-                        sonido_menu.play(-1)
+                # Detiene música del menú antes de entrar al juego
+                audio.detener("musica")
 
-                # 2 - Opciones
-                if evento.key == pygame.K_2:
-                    menu_opciones()
+                # Ejecuta el juego usando la dificultad actual
+                game.jugar(DIFICULTAD)
 
-                # 3 - Ranking
-                if evento.key == pygame.K_3:
-                    mostrar_ranking()
+                # Al volver del juego, si el sonido está activo, reproduce música del menú de nuevo
+                if config.SONIDO_ACTIVO:
+                    audio.reproducir("musica", sonido_menu, -1)
 
-                # 4 - Créditos
-                if evento.key == pygame.K_4:
-                    mostrar_creditos()
+                return REDIBUJAR
 
-                # 5 - Salir del juego
-                if evento.key == pygame.K_5:
-                    pygame.quit()
-                    sys.exit()
+            # 2 - Opciones
+            if evento.key == pygame.K_2:
+                menu_opciones()
+                return REDIBUJAR
 
-        pygame.display.flip()
+            # 3 - Ranking
+            if evento.key == pygame.K_3:
+                mostrar_ranking()
+                return REDIBUJAR
+
+            # 4 - Créditos
+            if evento.key == pygame.K_4:
+                mostrar_creditos()
+                return REDIBUJAR
+
+            # 5 - Salir del juego
+            if evento.key == pygame.K_5:
+                pygame.quit()
+                sys.exit()
+
+    bucle_escena(dibujar_menu_principal, manejar)
 
 # --------------------------------------------------------------
 # Pantalla de créditos
 # --------------------------------------------------------------
 def mostrar_creditos():
-    while True:
+
+    def dibujar():
         pantalla.fill((10, 10, 10))
 
         dibujar_texto("CRÉDITOS", fuente, BLANCO, ANCHO // 2, 100)
         dibujar_texto("Juego creado por Julián", fuente_peque, BLANCO, ANCHO // 2, 260)
         dibujar_texto("ESC para volver", fuente_peque, BLANCO, ANCHO // 2, 400)
 
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if evento.type == pygame.KEYDOWN:
-                if evento.key == pygame.K_ESCAPE:
-                    return  # vuelve al menú principal
+    def manejar(evento):
+        if evento.type == pygame.KEYDOWN:
+            if evento.key == pygame.K_ESCAPE:
+                return SALIR  # vuelve al menú principal
 
-        pygame.display.flip()
+    bucle_escena(dibujar, manejar)
@@ -0,0 +1,592 @@
+# motor.py
+# --------------------------------------------------------------
+# Motor de simulación del Pong, SIN pygame.
+#
+# Contiene solo las reglas del juego (movimiento, rebotes, puntos,
+# IA y victoria). No carga imágenes ni reproduce sonidos: cada paso
+# devuelve una lista de "eventos" (rebote, punto, victoria) y es el
+# que dibuja o hace sonar el juego (game.py) el que decide qué hacer.
+#
+# Así la física se puede correr sin ventana y mucho más rápido que
+# clock.tick(FPS): en pruebas, simulaciones en lote, etc.
+# --------------------------------------------------------------
+
+import json
+import os
+import random
+
+# --------------------------------------------------------------
+# CONSTANTES
+# --------------------------------------------------------------
+
+VENTANA_HORI = 800
+VENTANA_VERTI = 600
+
+# Las velocidades están pensadas en pixeles por tick a TICKS_BASE ticks
+# por segundo. Si la física corre a otra frecuencia, cada movimiento se
+# escala para que el juego tenga la misma velocidad en pantalla.
+TICKS_BASE = 60
+
+# Puntos necesarios para ganar la partida
+PUNTOS_VICTORIA = 7
+
+# Velocidad de la raqueta manejada por una persona (pixeles por tick)
+VEL_JUGADOR = 5
+
+# Tamaño de la pelota (la imagen se achica a 30x30)
+PELOTA_ANCHO = 30
+PELOTA_ALTO = 30
+
+# Tamaño de assets/raqueta.png
+RAQUETA_ANCHO = 22
+RAQUETA_ALTO = 136
+
+# Distancia de cada raqueta al borde de la pantalla
+MARGEN_RAQUETA = 60
+
+# Colisión continua: máximo de choques que se resuelven en un mismo tick
+MAX_IMPACTOS = 8
+
+# Dificultades: nombre → (ia_vel, velocidad_base, vel_jugador).
+# Son los valores de fábrica; calibrar.py mide otros contra un jugador
+# simulado y cargar_dificultades() los reemplaza al iniciar el juego.
+DIFICULTADES = {
+    "Facil": (3, 4, VEL_JUGADOR),
+    "Normal": (5, 6, VEL_JUGADOR),
+    "Dificil": (7, 7, VEL_JUGADOR),
+}
+
+# IA predictiva (ver IAPredictiva): nombre → (reacción en segundos,
+# error en pixeles). Cuanto más tarda en reaccionar y más se equivoca
+# al calcular dónde llega la pelota, más fácil es ganarle.
+PERFILES_IA = {
+    "Facil": (0.30, 60),
+    "Normal": (0.18, 40),
+    "Dificil": (0.08, 20),
+}
+
+# --------------------------------------------------------------
+# EVENTOS
+# Cada evento es una tupla (tipo, lado).
+# --------------------------------------------------------------
+
+EV_REBOTE_PARED = "rebote_pared"      # lado = None
+EV_REBOTE_RAQUETA = "rebote_raqueta"  # lado = quién pegó
+EV_PUNTO = "punto"                    # lado = quién hizo el punto
+EV_VICTORIA = "victoria"              # lado = quién ganó
+
+JUGADOR = "jugador"
+IA = "ia"
+
+
+# --------------------------------------------------------------
+# PELOTA
+# --------------------------------------------------------------
+class Pelota:
+    # __slots__: atributos fijos, sin diccionario por objeto
+    __slots__ = ("rng", "ancho", "alto", "x", "y", "dir_x", "dir_y", "puntuacion", "puntuacion_ia")
+
+    def __init__(self, rng=random):
+
+        # Generador de números al azar (permite partidas reproducibles)
+        self.rng = rng
+
+        self.ancho = PELOTA_ANCHO
+        self.alto = PELOTA_ALTO
+
+        # Posición inicial al centro
+        self.x = VENTANA_HORI / 2 - self.ancho / 2
+        self.y = VENTANA_VERTI / 2 - self.alto / 2
+
+        # Movimiento inicial random
+        self.dir_x = rng.choice([-5, 5])
+        self.dir_y = rng.choice([-5, 5])
+
+        # Puntajes
+        self.puntuacion = 0
+        self.puntuacion_ia = 0
+
+    # Mueve la pelota un tick (escala: ver TICKS_BASE)
+    def mover(self, escala=1):
+        self.x += self.dir_x * escala
+        self.y += self.dir_y * escala
+
+    # Revisa rebotes y puntos, agregando los eventos que ocurran
+    def rebotar(self, eventos):
+
+        self.revisar_puntos(eventos)
+
+        # Rebotes arriba/abajo
+        if self.y <= 0 or self.y + self.alto >= VENTANA_VERTI:
+            self.dir_y = -self.dir_y
+            eventos.append((EV_REBOTE_PARED, None))
+
+    # Si la pelota salió por un costado, suma el punto y la reinicia
+    def revisar_puntos(self, eventos):
+
+        # Si sale por la izquierda → punto para IA
+        if self.x <= 0:
+            self.reiniciar()
+            self.puntuacion_ia += 1
+            eventos.append((EV_PUNTO, IA))
+
+        # Si sale por la derecha → punto para jugador
+        if self.x + self.ancho >= VENTANA_HORI:
+            self.reiniciar()
+            self.puntuacion += 1
+            eventos.append((EV_PUNTO, JUGADOR))
+
+    # Mueve la pelota un tick con colisión continua ("barrida"):
+    # calcula en qué momento exacto del tick toca una pared o una
+    # raqueta, rebota ahí y sigue con el tiempo que le queda.
+    # Así no atraviesa nada aunque vaya muy rápido o los ticks sean largos.
+    def barrer(self, escala, raquetas, eventos):
+        restante = 1.0
+
+        for _ in range(MAX_IMPACTOS):
+            vx = self.dir_x * escala * restante
+            vy = self.dir_y * escala * restante
+
+            # Momento del primer choque (0 a 1 del tiempo restante)
+            t_choque = 1.0
+            raqueta_choque = None
+            pared = False
+
+            # Paredes de arriba y abajo
+            if vy < 0:
+                t = -self.y / vy
+            elif vy > 0:
+                t = (VENTANA_VERTI - self.alto - self.y) / vy
+            else:
+                t = 1.0
+            if 0 <= t < t_choque:
+                t_choque = t
+                pared = True
+
+            # Cara de cada raqueta que mira hacia la pelota
+            for raqueta in raquetas:
+                if vx < 0 and self.x >= raqueta.x + raqueta.ancho:
+                    t = (raqueta.x + raqueta.ancho - self.x) / vx
+                elif vx > 0 and self.x + self.ancho <= raqueta.x:
+                    t = (raqueta.x - self.x - self.ancho) / vx
+                else:
+                    continue
+                if not 0 <= t < t_choque:
+                    continue
+
+                # ¿En ese momento la pelota está a la altura de la raqueta?
+                y = self.y + vy * t
+                if y + self.alto > raqueta.y and y < raqueta.y + raqueta.alto:
+                    t_choque = t
+                    raqueta_choque = raqueta
+                    pared = False
+
+            self.x += vx * t_choque
+            self.y += vy * t_choque
+
+            if raqueta_choque is not None:
+                self.dir_x = -self.dir_x
+                eventos.append((EV_REBOTE_RAQUETA, raqueta_choque.lado))
+            elif pared:
+                self.dir_y = -self.dir_y
+                eventos.append((EV_REBOTE_PARED, None))
+            else:
+                return  # recorrió todo el tick sin chocar
+
+            restante *= 1.0 - t_choque
+            if restante <= 0:
+                return
+
+    # Reinicia pelota tras un punto
+    def reiniciar(self):
+        self.x = VENTANA_HORI / 2 - self.ancho / 2
+        self.y = VENTANA_VERTI / 2 - self.alto / 2
+
+        # Invierte la dirección para variar
+        self.dir_x = -self.dir_x
+        self.dir_y = self.rng.choice([-5, 5])
+
+
+# --------------------------------------------------------------
+# RAQUETA
+# --------------------------------------------------------------
+class Raqueta:
+    __slots__ = ("ancho", "alto", "x", "y", "dir_y", "lado")
+
+    def __init__(self, x=0, lado=JUGADOR):
+
+        self.ancho = RAQUETA_ANCHO
+        self.alto = RAQUETA_ALTO
+
+        # Posición inicial a mitad de pantalla
+        self.x = x
+        self.y = VENTANA_VERTI / 2 - self.alto / 2
+
+        self.dir_y = 0
+
+        # Se usa para indicar quién pegó en los eventos de rebote
+        self.lado = lado
+
+    # Mover raqueta manejada por una persona
+    def mover(self, escala=1):
+        self.y += self.dir_y * escala
+
+        # Limites de pantalla
+        if self.y <= 0:
+            self.y = 0
+        if self.y + self.alto >= VENTANA_VERTI:
+            self.y = VENTANA_VERTI - self.alto
+
+    # Mover raqueta de la IA (persigue la altura de la pelota)
+    def mover_ia(self, pelota, velocidad, escala=1):
+        if self.y > pelota.y:
+            self.dir_y = -velocidad
+        elif self.y < pelota.y:
+            self.dir_y = velocidad
+        else:
+            self.dir_y = 0
+
+        self.y += self.dir_y * escala
+
+    # ¿La pelota se superpone con la raqueta? (choque de rectángulos)
+    def toca(self, pelota):
+        return (
+            pelota.x < self.x + self.ancho
+            and pelota.x + pelota.ancho > self.x
+            and pelota.y + pelota.alto > self.y
+            and pelota.y < self.y + self.alto
+        )
+
+    # Detecta colisión con la pelota
+    def colision(self, pelota, eventos):
+
+        if self.toca(pelota):
+            pelota.dir_x = -pelota.dir_x
+
+            # Evita múltiples colisiones seguidas
+            if pelota.x < VENTANA_HORI / 2:
+                pelota.x = self.x + self.ancho
+            else:
+                pelota.x = self.x - pelota.ancho
+
+            eventos.append((EV_REBOTE_RAQUETA, self.lado))
+
+
+# --------------------------------------------------------------
+# ENTRADAS DE UN TICK
+# dir_1 → raqueta del jugador: -1 (arriba), 0 (quieta), 1 (abajo),
+#         o None para que también la maneje una IA (IA contra IA)
+# dir_2 → raqueta derecha: None si la maneja la IA, o -1/0/1
+# --------------------------------------------------------------
+class Entradas:
+    __slots__ = ("dir_1", "dir_2")
+
+    def __init__(self, dir_1=0, dir_2=None):
+        self.dir_1 = dir_1
+        self.dir_2 = dir_2
+
+
+# --------------------------------------------------------------
+# ESTADO COMPLETO DE UNA PARTIDA
+# --------------------------------------------------------------
+class Estado:
+    __slots__ = ("rng", "ia_vel", "velocidad_base", "vel_jugador", "ticks_por_segundo", "escala",
+                 "continua", "pelota", "raqueta_1", "raqueta_2", "raquetas", "ia", "ia_vel_1",
+                 "ia_1", "tick", "ganador")
+
+    def __init__(self, ia_vel, velocidad_base, semilla=None, ticks_por_segundo=TICKS_BASE, continua=False,
+                 vel_jugador=VEL_JUGADOR):
+
+        # Cada partida tiene su propio generador: con la misma semilla
+        # y las mismas entradas la partida se repite igual
+        self.rng = random.Random(semilla)
+
+        self.ia_vel = ia_vel
+        self.velocidad_base = velocidad_base
+
+        # Velocidad de las raquetas que se manejan con el teclado
+        self.vel_jugador = vel_jugador
+
+        # Cuánto avanza cada tick respecto de un tick a TICKS_BASE
+        self.ticks_por_segundo = ticks_por_segundo
+        self.escala = TICKS_BASE / ticks_por_segundo
+
+        # True → colisión continua (ver Pelota.barrer); False → las reglas
+        # originales: mover y después revisar si se superponen
+        self.continua = continua
+
+        self.pelota = Pelota(self.rng)
+
+        # Ajusta velocidad real de la pelota según la dificultad
+        pelota = self.pelota
+        pelota.dir_x = velocidad_base if pelota.dir_x > 0 else -velocidad_base
+        pelota.dir_y = velocidad_base if pelota.dir_y > 0 else -velocidad_base
+
+        # Raqueta jugador (izquierda) y raqueta IA (derecha)
+        self.raqueta_1 = Raqueta(MARGEN_RAQUETA, JUGADOR)
+        self.raqueta_2 = Raqueta(VENTANA_HORI - MARGEN_RAQUETA - RAQUETA_ANCHO, IA)
+        self.raquetas = (self.raqueta_1, self.raqueta_2)
+
+        # IA de la raqueta derecha: None → la de siempre (Raqueta.mover_ia),
+        # o una IAPredictiva (ver nuevo_estado)
+        self.ia = None
+
+        # Lo mismo para la raqueta izquierda, usado cuando Entradas.dir_1
+        # es None (partidas IA contra IA)
+        self.ia_vel_1 = ia_vel
+        self.ia_1 = None
+
+        self.tick = 0
+        self.ganador = None
+
+        self.reiniciar_partida()
+
+    # Pone el marcador en 0 y la pelota al centro ("Reintentar")
+    def reiniciar_partida(self):
+        self.pelota.puntuacion = 0
+        self.pelota.puntuacion_ia = 0
+        self.pelota.reiniciar()
+        self.ganador = None
+
+    # Posiciones que se dibujan: (pelota x, pelota y, raqueta 1 y, raqueta 2 y)
+    def posiciones(self):
+        return (self.pelota.x, self.pelota.y, self.raqueta_1.y, self.raqueta_2.y)
+
+
+def parametros(dificultad):
+    """(ia_vel, velocidad_base, vel_jugador) de una dificultad ("Dificil" si no existe)."""
+    return DIFICULTADES.get(dificultad, DIFICULTADES["Dificil"])
+
+
+def cargar_dificultades(ruta):
+    """
+    Reemplaza los valores de DIFICULTADES por los de la tabla que
+    escribe calibrar.py. Devuelve {nombre: datos de la calibración}
+    con las dificultades que se cargaron ({} si no hay tabla o no sirve).
+    Las que no llegaron a su objetivo ("aceptado": false, escritas con
+    calibrar.py --forzar) no se cargan: siguen los valores de antes.
+    """
+    if not os.path.exists(ruta):
+        return {}
+
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            tabla = json.load(f)["dificultades"]
+        tabla = {nombre: datos for nombre, datos in tabla.items() if datos.get("aceptado", True)}
+        nuevas = {
+            nombre: (datos["ia_vel"], datos["velocidad_base"], datos["vel_jugador"])
+            for nombre, datos in tabla.items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        print("No se pudo leer la tabla de dificultades:", ruta, e)
+        return {}
+
+    DIFICULTADES.update(nuevas)
+    return tabla
+
+
+def nuevo_estado(dificultad, semilla=None, ticks_por_segundo=TICKS_BASE, continua=False,
+                 ia_predictiva=False, valores=None):
+    """
+    Crea el estado inicial de una partida para la dificultad indicada
+    ("Facil", "Normal" o "Dificil"; cualquier otra se toma como "Dificil").
+    Con ia_predictiva=True la raqueta derecha usa IAPredictiva con el
+    perfil de PERFILES_IA de esa dificultad.
+    valores: (ia_vel, velocidad_base, vel_jugador) a usar en vez de los
+    de DIFICULTADES (por ejemplo los guardados en una repetición).
+    """
+    ia_vel, velocidad_base, vel_jugador = valores or parametros(dificultad)
+    estado = Estado(ia_vel, velocidad_base, semilla, ticks_por_segundo, continua, vel_jugador)
+
+    if ia_predictiva:
+        reaccion, error = PERFILES_IA.get(dificultad, PERFILES_IA["Dificil"])
+        # Sorteos propios, derivados de la semilla de la partida
+        rng = random.Random(estado.rng.getrandbits(32))
+        estado.ia = IAPredictiva(reaccion, error, rng, ticks_por_segundo)
+
+    return estado
+
+
+# --------------------------------------------------------------
+# IA PREDICTIVA
+# En vez de perseguir la pelota tick a tick, calcula de una vez
+# dónde va a cruzar la pelota la línea de la raqueta y va hacia ahí.
+# --------------------------------------------------------------
+
+def predecir_y(x, y, dir_x, dir_y, plano_x, alto=PELOTA_ALTO):
+    """
+    Y de la pelota cuando su x llegue a plano_x, sin simular tick a tick.
+
+    Los rebotes en las paredes se "despliegan": la pelota sigue en línea
+    recta como si la pantalla se repitiera espejada hacia arriba y hacia
+    abajo, y al final se vuelve a doblar la y al rango [0, alto útil].
+    Funciona igual con números o con arreglos de NumPy.
+    """
+    recorrido = VENTANA_VERTI - alto
+    t = (plano_x - x) / dir_x
+    y_libre = (y + dir_y * t) % (2 * recorrido)
+    return recorrido - abs(y_libre - recorrido)
+
+
+class IAPredictiva:
+    """
+    Maneja una raqueta anticipando la pelota.
+
+    El objetivo se recalcula solo cuando la pelota cambia de sentido
+    (un golpe o un punto), así que cada tick cuesta lo mismo sin
+    importar la velocidad de la pelota. La dificultad sale de:
+      - reaccion: segundos que tarda en darse cuenta del cambio
+      - error: desvío típico (pixeles) de la altura que calcula
+    """
+
+    __slots__ = ("reaccion", "error", "rng", "ticks_reaccion", "dir_vista", "espera",
+                 "pendiente", "objetivo", "calculos")
+
+    def __init__(self, reaccion, error, rng=random, ticks_por_segundo=TICKS_BASE):
+        self.reaccion = reaccion
+        self.error = error
+        self.rng = rng
+        self.ticks_reaccion = round(reaccion * ticks_por_segundo)
+
+        # dir_x de la pelota la última vez que se miró
+        self.dir_vista = None
+        self.espera = 0
+        self.pendiente = False
+
+        # Altura a la que quiere llevar el centro de la raqueta
+        self.objetivo = VENTANA_VERTI / 2
+
+        # Cuántas veces calculó la trayectoria (para pruebas)
+        self.calculos = 0
+
+    def mover(self, raqueta, pelota, velocidad, escala=1):
+        # La pelota cambió de sentido: hay que recalcular (después de reaccionar)
+        if pelota.dir_x != self.dir_vista:
+            self.dir_vista = pelota.dir_x
+            self.espera = self.ticks_reaccion
+            self.pendiente = True
+
+        if self.pendiente:
+            if self.espera > 0:
+                self.espera -= 1
+            else:
+                self.objetivo = self.calcular_objetivo(raqueta, pelota)
+                self.pendiente = False
+
+        # Va hacia el objetivo sin pasarse
+        maximo = velocidad * escala
+        paso = max(-maximo, min(maximo, self.objetivo - (raqueta.y + raqueta.alto / 2)))
+        raqueta.dir_y = paso / escala
+        raqueta.y = max(0, min(VENTANA_VERTI - raqueta.alto, raqueta.y + paso))
+
+    def calcular_objetivo(self, raqueta, pelota):
+        self.calculos += 1
+
+        # Si la pelota se aleja, vuelve al centro a esperar
+        if (pelota.dir_x > 0) != (raqueta.x > pelota.x):
+            return VENTANA_VERTI / 2
+
+        # X de la pelota en el momento de tocar la cara de la raqueta
+        if pelota.dir_x > 0:
+            plano_x = raqueta.x - pelota.ancho
+        else:
+            plano_x = raqueta.x + raqueta.ancho
+
+        y = predecir_y(pelota.x, pelota.y, pelota.dir_x, pelota.dir_y, plano_x, pelota.alto)
+        return y + pelota.alto / 2 + self.rng.gauss(0, self.error)
+
+
+# --------------------------------------------------------------
+# PASO DE SIMULACIÓN
+# --------------------------------------------------------------
+
+# Mueve la raqueta del jugador y la de la IA (o la segunda entrada).
+# Una dirección None significa que esa raqueta la maneja una IA.
+def mover_raquetas(estado, entradas):
+    escala = estado.escala
+    raqueta_1 = estado.raqueta_1
+    raqueta_2 = estado.raqueta_2
+
+    if entradas.dir_1 is None:
+        if estado.ia_1 is not None:
+            estado.ia_1.mover(raqueta_1, estado.pelota, estado.ia_vel_1, escala)
+        else:
+            raqueta_1.mover_ia(estado.pelota, estado.ia_vel_1, escala)
+    else:
+        raqueta_1.dir_y = entradas.dir_1 * estado.vel_jugador
+        raqueta_1.mover(escala)
+
+    if entradas.dir_2 is None:
+        if estado.ia is not None:
+            estado.ia.mover(raqueta_2, estado.pelota, estado.ia_vel, escala)
+        else:
+            raqueta_2.mover_ia(estado.pelota, estado.ia_vel, escala)
+    else:
+        raqueta_2.dir_y = entradas.dir_2 * estado.vel_jugador
+        raqueta_2.mover(escala)
+
+
+def step(estado, entradas, eventos=None):
+    """
+    Avanza la partida un tick y devuelve la lista de eventos ocurridos.
+
+    eventos: lista a reusar (se vacía y se llena con los eventos de este
+    tick); así el loop del juego no crea una lista nueva por tick.
+
+    El orden es el mismo que usaba el loop original del juego:
+    mover pelota, rebotes/puntos, mover raquetas, colisiones y, al
+    final, revisar si alguien llegó a PUNTOS_VICTORIA.
+
+    Con estado.continua primero se mueven las raquetas y después la
+    pelota se "barre" contra paredes y raquetas (Pelota.barrer).
+
+    Una vez que hay ganador, step() no hace nada hasta reiniciar_partida().
+    """
+
+    if eventos is None:
+        eventos = []
+    else:
+        eventos.clear()
+
+    if estado.ganador is not None:
+        return eventos
+
+    pelota = estado.pelota
+    raqueta_1 = estado.raqueta_1
+    raqueta_2 = estado.raqueta_2
+
+    escala = estado.escala
+
+    if estado.continua:
+        mover_raquetas(estado, entradas)
+
+        # Si una raqueta se metió encima de la pelota, se resuelve
+        # como siempre; después se barre el movimiento de la pelota
+        for raqueta in estado.raquetas:
+            if raqueta.toca(pelota):
+                raqueta.colision(pelota, eventos)
+
+        pelota.barrer(escala, estado.raquetas, eventos)
+        pelota.revisar_puntos(eventos)
+
+    else:
+        # Movimiento y colisiones
+        pelota.mover(escala)
+        pelota.rebotar(eventos)
+
+        mover_raquetas(estado, entradas)
+
+        raqueta_1.colision(pelota, eventos)
+        raqueta_2.colision(pelota, eventos)
+
+    estado.tick += 1
+
+    # Ganar o perder
+    if pelota.puntuacion >= PUNTOS_VICTORIA:
+        estado.ganador = JUGADOR
+        eventos.append((EV_VICTORIA, JUGADOR))
+    elif pelota.puntuacion_ia >= PUNTOS_VICTORIA:
+        estado.ganador = IA
+        eventos.append((EV_VICTORIA, IA))
+
+    return eventos
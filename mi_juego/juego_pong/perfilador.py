@@ -0,0 +1,371 @@
+# perfilador.py
+# --------------------------------------------------------------
+# Mide cuánto tarda cada parte de un cuadro del partido:
+# leer eventos, física, textos, HUD, blits, mandar a la pantalla
+# (flip / update) y la espera de clock.tick.
+#
+# Uso en el loop:
+#   perfil.empezar_cuadro()
+#   ... leer eventos ...   perfil.marcar("eventos")
+#   ... física ...         perfil.marcar("fisica")
+#   ...
+# marcar(fase) le asigna a esa fase el tiempo que pasó desde la
+# marca anterior.
+#
+# De cada fase se guardan los últimos cuadros y se calculan los
+# percentiles p50 / p95 / p99. render.py también le pasa cuántos
+# pixeles mandó a la pantalla en cada cuadro (contar_pixeles). Se pueden ver en pantalla (HUD) y
+# exportar a JSON (formato "Chrome trace", se abre con
+# chrome://tracing o https://ui.perfetto.dev) o a CSV.
+#
+# Apagado (activo=False) cada llamada solo revisa un booleano.
+#
+# MedidorMemoria es el modo "presupuesto de memoria": cuenta cuánta
+# memoria se reserva en cada cuadro (tracemalloc), cuántas veces
+# corre el recolector de basura (gc) y cuánto frena el juego, y qué
+# líneas del código son las que más memoria nueva dejan.
+#
+# SondaLatencia mide cuánto pasa desde que se lee una tecla de
+# movimiento hasta que se muestra el primer cuadro que la refleja.
+# --------------------------------------------------------------
+
+import csv
+import gc
+import json
+import time
+import tracemalloc
+from collections import deque
+
+# Fases en el orden en que pasan dentro de un cuadro
+FASES = ("eventos", "fisica", "texto", "hud", "blit", "flip", "espera")
+
+# Cada cuánto se vuelve a dibujar el texto del HUD (segundos)
+REFRESCO_HUD = 0.5
+
+
+class Perfilador:
+    """
+    activo: si mide o no (se puede cambiar en cualquier momento).
+    ventana: cuántos cuadros entran en los percentiles.
+    max_cuadros: cuántos cuadros se guardan para exportar.
+    """
+
+    def __init__(self, activo=False, ventana=300, max_cuadros=20000):
+        self.activo = activo
+        self.hud = False
+
+        # fase → duraciones (segundos) de los últimos "ventana" cuadros
+        self.historial = {fase: deque(maxlen=ventana) for fase in FASES + ("cuadro",)}
+
+        # Pixeles mandados a la pantalla en los últimos "ventana" cuadros
+        self.pixeles = deque(maxlen=ventana)
+
+        # Cuadros para exportar: (número, inicio, [(fase, inicio, duración), ...])
+        self.traza = deque(maxlen=max_cuadros)
+
+        self.cuadros = 0
+        self._origen = time.perf_counter()
+        self._inicio = None
+        self._ultima = None
+        self._fases = []
+
+        # HUD ya dibujado y cuándo se dibujó
+        self._superficie_hud = None
+        self._momento_hud = 0.0
+
+    # ----------------------------------------------------------
+    # MEDICIÓN
+    # ----------------------------------------------------------
+
+    def empezar_cuadro(self):
+        if not self.activo:
+            return
+
+        ahora = time.perf_counter()
+        if self._inicio is not None:
+            self._cerrar_cuadro(ahora)
+
+        self._inicio = self._ultima = ahora
+        self._fases = []
+
+    def marcar(self, fase):
+        if not self.activo or self._inicio is None:
+            return
+
+        ahora = time.perf_counter()
+        self._fases.append((fase, self._ultima, ahora - self._ultima))
+        self._ultima = ahora
+
+    def _cerrar_cuadro(self, ahora):
+        por_fase = dict.fromkeys(FASES, 0.0)
+        for fase, _, duracion in self._fases:
+            por_fase[fase] = por_fase.get(fase, 0.0) + duracion
+
+        for fase, duracion in por_fase.items():
+            if fase in self.historial:
+                self.historial[fase].append(duracion)
+        self.historial["cuadro"].append(ahora - self._inicio)
+
+        self.traza.append((self.cuadros, self._inicio, self._fases))
+        self.cuadros += 1
+
+    def contar_pixeles(self, pixeles):
+        if self.activo:
+            self.pixeles.append(pixeles)
+
+    # Al prender / apagar a mitad de partida no se mezcla un cuadro cortado
+    def alternar(self):
+        self.activo = not self.activo
+        self._inicio = None
+
+    # ----------------------------------------------------------
+    # RESULTADOS
+    # ----------------------------------------------------------
+
+    def percentiles(self, fase):
+        """(p50, p95, p99) en milisegundos de los últimos cuadros."""
+        valores = sorted(self.historial[fase])
+        if not valores:
+            return (0.0, 0.0, 0.0)
+        ultimo = len(valores) - 1
+        return tuple(valores[round(p * ultimo)] * 1000 for p in (0.50, 0.95, 0.99))
+
+    def lineas(self):
+        lineas = [f"{'fase':<8} {'p50':>6} {'p95':>6} {'p99':>6} ms"]
+        for fase in FASES + ("cuadro",):
+            p50, p95, p99 = self.percentiles(fase)
+            lineas.append(f"{fase:<8} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        if self.pixeles:
+            valores = sorted(self.pixeles)
+            ultimo = len(valores) - 1
+            p50, p95, p99 = (valores[round(p * ultimo)] / 1000 for p in (0.50, 0.95, 0.99))
+            lineas.append(f"{'pixeles':<8} {p50:6.1f} {p95:6.1f} {p99:6.1f} miles")
+        return lineas
+
+    def superficie_hud(self, fuente, color=(255, 255, 0), fondo=(0, 0, 0)):
+        """
+        Devuelve una superficie con la tabla de percentiles.
+        Se vuelve a dibujar como mucho cada REFRESCO_HUD segundos: mientras
+        tanto es la MISMA superficie (el render "sucio" no la redibuja).
+        """
+        ahora = time.perf_counter()
+        if self._superficie_hud is None or ahora - self._momento_hud >= REFRESCO_HUD:
+            import pygame
+
+            renglones = [fuente.render(linea, True, color, fondo) for linea in self.lineas()]
+            alto = fuente.get_linesize()
+            ancho = max(r.get_width() for r in renglones)
+
+            superficie = pygame.Surface((ancho + 8, alto * len(renglones) + 8))
+            superficie.fill(fondo)
+            for i, renglon in enumerate(renglones):
+                superficie.blit(renglon, (4, 4 + i * alto))
+
+            self._superficie_hud = superficie
+            self._momento_hud = ahora
+        return self._superficie_hud
+
+    # ----------------------------------------------------------
+    # EXPORTAR
+    # ----------------------------------------------------------
+
+    def exportar(self, ruta):
+        """
+        Guarda los cuadros medidos en ruta: CSV si termina en .csv,
+        si no JSON en formato Chrome trace. Devuelve cuántos cuadros guardó.
+        """
+        if ruta.lower().endswith(".csv"):
+            self._exportar_csv(ruta)
+        else:
+            self._exportar_chrome(ruta)
+        return len(self.traza)
+
+    def _microsegundos(self, t):
+        return round((t - self._origen) * 1_000_000, 1)
+
+    def _exportar_chrome(self, ruta):
+        eventos = []
+        for numero, inicio, fases in self.traza:
+            if fases:
+                fin = fases[-1][1] + fases[-1][2]
+                eventos.append({
+                    "name": f"cuadro {numero}", "cat": "cuadro", "ph": "X",
+                    "ts": self._microsegundos(inicio),
+                    "dur": round((fin - inicio) * 1_000_000, 1),
+                    "pid": 1, "tid": 1,
+                })
+            for fase, comienzo, duracion in fases:
+                eventos.append({
+                    "name": fase, "cat": "fase", "ph": "X",
+                    "ts": self._microsegundos(comienzo),
+                    "dur": round(duracion * 1_000_000, 1),
+                    "pid": 1, "tid": 1,
+                })
+
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f)
+
+    def _exportar_csv(self, ruta):
+        with open(ruta, "w", encoding="utf-8", newline="") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(["cuadro", "fase", "inicio_ms", "duracion_ms"])
+            for numero, _, fases in self.traza:
+                for fase, comienzo, duracion in fases:
+                    escritor.writerow([
+                        numero,
+                        fase,
+                        f"{(comienzo - self._origen) * 1000:.3f}",
+                        f"{duracion * 1000:.3f}",
+                    ])
+
+
+class MedidorMemoria:
+    """
+    Mide la memoria reservada y las pausas del recolector de basura
+    cuadro a cuadro. Es caro (tracemalloc frena bastante el juego):
+    solo para buscar qué reserva memoria en el loop.
+
+    calentamiento: cuadros que no se cuentan (el primer cuadro carga
+    fuentes, textos, etc.).
+    """
+
+    def __init__(self, calentamiento=120, lugares=10):
+        self.calentamiento = calentamiento
+        self.lugares = lugares
+
+        self.cuadros = 0
+
+        # Por cuadro medido: bytes de pico sobre el inicio del cuadro
+        # y bytes que quedaron reservados al terminarlo
+        self.picos = []
+        self.netos = []
+
+        # Pausas del gc: (segundos, generación, cuadro)
+        self.pausas = []
+        self._inicio_gc = None
+
+        self._base = None
+        self._foto = None
+
+        tracemalloc.start()
+        gc.callbacks.append(self._avisar_gc)
+
+    def _avisar_gc(self, fase, info):
+        if fase == "start":
+            self._inicio_gc = time.perf_counter()
+        elif self._inicio_gc is not None:
+            self.pausas.append((time.perf_counter() - self._inicio_gc, info["generation"], self.cuadros))
+            self._inicio_gc = None
+
+    # Llamar una vez por cuadro, al empezarlo
+    def cuadro(self):
+        actual, pico = tracemalloc.get_traced_memory()
+
+        if self._base is not None and self.cuadros > self.calentamiento:
+            self.picos.append(pico - self._base)
+            self.netos.append(actual - self._base)
+
+        self.cuadros += 1
+        if self.cuadros == self.calentamiento:
+            self._foto = self._sacar_foto()
+
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+
+    def _sacar_foto(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            # (los filtros usan fnmatch y re: no contar lo que reservan ellos)
+            tracemalloc.Filter(False, "*/fnmatch.py"),
+            tracemalloc.Filter(False, "*/re/*"),
+        ))
+
+    def terminar(self):
+        """Deja de medir y devuelve el reporte (lista de líneas)."""
+        lineas = self.reporte()
+        gc.callbacks.remove(self._avisar_gc)
+        tracemalloc.stop()
+        return lineas
+
+    def reporte(self):
+        medidos = len(self.picos)
+        lineas = [f"Memoria: {medidos} cuadros medidos (sin contar {self.calentamiento} de calentamiento)"]
+        if not medidos:
+            return lineas
+
+        picos = sorted(self.picos)
+        lineas.append(
+            f"  reservado por cuadro: p50 {picos[medidos // 2]} B, "
+            f"p99 {picos[round(0.99 * (medidos - 1))]} B, máx {picos[-1]} B"
+        )
+        lineas.append(f"  queda reservado por cuadro: {sum(self.netos) / medidos:+.1f} B promedio")
+
+        pausas = [p for p in self.pausas if p[2] > self.calentamiento]
+        por_generacion = [0, 0, 0]
+        for _, generacion, _ in pausas:
+            por_generacion[generacion] += 1
+        maxima = max((p[0] for p in pausas), default=0.0)
+        lineas.append(
+            f"  gc: {len(pausas)} pasadas (gen0 {por_generacion[0]}, gen1 {por_generacion[1]}, "
+            f"gen2 {por_generacion[2]}), pausa máx {maxima * 1000:.2f} ms"
+        )
+
+        # Líneas que más memoria nueva dejaron desde el calentamiento
+        if self._foto is not None:
+            diferencias = self._sacar_foto().compare_to(self._foto, "lineno")
+            diferencias = [d for d in diferencias if d.size_diff > 0 or d.count_diff > 0]
+            if diferencias:
+                lineas.append("  lugares con más memoria nueva:")
+            for d in diferencias[:self.lugares]:
+                lugar = d.traceback[0]
+                lineas.append(
+                    f"    {lugar.filename}:{lugar.lineno}  {d.size_diff / medidos:+.1f} B/cuadro, "
+                    f"{d.count_diff:+d} bloques"
+                )
+        return lineas
+
+
+class SondaLatencia:
+    """
+    Latencia de entrada: desde que el loop lee un cambio de W/S hasta
+    que termina de mandar a la pantalla el primer cuadro simulado con
+    esa entrada. No incluye lo que tarda el sistema en entregar el
+    evento ni el retardo propio del monitor.
+    """
+
+    def __init__(self):
+        self.muestras = []
+        self._desde = None
+        self._simulado = False
+
+    # Se leyó una entrada nueva (si ya había una esperando, cuenta la primera)
+    def entrada(self):
+        if self._desde is None:
+            self._desde = time.perf_counter()
+            self._simulado = False
+
+    # Corrió un tick de física: ya usó la entrada pendiente
+    def tick(self):
+        if self._desde is not None:
+            self._simulado = True
+
+    # Se terminó de mostrar un cuadro
+    def mostrado(self):
+        if self._simulado:
+            self.muestras.append(time.perf_counter() - self._desde)
+            self._desde = None
+            self._simulado = False
+
+    def reporte(self):
+        total = len(self.muestras)
+        if not total:
+            return ["Latencia de entrada: sin muestras"]
+
+        valores = sorted(self.muestras)
+        ultimo = total - 1
+        p50, p95, p99 = (valores[round(p * ultimo)] * 1000 for p in (0.50, 0.95, 0.99))
+        return [
+            f"Latencia de entrada ({total} muestras): "
+            f"p50 {p50:.2f} ms, p95 {p95:.2f} ms, p99 {p99:.2f} ms, máx {valores[-1] * 1000:.2f} ms"
+        ]
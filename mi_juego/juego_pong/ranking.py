@@ -1,4 +1,11 @@
+import argparse
 import os
+import sqlite3
+import threading
+import queue
+import time
+import atexit
+import config
 
 # ---------------------------------------------
 #  ARCHIVO: ranking.py
@@ -15,12 +22,19 @@ CARPETA_BASE = os.path.dirname(os.path.dirname(__file__))
 # Se creará automáticamente si no existe.
 RUTA_RANKING = os.path.join(CARPETA_BASE, "ranking.txt")
 
+# Base de datos del almacenamiento indexado (config.RANKING_BACKEND = "sqlite")
+RUTA_RANKING_DB = os.path.join(CARPETA_BASE, "ranking.db")
+
+# PRAGMA user_version de una base que ya trajo los puntajes de ranking.txt
+VERSION_MIGRADA = 1
+
 
 def guardar_score(nombre, puntaje):
     """
-    Guarda un puntaje en el archivo ranking.txt.
+    Guarda un puntaje en el ranking.
 
-    Formato de guardado:
+    Con el almacenamiento de texto (el de siempre) se agrega una
+    línea a ranking.txt con el formato:
         nombre:puntos
 
     Ejemplo:
@@ -28,14 +42,52 @@ def guardar_score(nombre, puntaje):
         IA:3
 
     Se usa modo "a" para agregar líneas sin borrar las anteriores.
+
+    Si config.RANKING_ESCRITURA_DIFERIDA está activo, el puntaje se
+    deja en una cola y lo escribe un hilo aparte (EscritorRanking),
+    para no trabar el juego esperando al disco.
+    """
+
+    if config.RANKING_ESCRITURA_DIFERIDA:
+        escritor.encolar(nombre, puntaje)
+    else:
+        almacen().agregar(nombre, puntaje)
+
+
+def guardar_scores(puntajes):
+    """
+    Guarda muchos puntajes de una sola vez: puntajes es una lista de
+    (nombre, puntos). A diferencia de guardar_score(), escribe en el
+    momento y todo junto (una sola escritura al archivo o a la base).
+    """
+    puntajes = list(puntajes)
+    if puntajes:
+        almacen().agregar_lote(puntajes)
+
+
+def parsear_linea(linea):
     """
+    Convierte una línea "nombre:puntos" en la tupla (nombre, puntos).
 
-    linea = f"{nombre}:{puntaje}\n"
+    Si la línea está vacía o corrupta devuelve None (se ignora).
+    La última línea de un archivo puede no tener salto de línea (por
+    ejemplo si se editó a mano): si está completa vale igual al leer,
+    pero antes de agregar puntajes hay que terminarla con
+    "python ranking.py --terminar" (ver reparar_final).
+    """
 
-    # Abrimos en modo append (agregar al final)
-    with open(RUTA_RANKING, "a", encoding="utf-8") as f:
-        f.write(linea)
+    # Validamos que el formato sea correcto "nombre:puntos"
+    if ":" not in linea:
+        return None
 
+    try:
+        nombre, pts = linea.strip().split(":")
+
+        # Convertimos el puntaje a entero
+        return (nombre, int(pts))
+    except ValueError:
+        # Si falla (por datos corruptos) simplemente se ignora esa línea
+        return None
 
 
 def cargar_ranking():
@@ -57,20 +109,464 @@ def cargar_ranking():
     # Abrimos para leer línea por línea
     with open(RUTA_RANKING, "r", encoding="utf-8") as f:
         for linea in f:
-
-            # Validamos que el formato sea correcto "nombre:puntos"
-            if ":" in linea:
-                nombre, pts = linea.strip().split(":")
-
-                try:
-                    # Convertimos el puntaje a entero
-                    ranking.append((nombre, int(pts)))
-                except:
-                    # Si falla (por datos corruptos) simplemente se ignora esa línea
-                    pass
+            dato = parsear_linea(linea)
+            if dato is not None:
+                ranking.append(dato)
 
     # Ordenamos la lista: el mejor puntaje primero
     ranking.sort(key=lambda x: x[1], reverse=True)
     return ranking
 
 
+# ---------------------------------------------
+#  RANKING EN MEMORIA
+# ---------------------------------------------
+
+class ServicioRanking:
+    """
+    Mantiene en memoria el ranking ya leído y ordenado.
+
+    Solo vuelve a leer ranking.txt cuando el archivo cambió
+    (otra fecha de modificación u otro tamaño), cuando cambia
+    RUTA_RANKING o cuando guardar_score() agrega una línea.
+    Así las pantallas pueden pedir el ranking todas las veces que
+    quieran sin reabrir ni reordenar el archivo.
+    """
+
+    def __init__(self):
+        self.datos = []
+        self.firma = None
+
+    # Identifica la versión del archivo: (ruta, fecha de modificación, tamaño)
+    def _firma_actual(self):
+        try:
+            st = os.stat(RUTA_RANKING)
+        except OSError:
+            return (RUTA_RANKING, None, None)
+        return (RUTA_RANKING, st.st_mtime_ns, st.st_size)
+
+    def invalidar(self):
+        self.firma = None
+
+    def todos(self):
+        """
+        Lista completa [(nombre, puntaje), ...] ordenada de mayor a menor.
+        Es compartida: no modificarla.
+        """
+        firma = self._firma_actual()
+        if firma != self.firma:
+            self.datos = cargar_ranking()
+            self.firma = firma
+        return self.datos
+
+    def top(self, n):
+        """Los n mejores puntajes."""
+        return self.todos()[:n]
+
+
+# Servicio compartido por todo el juego
+servicio = ServicioRanking()
+
+
+# ---------------------------------------------
+#  ALMACENAMIENTOS
+#
+#  Todos tienen la misma interfaz:
+#    agregar(nombre, puntos)
+#    agregar_lote([(nombre, puntos), ...])
+#    top(k)                  → los k mejores puntajes
+#    mejores_por_jugador(k)  → el mejor puntaje de cada jugador (k mejores)
+#
+#  Se elige con config.RANKING_BACKEND.
+# ---------------------------------------------
+
+class AlmacenTexto:
+    """
+    El formato de siempre: ranking.txt con una línea "nombre:puntos"
+    por partida. Las consultas usan la vista en memoria (servicio).
+    """
+
+    def agregar(self, nombre, puntos):
+        self.agregar_lote([(nombre, puntos)])
+
+    def agregar_lote(self, puntajes):
+        lineas = os.linesep.join(f"{nombre}:{puntos}" for nombre, puntos in puntajes)
+
+        # Abrimos en modo append (agregar al final)
+        with open(RUTA_RANKING, "a+b") as f:
+
+            # Si una escritura anterior se cortó antes de su salto de
+            # línea final, se descarta lo que quedó sin terminar
+            reparar_final(f)
+
+            # Todo el lote en una sola escritura, menos el último salto
+            # de línea. Ese salto se escribe recién cuando el lote ya está
+            # en el disco: es la marca de que el lote quedó completo
+            f.write(lineas.encode("utf-8"))
+            _asentar(f)
+            f.write(os.linesep.encode("utf-8"))
+            _asentar(f)
+
+        # La vista en memoria quedó vieja
+        servicio.invalidar()
+
+    def top(self, k):
+        return servicio.top(k)
+
+    def mejores_por_jugador(self, k):
+        mejores = []
+        vistos = set()
+
+        # La vista está ordenada: la primera aparición de cada nombre es su mejor
+        for nombre, puntos in servicio.todos():
+            if nombre not in vistos:
+                vistos.add(nombre)
+                mejores.append((nombre, puntos))
+                if len(mejores) == k:
+                    break
+        return mejores
+
+
+# Manda lo escrito al sistema operativo y, con config.RANKING_FSYNC, al disco
+def _asentar(f):
+    f.flush()
+    if config.RANKING_FSYNC:
+        os.fsync(f.fileno())
+
+
+def buscar_ultimo_salto(f, bloque=4096):
+    """
+    Recibe un archivo abierto en modo binario y devuelve (tamaño, corte):
+    corte es la posición después del último salto de línea (0 si no hay).
+    Si el archivo termina en salto de línea, corte == tamaño.
+    """
+
+    tamano = f.seek(0, os.SEEK_END)
+    fin = tamano
+    while fin > 0:
+        inicio = max(0, fin - bloque)
+        f.seek(inicio)
+        datos = f.read(fin - inicio)
+        i = datos.rfind(b"\n")
+        if i != -1:
+            return tamano, inicio + i + 1
+        fin = inicio
+    return tamano, 0
+
+
+def reparar_final(f, bloque=4096):
+    """
+    Recibe un archivo abierto en modo "a+b" y lo deja terminado en salto
+    de línea, para poder agregar líneas nuevas.
+
+    Cada lote se termina con un salto de línea escrito después de que el
+    resto llegó al disco (ver AlmacenTexto.agregar_lote): lo que queda
+    después del último salto es una escritura cortada (por ejemplo por un
+    corte de luz) y se recorta siempre, aunque parezca un puntaje válido
+    ("Julian:2" de un "Julian:21" a medio escribir).
+
+    Un archivo editado a mano que termina sin salto de línea se arregla
+    antes con "python ranking.py --terminar".
+    """
+
+    tamano, corte = buscar_ultimo_salto(f, bloque)
+    if corte < tamano:
+        f.truncate(corte)
+
+
+def terminar_archivo(ruta):
+    """
+    Agrega el salto de línea que falta al final de un ranking editado a
+    mano, para que la próxima partida guardada no lo tome como una
+    escritura cortada. Devuelve la última línea si se terminó, o None si
+    no hacía falta (o no es un puntaje válido y se deja como está).
+    """
+
+    if not os.path.exists(ruta):
+        return None
+
+    with open(ruta, "a+b") as f:
+        tamano, corte = buscar_ultimo_salto(f)
+        if corte == tamano:
+            return None
+
+        f.seek(corte)
+        ultima = f.read(tamano - corte).decode("utf-8", errors="replace")
+        if parsear_linea(ultima) is None:
+            return None
+
+        f.write(os.linesep.encode("utf-8"))
+        _asentar(f)
+    servicio.invalidar()
+    return ultima
+
+
+class AlmacenSQLite:
+    """
+    Ranking indexado en una base SQLite (viene con Python).
+
+    Cada partida es una fila; el índice por puntos hace que insertar
+    sea O(log n) y que pedir los k mejores no recorra toda la tabla.
+    La tabla "mejores" guarda el mejor puntaje de cada jugador y se
+    actualiza al insertar. A igual puntaje se respeta el orden de
+    llegada, como en el texto.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.lock = threading.Lock()
+
+        self.conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self.conexion.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS puntajes (
+                id INTEGER PRIMARY KEY,
+                nombre TEXT NOT NULL,
+                puntos INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_puntos ON puntajes (puntos DESC, id);
+            CREATE TABLE IF NOT EXISTS mejores (
+                nombre TEXT PRIMARY KEY,
+                puntos INTEGER NOT NULL,
+                id INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_mejores ON mejores (puntos DESC, id);
+            """
+        )
+
+        # Mientras la base no tenga la marca se traen los puntajes del
+        # ranking.txt de siempre (ver _migrar)
+        version = self.conexion.execute("PRAGMA user_version").fetchone()[0]
+        if version < VERSION_MIGRADA:
+            self._migrar(RUTA_RANKING)
+
+    def _migrar(self, ruta_texto):
+        """
+        Trae ranking.txt y anota la marca en la misma transacción: si se
+        corta a la mitad no queda nada y se vuelve a intentar la próxima
+        vez que se abra la base (sin duplicar puntajes).
+        """
+        with self.lock, self.conexion:
+            for lote in leer_lotes(ruta_texto):
+                self._insertar(lote)
+            self.conexion.execute(f"PRAGMA user_version = {VERSION_MIGRADA}")
+
+    def agregar(self, nombre, puntos):
+        self.agregar_lote([(nombre, puntos)])
+
+    def agregar_lote(self, puntajes):
+        with self.lock, self.conexion:
+            self._insertar(puntajes)
+
+    # Inserta sin confirmar la transacción (la confirma quien llama)
+    def _insertar(self, puntajes):
+        for nombre, puntos in puntajes:
+            cursor = self.conexion.execute(
+                "INSERT INTO puntajes (nombre, puntos) VALUES (?, ?)", (nombre, puntos)
+            )
+            # Solo reemplaza el mejor del jugador si lo supera
+            self.conexion.execute(
+                "INSERT INTO mejores (nombre, puntos, id) VALUES (?, ?, ?)"
+                " ON CONFLICT (nombre) DO UPDATE SET puntos = excluded.puntos, id = excluded.id"
+                " WHERE excluded.puntos > mejores.puntos",
+                (nombre, puntos, cursor.lastrowid),
+            )
+
+    def top(self, k):
+        with self.lock:
+            return self.conexion.execute(
+                "SELECT nombre, puntos FROM puntajes ORDER BY puntos DESC, id LIMIT ?",
+                (k,),
+            ).fetchall()
+
+    def mejores_por_jugador(self, k):
+        with self.lock:
+            return self.conexion.execute(
+                "SELECT nombre, puntos FROM mejores ORDER BY puntos DESC, id LIMIT ?",
+                (k,),
+            ).fetchall()
+
+    def cerrar(self):
+        with self.lock:
+            self.conexion.close()
+
+
+def migrar_texto(ruta_texto, destino, tamano_lote=10000):
+    """
+    Copia todos los puntajes de un ranking.txt a otro almacenamiento
+    (por ejemplo AlmacenSQLite), leyendo de a partes para no cargar el
+    archivo entero. Las líneas corruptas se ignoran igual que en
+    cargar_ranking(). Devuelve la cantidad de puntajes copiados.
+    """
+
+    total = 0
+    for lote in leer_lotes(ruta_texto, tamano_lote):
+        destino.agregar_lote(lote)
+        total += len(lote)
+    return total
+
+
+def leer_lotes(ruta_texto, tamano_lote=10000):
+    """
+    Recorre un ranking.txt de a listas de hasta tamano_lote puntajes
+    [(nombre, puntos), ...], sin las líneas corruptas.
+    """
+
+    if not os.path.exists(ruta_texto):
+        return
+
+    lote = []
+    with open(ruta_texto, "r", encoding="utf-8") as f:
+        for linea in f:
+            dato = parsear_linea(linea)
+            if dato is None:
+                continue
+            lote.append(dato)
+            if len(lote) >= tamano_lote:
+                yield lote
+                lote = []
+
+    if lote:
+        yield lote
+
+
+# Almacenamiento activo (se crea la primera vez que se usa)
+_almacen = None
+
+
+def almacen():
+    """
+    Devuelve el almacenamiento elegido en config.RANKING_BACKEND
+    ("texto" o "sqlite").
+    """
+    global _almacen
+    if _almacen is None:
+        if config.RANKING_BACKEND == "sqlite":
+            _almacen = AlmacenSQLite(RUTA_RANKING_DB)
+        else:
+            _almacen = AlmacenTexto()
+    return _almacen
+
+
+def obtener_top(n=10):
+    """
+    Devuelve los n mejores puntajes [(nombre, puntaje), ...].
+    """
+    return almacen().top(n)
+
+
+def obtener_mejores_por_jugador(n=10):
+    """
+    Devuelve el mejor puntaje de cada jugador, los n mejores.
+    """
+    return almacen().mejores_por_jugador(n)
+
+
+# ---------------------------------------------
+#  ESCRITURA EN SEGUNDO PLANO
+# ---------------------------------------------
+
+# Marca para avisarle al hilo que termine
+_FIN = object()
+
+
+class EscritorRanking:
+    """
+    Hilo que escribe los puntajes en el almacenamiento activo.
+
+    guardar_score() solo deja el puntaje en una cola y vuelve enseguida.
+    El hilo junta los puntajes que llegan seguidos (hasta tamano_lote,
+    esperando como mucho "espera" segundos) y los escribe de una sola
+    vez. Al cerrar el programa se escribe todo lo pendiente.
+    """
+
+    def __init__(self, tamano_lote=64, espera=0.2):
+        self.tamano_lote = tamano_lote
+        self.espera = espera
+        self.cola = queue.Queue()
+        self.hilo = None
+        self.lock = threading.Lock()
+
+    def encolar(self, nombre, puntos):
+        with self.lock:
+            if self.hilo is None:
+                self.hilo = threading.Thread(target=self._trabajar, name="EscritorRanking", daemon=True)
+                self.hilo.start()
+        self.cola.put((nombre, puntos))
+
+    def _trabajar(self):
+        terminar = False
+        while not terminar:
+            item = self.cola.get()
+            if item is _FIN:
+                self.cola.task_done()
+                break
+
+            # Junta el resto del lote
+            lote = [item]
+            limite = time.monotonic() + self.espera
+            while len(lote) < self.tamano_lote:
+                try:
+                    item = self.cola.get(timeout=max(0.0, limite - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _FIN:
+                    self.cola.task_done()
+                    terminar = True
+                    break
+                lote.append(item)
+
+            try:
+                almacen().agregar_lote(lote)
+            except Exception as e:
+                print("No se pudo guardar el ranking:", e)
+
+            for _ in lote:
+                self.cola.task_done()
+
+    def vaciar(self):
+        """Espera a que se escriba todo lo que está en la cola."""
+        self.cola.join()
+
+    def cerrar(self):
+        """Escribe lo pendiente y termina el hilo."""
+        with self.lock:
+            hilo = self.hilo
+            self.hilo = None
+        if hilo is not None:
+            self.cola.put(_FIN)
+            hilo.join()
+
+
+# Escritor compartido; al salir del programa se vacía la cola
+escritor = EscritorRanking()
+atexit.register(escritor.cerrar)
+
+
+def vaciar_escrituras():
+    """
+    Espera a que todos los guardar_score() pendientes estén escritos.
+    """
+    escritor.vaciar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Herramientas del ranking de texto.")
+    parser.add_argument("--archivo", default=RUTA_RANKING, help="ranking a revisar (por defecto ranking.txt)")
+    parser.add_argument("--terminar", action="store_true",
+                        help="agrega el salto de línea que falta al final de un ranking editado a mano")
+    args = parser.parse_args(argv)
+
+    if not args.terminar:
+        parser.print_help()
+        return
+
+    ultima = terminar_archivo(args.archivo)
+    if ultima is None:
+        print("No hizo falta terminar la última línea.")
+    else:
+        print(f"Última línea terminada: {ultima}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+# recursos.py
+# --------------------------------------------------------------
+# Administrador de imágenes y sonidos.
+#
+# Cada recurso se carga del disco la primera vez que se pide y
+# queda guardado: la próxima vez (por ejemplo al "Reintentar" o
+# al volver a entrar desde el menú) no se lee nada del disco.
+#
+# Las imágenes se guardan ya convertidas al formato de la pantalla
+# (convert / convert_alpha) y ya escaladas, con la clave
+# (ruta, tamaño, alpha). Quien pide la misma imagen con el mismo
+# tamaño recibe la MISMA superficie (por ejemplo las dos raquetas).
+#
+# Para cada recurso se anota cuánto tardó en cargarse y cuánta
+# memoria ocupa (ver reporte(); lo imprime "python main.py --profile-startup").
+#
+# Si existe la cache horneada (ver hornear_recursos.py) y está al
+# día, las imágenes y sonidos salen de ahí ya escalados y
+# decodificados, sin leer ni decodificar los PNG/MP3. Si la cache
+# está vieja o no existe, se usan los archivos originales. Para saber
+# si está al día alcanza con el tamaño y la fecha de cada archivo
+# fuente; solo si la fecha cambió se calcula la huella (sha256).
+# --------------------------------------------------------------
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+import pygame
+
+import config
+
+# Carpeta base del proyecto (mi_juego)
+CARPETA_BASE = os.path.dirname(os.path.dirname(__file__))
+
+# Carpeta de imágenes (assets/) y de sonidos (sounds/)
+CARPETA_ASSETS = os.path.join(CARPETA_BASE, "assets")
+CARPETA_SONIDOS = os.path.join(CARPETA_BASE, "sounds")
+
+# Archivo de la cache horneada
+RUTA_CACHE = os.path.join(CARPETA_BASE, "recursos.cache")
+
+# Formato de la cache: MAGIA, versión y largo del encabezado JSON
+MAGIA = b"PONGCACH"
+VERSION_CACHE = 2
+ENCABEZADO = struct.Struct("<8sII")
+
+# Imágenes que se hornean: (nombre, tamaño, alpha) tal como las pide el juego
+IMAGENES_HORNEADAS = [
+    ("fondo.png", (800, 600), False),
+    ("pelota.png", (30, 30), True),
+    ("raqueta.png", None, True),
+]
+
+# Extensiones de sonido que se hornean (todos los de sounds/)
+EXTENSIONES_SONIDO = (".mp3", ".ogg", ".wav")
+
+# Recursos ya cargados
+imagenes = {}   # (ruta, tamaño, alpha) → Surface
+sonidos = {}    # ruta → Sound (o None si no se pudo cargar)
+
+# clave → (segundos que tardó, bytes que ocupa)
+estadisticas = {}
+
+# Cache horneada: None = todavía no se buscó
+_horneado = None
+
+# Ya se avisó que los sonidos horneados no sirven con este mixer
+_aviso_mixer = False
+
+# Hilo que inicia el audio y decodifica los sonidos en segundo plano
+_hilo_audio = None
+
+# Fase → segundos, del arranque del audio (para --profile-startup)
+tiempos_audio = {}
+
+# Evento que manda el hilo del audio cuando termina de cargar
+AUDIO_LISTO = pygame.event.custom_type()
+
+
+# --------------------------------------------------------------
+# CACHE HORNEADA
+# --------------------------------------------------------------
+
+# Huella (sha256) de un archivo fuente: si cambia, la cache está vieja
+def huella(ruta):
+    with open(ruta, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# Lo que se anota de cada archivo fuente al hornear
+def firma_fuente(ruta):
+    st = os.stat(ruta)
+    return {"tamano": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": huella(ruta)}
+
+
+def _fuente_al_dia(ruta, firma):
+    """
+    True si el archivo sigue igual que al hornear. Con el mismo tamaño
+    y la misma fecha no se lee; si solo cambió la fecha (una copia, un
+    checkout) se compara la huella.
+    """
+    try:
+        st = os.stat(ruta)
+    except OSError:
+        return False
+    if st.st_size != firma["tamano"]:
+        return False
+    if st.st_mtime_ns == firma["mtime_ns"]:
+        return True
+    return huella(ruta) == firma["sha256"]
+
+
+def _abrir_cache():
+    """
+    Abre la cache horneada con mmap y revisa que esté al día.
+    Devuelve {"imagenes": {...}, "sonidos": {...}, "datos": memoryview}
+    o un diccionario vacío si no se puede usar.
+    """
+    if not config.USAR_CACHE_RECURSOS or not os.path.exists(RUTA_CACHE):
+        return {}
+
+    try:
+        with open(RUTA_CACHE, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magia, version, largo = ENCABEZADO.unpack_from(mapa, 0)
+        if magia != MAGIA or version != VERSION_CACHE:
+            print("Cache de recursos con formato viejo, se usan los originales")
+            return {}
+
+        indice = json.loads(bytes(mapa[ENCABEZADO.size:ENCABEZADO.size + largo]))
+
+        # Cada archivo fuente tiene que seguir igual que al hornear
+        for relativa, firma in indice["fuentes"].items():
+            ruta = os.path.join(CARPETA_BASE, relativa)
+            if not _fuente_al_dia(ruta, firma):
+                print("Cache de recursos vieja (cambió", relativa + "), se usan los originales")
+                return {}
+
+        imagenes_cache = {}
+        for item in indice["imagenes"]:
+            tamano = tuple(item["tamano"]) if item["tamano"] else None
+            clave = (os.path.join(CARPETA_ASSETS, item["nombre"]), tamano, item["alpha"])
+            imagenes_cache[clave] = item
+
+        # Los sonidos solo sirven si el mixer usa el mismo formato: se
+        # revisa en cada sonido() (el mixer se inicia en otro hilo y
+        # puede no estar listo todavía al abrir la cache)
+        sonidos_cache = {}
+        for item in indice["sonidos"]:
+            sonidos_cache[os.path.join(CARPETA_SONIDOS, item["nombre"])] = item
+
+        return {"imagenes": imagenes_cache, "sonidos": sonidos_cache, "mixer": tuple(indice["mixer"]),
+                "datos": memoryview(mapa)}
+
+    except Exception as e:
+        print("No se pudo leer la cache de recursos:", e)
+        return {}
+
+
+def _cache():
+    global _horneado
+    if _horneado is None:
+        _horneado = _abrir_cache()
+    return _horneado
+
+
+# Bytes de un recurso dentro de la cache (sin copiarlos)
+def _datos(item):
+    return _cache()["datos"][item["offset"]:item["offset"] + item["largo"]]
+
+
+def _convertir(superficie, alpha):
+    """
+    Pasa una imagen al formato de la pantalla. Con el backend "sdl2"
+    (video.py) no hay pantalla de pygame.display: se pasa a 32 bits,
+    el formato en que después se sube como textura.
+    """
+    if pygame.display.get_surface() is not None:
+        return superficie.convert_alpha() if alpha else superficie.convert()
+
+    formato = pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0, 32)
+    return superficie.convert(formato)
+
+
+def imagen(nombre, tamano=None, alpha=True):
+    """
+    Devuelve la imagen assets/<nombre> lista para dibujar.
+
+    tamano: (ancho, alto) para escalarla, o None para dejarla como está.
+    alpha: True si tiene transparencia (convert_alpha), False si no (convert).
+
+    Necesita que ya exista la ventana (video.iniciar()).
+    La superficie es compartida: no dibujar sobre ella.
+    """
+    ruta = os.path.join(CARPETA_ASSETS, nombre)
+    clave = (ruta, tamano, alpha)
+
+    superficie = imagenes.get(clave)
+    if superficie is not None:
+        return superficie
+
+    inicio = time.perf_counter()
+
+    horneada = _cache().get("imagenes", {}).get(clave)
+    if horneada is not None:
+        # Pixeles ya escalados: solo se pasan al formato de la pantalla
+        formato = "RGBA" if alpha else "RGB"
+        cruda = pygame.image.frombuffer(_datos(horneada), (horneada["w"], horneada["h"]), formato)
+        superficie = _convertir(cruda, alpha)
+    else:
+        original = pygame.image.load(ruta)
+        superficie = _convertir(original, alpha)
+        if tamano is not None and superficie.get_size() != tamano:
+            superficie = pygame.transform.scale(superficie, tamano)
+
+    imagenes[clave] = superficie
+    estadisticas[clave] = (
+        time.perf_counter() - inicio,
+        superficie.get_pitch() * superficie.get_height(),
+    )
+    return superficie
+
+
+def sonido(nombre):
+    """
+    Devuelve el sonido sounds/<nombre>, o None si no existe o no se pudo
+    cargar (así el juego no se rompe si falta un archivo). El volumen y
+    el silencio no se aplican acá sino en los canales (ver audio.py).
+    """
+    ruta = os.path.join(CARPETA_SONIDOS, nombre)
+    if ruta in sonidos:
+        return sonidos[ruta]
+
+    inicio = time.perf_counter()
+    try:
+        horneado = _sonido_horneado(ruta)
+        if horneado is not None:
+            # Muestras ya decodificadas
+            s = pygame.mixer.Sound(buffer=_datos(horneado))
+        else:
+            s = pygame.mixer.Sound(ruta)
+    except Exception as e:
+        print("No se pudo cargar sonido:", ruta, e)
+        s = None
+
+    sonidos[ruta] = s
+    estadisticas[ruta] = (time.perf_counter() - inicio, _bytes_sonido(s))
+    return s
+
+
+# Datos del sonido en la cache horneada, si sirven para el mixer actual
+def _sonido_horneado(ruta):
+    global _aviso_mixer
+
+    cache = _cache()
+    horneado = cache.get("sonidos", {}).get(ruta)
+    if horneado is None:
+        return None
+
+    if pygame.mixer.get_init() != cache["mixer"]:
+        if not _aviso_mixer:
+            print("El mixer no usa el formato de la cache horneada", cache["mixer"],
+                  "→ se decodifican los sonidos originales")
+            _aviso_mixer = True
+        return None
+    return horneado
+
+
+# Memoria aproximada de un sonido ya decodificado
+def _bytes_sonido(s):
+    formato = pygame.mixer.get_init()
+    if s is None or formato is None:
+        return 0
+    frecuencia, tamano, canales = formato
+    return int(s.get_length() * frecuencia) * (abs(tamano) // 8) * canales
+
+
+def reporte():
+    """
+    Devuelve una lista de líneas con el tiempo de carga y la memoria
+    de cada recurso cargado, la más pesada primero.
+    """
+    lineas = []
+    total = 0
+    for clave, (segundos, tamano) in sorted(estadisticas.items(), key=lambda x: -x[1][1]):
+        if isinstance(clave, tuple):
+            ruta, dimensiones, alpha = clave
+            nombre = os.path.basename(ruta)
+            if dimensiones is not None:
+                nombre += f" {dimensiones[0]}x{dimensiones[1]}"
+        else:
+            nombre = os.path.basename(clave)
+        lineas.append(f"{nombre:<28} {segundos * 1000:8.2f} ms {tamano / 1024:10.1f} KiB")
+        total += tamano
+    lineas.append(f"{'TOTAL':<28} {'':11} {total / 1024:10.1f} KiB")
+    return lineas
+
+
+# --------------------------------------------------------------
+# AUDIO EN SEGUNDO PLANO
+# Iniciar el mixer y decodificar los sonidos tarda; se hace en un
+# hilo aparte para que la primera pantalla aparezca enseguida.
+# --------------------------------------------------------------
+
+def iniciar_audio_en_segundo_plano(nombres):
+    """
+    Inicia pygame.mixer y carga los sonidos indicados en otro hilo.
+    Cuando todo está listo pone un evento AUDIO_LISTO en la cola de
+    pygame: quien lo recibe (el hilo principal) ya puede usar el mixer.
+    El hilo de carga no toca los canales ni reproduce nada.
+    """
+    global _hilo_audio
+
+    def trabajar():
+        inicio = time.perf_counter()
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print("No se pudo iniciar el audio:", e)
+        tiempos_audio["mixer.init"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        if pygame.mixer.get_init():
+            for nombre in nombres:
+                sonido(nombre)
+        tiempos_audio["cargar sonidos"] = time.perf_counter() - inicio
+
+        try:
+            pygame.event.post(pygame.event.Event(AUDIO_LISTO))
+        except pygame.error:
+            pass  # sin ventana no hay cola de eventos
+
+    _hilo_audio = threading.Thread(target=trabajar, name="CargaAudio", daemon=True)
+    _hilo_audio.start()
+
+
+def esperar_audio():
+    """
+    Espera a que termine la carga de audio en segundo plano (si hay una).
+    Hay que llamarla antes de usar el mixer desde el hilo principal.
+    """
+    if _hilo_audio is not None:
+        _hilo_audio.join()
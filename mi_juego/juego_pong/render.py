@@ -0,0 +1,294 @@
+# render.py
+# --------------------------------------------------------------
+# Dibujado de la pantalla del partido.
+#
+# Modo "sucio" (dirty rectangles): en vez de copiar el fondo
+# completo de 800x600 y hacer flip() en cada cuadro, recuerda
+# dónde estaba cada sprite (pelota, raquetas, puntaje) en el
+# cuadro anterior, repone el fondo solo en esos rectángulos,
+# dibuja los sprites en su lugar nuevo y manda a la pantalla
+# únicamente esas zonas con pygame.display.update(rects).
+#
+# Modo completo: fondo entero + flip(), como antes.
+# Se usa siempre en el primer cuadro y tras un cambio de
+# pantalla o de tamaño de ventana (forzar_completo()).
+#
+# Los sprites (clase Sprite) se crean una sola vez: en cada cuadro
+# solo se actualizan, sin crear listas, tuplas ni rectángulos nuevos
+# que después tenga que juntar el recolector de basura.
+#
+# Si se le pasa un perfilador (perfilador.py), marca por separado
+# el tiempo de los blits ("blit") y el de mandar a la pantalla ("flip"),
+# y mientras mide le pasa cuántos pixeles se mandaron en cada cuadro
+# (se ven en el HUD de F3).
+#
+# RendererTexturas hace lo mismo con el backend "sdl2" (video.py):
+# cada superficie se sube una vez como textura y en cada cuadro solo
+# se copian texturas a una textura de 800x600 (video.lienzo), con el
+# mismo modo sucio; después el lienzo entero va escalado a la ventana.
+# --------------------------------------------------------------
+
+import weakref
+
+import pygame
+
+
+class Sprite:
+    """
+    Algo que se dibuja en el partido (pelota, raqueta, puntaje...).
+
+    Se crea una vez y en cada cuadro solo se le cambia la posición
+    (mover) o la superficie: así dibujar un cuadro no crea objetos nuevos.
+    visible=False lo borra de la pantalla sin sacarlo de la lista.
+    """
+
+    __slots__ = ("clave", "superficie", "visible", "rect",
+                 "previo", "superficie_previa", "dibujado", "quieto")
+
+    def __init__(self, clave, superficie=None, visible=True):
+        self.clave = clave
+        self.superficie = superficie
+        self.visible = visible
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+        # Dónde y con qué superficie se dibujó en el cuadro anterior
+        self.previo = pygame.Rect(0, 0, 0, 0)
+        self.superficie_previa = None
+        self.dibujado = False
+        self.quieto = False
+
+    def mover(self, x, y):
+        self.rect.x = x
+        self.rect.y = y
+
+
+class Renderer:
+    def __init__(self, ventana, fondo, sucio=True, perfil=None):
+        self.ventana = ventana
+        self.fondo = fondo
+        self.sucio = sucio
+        self.perfil = perfil
+
+        self.pantalla = ventana.get_rect()
+        self.completo_pendiente = True
+
+        # Zonas a mandar a la pantalla (se reusa la misma lista)
+        self.rects = []
+
+    # Copias de cada cuadro (RendererTexturas las hace con texturas)
+    def _reponer(self, zona):
+        self.ventana.blit(self.fondo, zona, zona)
+
+    def _copiar(self, sprite):
+        self.ventana.blit(sprite.superficie, sprite.rect)
+
+    def _actualizar(self, rects):
+        if rects:
+            pygame.display.update(rects)
+
+    # El próximo cuadro se dibuja entero (cambio de escena, resize...)
+    def forzar_completo(self):
+        self.completo_pendiente = True
+
+    # Revisa eventos que invalidan lo que hay en pantalla
+    def procesar_evento(self, evento):
+        if evento.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.forzar_completo()
+
+    def dibujar(self, sprites):
+        """
+        Dibuja y muestra un cuadro.
+
+        sprites: lista de Sprite, en el orden en que se dibujan
+        (la misma lista y los mismos Sprite en cada cuadro).
+        """
+
+        for sprite in sprites:
+            if sprite.visible:
+                sprite.rect.w = sprite.superficie.get_width()
+                sprite.rect.h = sprite.superficie.get_height()
+
+        if not self.sucio or self.completo_pendiente:
+            return self._dibujar_completo(sprites)
+
+        pantalla = self.pantalla
+        rects = self.rects
+        rects.clear()
+
+        # 1) Reponer el fondo donde estaban los sprites que cambiaron
+        #    (y donde estaban los que dejaron de verse)
+        for sprite in sprites:
+            sprite.quieto = (
+                sprite.visible
+                and sprite.dibujado
+                and sprite.superficie is sprite.superficie_previa
+                and sprite.rect == sprite.previo
+            )
+            if sprite.quieto:
+                continue  # no se movió ni cambió
+
+            if sprite.dibujado:
+                viejo = sprite.previo.clip(pantalla)
+                self._reponer(viejo)
+                rects.append(viejo)
+            if sprite.visible:
+                rects.append(sprite.rect.clip(pantalla))
+
+        # Un sprite quieto que toca una zona repuesta también se repone
+        # entero: dibujarlo encima de sí mismo mezclaría dos veces los
+        # bordes semitransparentes
+        cambio = True
+        while cambio:
+            cambio = False
+            for sprite in sprites:
+                if sprite.quieto and sprite.rect.collidelist(rects) != -1:
+                    zona = sprite.rect.clip(pantalla)
+                    self._reponer(zona)
+                    rects.append(zona)
+                    sprite.quieto = False
+                    cambio = True
+
+        # 2) Dibujar los sprites en su lugar, en el orden original
+        for sprite in sprites:
+            if sprite.visible and not sprite.quieto:
+                self._copiar(sprite)
+
+        self._marcar("blit")
+
+        # 3) Mandar a la pantalla solo las zonas modificadas
+        self._actualizar(rects)
+
+        self._marcar("flip")
+
+        # Las zonas se superponen (lugar viejo y nuevo de un sprite que
+        # se movió poco): cada pixel se cuenta una sola vez
+        if self._midiendo():
+            self.perfil.contar_pixeles(area_cubierta(rects))
+
+        self._recordar(sprites)
+
+    def _dibujar_completo(self, sprites):
+        ventana = self.ventana
+        ventana.blit(self.fondo, (0, 0))
+
+        for sprite in sprites:
+            if sprite.visible:
+                ventana.blit(sprite.superficie, sprite.rect)
+
+        self._marcar("blit")
+        pygame.display.flip()
+        self._marcar("flip")
+
+        self._recordar(sprites)
+        self.completo_pendiente = False
+        if self._midiendo():
+            self.perfil.contar_pixeles(ventana.get_width() * ventana.get_height())
+
+    # Anota lo dibujado para compararlo en el próximo cuadro
+    def _recordar(self, sprites):
+        for sprite in sprites:
+            sprite.dibujado = sprite.visible
+            if sprite.visible:
+                sprite.previo.update(sprite.rect)
+                sprite.superficie_previa = sprite.superficie
+
+    def _marcar(self, fase):
+        if self.perfil is not None:
+            self.perfil.marcar(fase)
+
+    def _midiendo(self):
+        return self.perfil is not None and self.perfil.activo
+
+
+def area_cubierta(rects):
+    """
+    Pixeles que cubren los rectángulos, contando una sola vez las zonas
+    donde se superponen. Se barre por franjas verticales entre bordes x
+    y en cada franja se juntan los tramos en y.
+    """
+    bordes = sorted({r.left for r in rects} | {r.right for r in rects})
+    area = 0
+    for x0, x1 in zip(bordes, bordes[1:]):
+        tramos = sorted((r.top, r.bottom) for r in rects if r.left <= x0 and x1 <= r.right and r.h > 0)
+        alto = 0
+        fin = None
+        for arriba, abajo in tramos:
+            if fin is None or arriba >= fin:
+                alto += abajo - arriba
+                fin = abajo
+            elif abajo > fin:
+                alto += abajo - fin
+                fin = abajo
+        area += (x1 - x0) * alto
+    return area
+
+
+class RendererTexturas(Renderer):
+    """
+    Dibuja el partido con texturas de pygame._sdl2.video.
+
+    Misma forma de uso que Renderer. Cada superficie (fondo, pelota,
+    raquetas, textos de cache_texto...) se sube como textura la primera
+    vez que se dibuja y queda guardada mientras la superficie exista:
+    si se la reemplaza (otro puntaje), la textura vieja se libera sola.
+    Las superficies no se deben modificar después de dibujarlas.
+
+    Se dibuja en "lienzo", una textura destino de 800x600 que conserva
+    lo dibujado entre cuadros (con sucio solo se repone lo que cambió),
+    y en cada cuadro presentar(lienzo) la lleva a la ventana
+    (video.lienzo y video.presentar).
+    """
+
+    def __init__(self, renderer_sdl, lienzo, presentar, fondo, sucio=True, perfil=None):
+        self.renderer_sdl = renderer_sdl
+        self.ventana = None
+        self.lienzo = lienzo
+        self.presentar = presentar
+        self.fondo = fondo
+        self.sucio = sucio
+        self.perfil = perfil
+
+        self.pantalla = fondo.get_rect()
+        self.completo_pendiente = True
+        self.rects = []
+
+        # Superficie → Texture
+        self.texturas = weakref.WeakKeyDictionary()
+
+    def textura(self, superficie):
+        textura = self.texturas.get(superficie)
+        if textura is None:
+            from pygame._sdl2 import video as sdl2_video
+
+            textura = sdl2_video.Texture.from_surface(self.renderer_sdl, superficie)
+            self.texturas[superficie] = textura
+        return textura
+
+    def dibujar(self, sprites):
+        self.renderer_sdl.target = self.lienzo
+        super().dibujar(sprites)
+
+    def _reponer(self, zona):
+        self.textura(self.fondo).draw(zona, zona)
+
+    def _copiar(self, sprite):
+        self.textura(sprite.superficie).draw(None, sprite.rect)
+
+    def _actualizar(self, rects):
+        self.presentar(self.lienzo)
+
+    def _dibujar_completo(self, sprites):
+        self.textura(self.fondo).draw()
+
+        for sprite in sprites:
+            if sprite.visible:
+                self._copiar(sprite)
+
+        self._marcar("blit")
+        self.presentar(self.lienzo)
+        self._marcar("flip")
+
+        self._recordar(sprites)
+        self.completo_pendiente = False
+        if self._midiendo():
+            self.perfil.contar_pixeles(self.pantalla.w * self.pantalla.h)
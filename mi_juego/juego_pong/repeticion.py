@@ -0,0 +1,260 @@
+# repeticion.py
+# --------------------------------------------------------------
+# Grabación y reproducción de partidas.
+#
+# Como el motor es determinista (motor.py), para repetir una
+# partida alcanza con guardar:
+#   - la semilla del generador al azar de la partida
+#   - la dificultad, sus valores (ia_vel, velocidad_base, vel_jugador)
+#     y las opciones del motor
+#   - las entradas de cada tick: UN byte por tick
+#
+# El archivo también guarda cómo terminó la partida (ticks, puntos
+# y posición final de la pelota). Al reproducirla se compara: si el
+# resultado cambió, algo cambió en la física. Así una carpeta de
+# partidas grabadas sirve como prueba de regresión (ver
+# tests/test_repeticion.py), y el archivo que manda un jugador
+# permite repetir exactamente lo que le pasó.
+#
+# Uso:
+#   python repeticion.py partida.pong                → reproduce y verifica
+#   python repeticion.py ../repeticiones             → toda la carpeta
+# --------------------------------------------------------------
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+
+import motor
+
+EXTENSION = ".pong"
+
+# Formato: MAGIA, versión, semilla, ticks por segundo, opciones y
+# largo del nombre de la dificultad (que va a continuación)
+MAGIA = b"PONGREPL"
+VERSION = 1
+ENCABEZADO = struct.Struct("<8sHQHBB")
+
+# Después del nombre: ia_vel, velocidad_base y vel_jugador con que se
+# jugó (la tabla de dificultades puede cambiar al recalibrar)
+VALORES = struct.Struct("<ddd")
+
+# Cómo terminó: ticks, puntos jugador, puntos IA, ganador, pelota x / y
+RESUMEN = struct.Struct("<IIIBdd")
+
+# Bits de "opciones"
+OPCION_CONTINUA = 1
+OPCION_IA_PREDICTIVA = 2
+
+# Dirección → código de 2 bits (None = la raqueta la maneja la IA)
+CODIGOS = {0: 0, -1: 1, 1: 2, None: 3}
+DIRECCIONES = (0, -1, 1, None)
+
+GANADORES = (None, motor.JUGADOR, motor.IA)
+
+
+def nueva_semilla():
+    return random.getrandbits(63)
+
+
+# Byte de entradas de un tick: bits 0-1 raqueta 1, bits 2-3 raqueta 2
+def codificar(entradas):
+    return CODIGOS[entradas.dir_1] | CODIGOS[entradas.dir_2] << 2
+
+
+def decodificar(byte, entradas):
+    entradas.dir_1 = DIRECCIONES[byte & 3]
+    entradas.dir_2 = DIRECCIONES[byte >> 2 & 3]
+
+
+class Grabacion:
+    """
+    Una partida grabada: con qué se creó el estado y las entradas de
+    cada tick. El juego la va llenando con registrar(); repetir()
+    la vuelve a jugar sin ventana.
+    """
+
+    def __init__(self, dificultad, semilla=None, ticks_por_segundo=motor.TICKS_BASE,
+                 continua=False, ia_predictiva=False, valores=None):
+        self.dificultad = dificultad
+        self.valores = tuple(valores or motor.parametros(dificultad))
+        self.semilla = nueva_semilla() if semilla is None else semilla
+        self.ticks_por_segundo = ticks_por_segundo
+        self.continua = continua
+        self.ia_predictiva = ia_predictiva
+
+        # Un byte por tick
+        self.entradas = array("B")
+
+        # (ticks, puntos, puntos_ia, ganador, pelota_x, pelota_y) al guardar
+        self.resumen = None
+
+    def estado_inicial(self):
+        """Estado listo para el primer tick (el juego y repetir() usan este)."""
+        return motor.nuevo_estado(
+            self.dificultad,
+            self.semilla,
+            self.ticks_por_segundo,
+            self.continua,
+            self.ia_predictiva,
+            self.valores,
+        )
+
+    # Anota las entradas de un tick (antes de llamar a motor.step)
+    def registrar(self, entradas):
+        self.entradas.append(codificar(entradas))
+
+    # ----------------------------------------------------------
+    # ARCHIVO
+    # ----------------------------------------------------------
+
+    def guardar(self, ruta, estado):
+        """Guarda la partida y cómo terminó (estado final)."""
+        self.resumen = resumir(estado)
+
+        opciones = 0
+        if self.continua:
+            opciones |= OPCION_CONTINUA
+        if self.ia_predictiva:
+            opciones |= OPCION_IA_PREDICTIVA
+        nombre = self.dificultad.encode("utf-8")
+
+        os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+        with open(ruta, "wb") as f:
+            f.write(ENCABEZADO.pack(MAGIA, VERSION, self.semilla, self.ticks_por_segundo,
+                                    opciones, len(nombre)))
+            f.write(nombre)
+            f.write(VALORES.pack(*self.valores))
+            f.write(RESUMEN.pack(*self.resumen))
+            self.entradas.tofile(f)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Lee una partida grabada. Si el archivo no es una repetición o
+        está cortado levanta ValueError (o struct.error).
+        """
+        with open(ruta, "rb") as f:
+            datos = f.read()
+
+        magia, version, semilla, ticks_por_segundo, opciones, largo = ENCABEZADO.unpack_from(datos, 0)
+        if magia != MAGIA or version != VERSION:
+            raise ValueError(f"{ruta}: no es una repetición compatible")
+
+        posicion = ENCABEZADO.size
+        dificultad = datos[posicion:posicion + largo].decode("utf-8")
+        posicion += largo
+
+        # Los enteros vuelven a ser enteros, como en DIFICULTADES
+        valores = tuple(int(v) if v.is_integer() else v for v in VALORES.unpack_from(datos, posicion))
+        posicion += VALORES.size
+
+        grabacion = cls(
+            dificultad,
+            semilla,
+            ticks_por_segundo,
+            bool(opciones & OPCION_CONTINUA),
+            bool(opciones & OPCION_IA_PREDICTIVA),
+            valores,
+        )
+        grabacion.resumen = RESUMEN.unpack_from(datos, posicion)
+        grabacion.entradas.frombytes(datos[posicion + RESUMEN.size:])
+        return grabacion
+
+    # ----------------------------------------------------------
+    # REPRODUCCIÓN
+    # ----------------------------------------------------------
+
+    def repetir(self):
+        """
+        Vuelve a jugar la partida lo más rápido posible (sin dibujar).
+        Devuelve (estado final, segundos que tardó).
+        """
+        estado = self.estado_inicial()
+        entradas = motor.Entradas()
+        eventos = []
+        step = motor.step
+
+        inicio = time.perf_counter()
+        for byte in self.entradas:
+            decodificar(byte, entradas)
+            step(estado, entradas, eventos)
+        return estado, time.perf_counter() - inicio
+
+
+# Cómo quedó la partida, para comparar al reproducirla
+def resumir(estado):
+    return (
+        estado.tick,
+        estado.pelota.puntuacion,
+        estado.pelota.puntuacion_ia,
+        GANADORES.index(estado.ganador),
+        estado.pelota.x,
+        estado.pelota.y,
+    )
+
+
+# Ruta para guardar una partida nueva dentro de "carpeta"
+def ruta_nueva(carpeta, grabacion):
+    nombre = time.strftime("%Y%m%d_%H%M%S") + f"_{grabacion.semilla:016x}{EXTENSION}"
+    return os.path.join(carpeta, nombre)
+
+
+def _archivos(rutas):
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            for nombre in sorted(os.listdir(ruta)):
+                if nombre.endswith(EXTENSION):
+                    yield os.path.join(ruta, nombre)
+        else:
+            yield ruta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduce partidas grabadas y verifica el resultado.")
+    parser.add_argument("rutas", nargs="+", help="archivos .pong o carpetas con partidas")
+    args = parser.parse_args(argv)
+
+    total_ticks = 0
+    total_segundos = 0.0
+    distintas = 0
+
+    for ruta in _archivos(args.rutas):
+        try:
+            grabacion = Grabacion.cargar(ruta)
+        except (OSError, ValueError, struct.error) as e:
+            distintas += 1
+            print(f"ERROR   {os.path.basename(ruta)}: no se pudo leer ({e})")
+            continue
+        estado, segundos = grabacion.repetir()
+
+        igual = resumir(estado) == grabacion.resumen
+        if not igual:
+            distintas += 1
+
+        ticks = len(grabacion.entradas)
+        total_ticks += ticks
+        total_segundos += segundos
+        por_segundo = ticks / segundos if segundos > 0 else 0
+        print(
+            f"{'OK     ' if igual else 'DIFIERE'} {os.path.basename(ruta)}: "
+            f"{ticks} ticks, {estado.pelota.puntuacion}-{estado.pelota.puntuacion_ia}, "
+            f"{por_segundo:,.0f} ticks/s"
+        )
+
+    if total_segundos > 0:
+        print(f"Total: {total_ticks} ticks en {total_segundos:.2f} s → "
+              f"{total_ticks / total_segundos:,.0f} ticks/s")
+    if distintas:
+        print(f"{distintas} partidas no se pudieron leer o terminaron distinto que al grabarlas",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
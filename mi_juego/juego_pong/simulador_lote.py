@@ -0,0 +1,352 @@
+# simulador_lote.py
+# --------------------------------------------------------------
+# Simulador de MUCHAS partidas a la vez usando NumPy.
+#
+# En vez de tener un objeto Pelota y dos Raqueta por partida,
+# guarda cada dato en un arreglo con una posición por partida
+# ("struct of arrays"): pelota_x[i], pelota_y[i], raqueta_2_y[i]...
+# Así cada tick avanza TODAS las partidas con unas pocas
+# operaciones vectorizadas, sin loops de Python por partida.
+#
+# Las reglas son exactamente las de motor.py (mover, rebotar,
+# mover / mover_ia de las raquetas y el choque de rectángulos):
+# con los mismos sorteos al azar da los mismos resultados
+# (lo comprueba tests/test_simulador_lote.py).
+#
+# Opcionalmente la raqueta derecha usa la IA predictiva de
+# motor.IAPredictiva (parámetros reaccion y error), y la pelota la
+# colisión continua de motor.Pelota.barrer (continua=True), las dos
+# opciones con las que juega el juego por defecto.
+# --------------------------------------------------------------
+
+import numpy as np
+
+import motor
+
+W = motor.VENTANA_HORI
+H = motor.VENTANA_VERTI
+
+PA = motor.PELOTA_ANCHO
+PH = motor.PELOTA_ALTO
+RA = motor.RAQUETA_ANCHO
+RH = motor.RAQUETA_ALTO
+
+# Posición de reinicio de la pelota y de las raquetas
+CENTRO_X = W / 2 - PA / 2
+CENTRO_Y = H / 2 - PH / 2
+RAQUETA_Y0 = H / 2 - RH / 2
+
+# X fija de cada raqueta
+RAQUETA_1_X = motor.MARGEN_RAQUETA
+RAQUETA_2_X = W - motor.MARGEN_RAQUETA - RA
+
+# Valores de la columna "ganador"
+SIN_GANADOR = 0
+GANA_JUGADOR = 1
+GANA_IA = 2
+
+
+class SimuladorLote:
+    """
+    Mantiene N partidas en arreglos de NumPy y las avanza juntas.
+
+    ia_vel, velocidad_base y vel_jugador pueden ser un número (igual
+    para todas) o un arreglo con un valor por partida.
+
+    reaccion (en ticks) y error (en pixeles) activan la IA predictiva;
+    con reaccion=None la IA persigue la pelota como Raqueta.mover_ia.
+    También pueden ser un número o un arreglo.
+
+    continua: colisión continua como motor.Estado(continua=True);
+    False → las reglas originales (mover y después revisar).
+    """
+
+    def __init__(self, n, ia_vel, velocidad_base, semilla=None, reaccion=None, error=0.0,
+                 vel_jugador=motor.VEL_JUGADOR, continua=False):
+        self.n = n
+        self.gen = np.random.default_rng(semilla)
+        self.continua = continua
+
+        self.ia_vel = np.broadcast_to(np.asarray(ia_vel, dtype=np.float64), (n,)).copy()
+        self.vel_jugador = np.broadcast_to(np.asarray(vel_jugador, dtype=np.float64), (n,)).copy()
+        velocidad_base = np.broadcast_to(np.asarray(velocidad_base, dtype=np.float64), (n,))
+
+        # IA predictiva (una por partida, como motor.IAPredictiva)
+        self.predictiva = reaccion is not None
+        if self.predictiva:
+            self.reaccion = np.broadcast_to(np.asarray(reaccion, dtype=np.int64), (n,)).copy()
+            self.error = np.broadcast_to(np.asarray(error, dtype=np.float64), (n,)).copy()
+            self.ia_dir_vista = np.zeros(n)
+            self.ia_espera = np.zeros(n, dtype=np.int64)
+            self.ia_pendiente = np.zeros(n, dtype=bool)
+            self.ia_objetivo = np.full(n, H / 2)
+
+        # Pelota
+        self.pelota_x = np.full(n, CENTRO_X)
+        self.pelota_y = np.full(n, CENTRO_Y)
+
+        todas = np.ones(n, dtype=bool)
+        self.dir_x = self._sortear(todas)
+        self.dir_y = self._sortear(todas)
+
+        # Ajusta velocidad real de la pelota según la dificultad
+        self.dir_x = np.where(self.dir_x > 0, velocidad_base, -velocidad_base)
+        self.dir_y = np.where(self.dir_y > 0, velocidad_base, -velocidad_base)
+
+        # Puntajes
+        self.puntuacion = np.zeros(n, dtype=np.int32)
+        self.puntuacion_ia = np.zeros(n, dtype=np.int32)
+
+        # Raquetas (solo se mueven en y)
+        self.raqueta_1_y = np.full(n, RAQUETA_Y0)
+        self.raqueta_2_y = np.full(n, RAQUETA_Y0)
+
+        # Estadísticas por partida
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.toques = np.zeros(n, dtype=np.int64)
+        self.ganador = np.zeros(n, dtype=np.int8)
+
+        self.reiniciar_partida(todas)
+
+    # ----------------------------------------------------------
+    # Sorteo de dirección (-5 o 5) para las partidas marcadas.
+    # Devuelve un arreglo de largo n (0 donde mascara es False):
+    # se sortea un valor por partida marcada, en orden, así los
+    # sorteos dependen de qué partidas hicieron punto.
+    # ----------------------------------------------------------
+    def _sortear(self, mascara):
+        valores = np.zeros(self.n)
+        valores[mascara] = self.gen.choice(np.array([-5.0, 5.0]), size=int(np.count_nonzero(mascara)))
+        return valores
+
+    # Error de puntería de la IA predictiva (normal de desvío 1) para
+    # las partidas marcadas; 0 en las demás
+    def _sortear_error(self, mascara):
+        valores = np.zeros(self.n)
+        valores[mascara] = self.gen.standard_normal(int(np.count_nonzero(mascara)))
+        return valores
+
+    # Reinicia la pelota de las partidas marcadas (tras un punto)
+    def _reiniciar_pelota(self, mascara):
+        self.pelota_x = np.where(mascara, CENTRO_X, self.pelota_x)
+        self.pelota_y = np.where(mascara, CENTRO_Y, self.pelota_y)
+        self.dir_x = np.where(mascara, -self.dir_x, self.dir_x)
+        self.dir_y = np.where(mascara, self._sortear(mascara), self.dir_y)
+
+    # Pone en 0 el marcador de las partidas marcadas ("Reintentar")
+    def reiniciar_partida(self, mascara):
+        self.puntuacion[mascara] = 0
+        self.puntuacion_ia[mascara] = 0
+        self.ganador[mascara] = SIN_GANADOR
+        self._reiniciar_pelota(mascara)
+
+    # Partidas que todavía no terminaron
+    def activas(self):
+        return self.ganador == SIN_GANADOR
+
+    # Choque de la pelota con una raqueta (versión vectorizada de colision)
+    def _colision(self, raqueta_x, raqueta_y, activas):
+        x = self.pelota_x
+        y = self.pelota_y
+
+        choque = (
+            activas
+            & (x < raqueta_x + RA)
+            & (x + PA > raqueta_x)
+            & (y + PH > raqueta_y)
+            & (y < raqueta_y + RH)
+        )
+
+        self.dir_x = np.where(choque, -self.dir_x, self.dir_x)
+
+        # Evita múltiples colisiones seguidas
+        nueva_x = np.where(x < W / 2, raqueta_x + RA, raqueta_x - PA)
+        self.pelota_x = np.where(choque, nueva_x, x)
+
+        self.toques += choque
+
+    def step(self, dir_1, dir_2=None):
+        """
+        Avanza un tick todas las partidas que siguen en juego.
+
+        dir_1: arreglo (o número) con -1/0/1 para la raqueta izquierda.
+        dir_2: igual para la derecha, o None para que juegue la IA.
+        """
+
+        act = self.activas()
+
+        if self.continua:
+            # Raquetas primero; si una quedó encima de la pelota se
+            # resuelve como siempre y después se barre la pelota
+            self._mover_raquetas(dir_1, dir_2, act)
+            self._colision(RAQUETA_1_X, self.raqueta_1_y, act)
+            self._colision(RAQUETA_2_X, self.raqueta_2_y, act)
+            self._barrer(act)
+            self._revisar_puntos(act)
+        else:
+            # ---- Pelota: mover ----
+            self.pelota_x = self.pelota_x + self.dir_x * act
+            self.pelota_y = self.pelota_y + self.dir_y * act
+
+            # ---- Pelota: rebotar (puntos y paredes) ----
+            self._revisar_puntos(act)
+            pared = act & ((self.pelota_y <= 0) | (self.pelota_y + PH >= H))
+            self.dir_y = np.where(pared, -self.dir_y, self.dir_y)
+
+            self._mover_raquetas(dir_1, dir_2, act)
+
+            # ---- Colisiones ----
+            self._colision(RAQUETA_1_X, self.raqueta_1_y, act)
+            self._colision(RAQUETA_2_X, self.raqueta_2_y, act)
+
+        self.ticks += act
+
+        # ---- Ganar o perder ----
+        gana_j = act & (self.puntuacion >= motor.PUNTOS_VICTORIA)
+        gana_ia = act & ~gana_j & (self.puntuacion_ia >= motor.PUNTOS_VICTORIA)
+        self.ganador[gana_j] = GANA_JUGADOR
+        self.ganador[gana_ia] = GANA_IA
+
+    # Si la pelota salió por un costado, suma el punto y la reinicia
+    def _revisar_puntos(self, act):
+        izq = act & (self.pelota_x <= 0)
+        if izq.any():
+            self._reiniciar_pelota(izq)
+            self.puntuacion_ia += izq
+
+        der = act & (self.pelota_x + PA >= W)
+        if der.any():
+            self._reiniciar_pelota(der)
+            self.puntuacion += der
+
+    # Versión vectorizada de motor.Pelota.barrer: cada vuelta avanza
+    # hasta el primer choque (pared o cara de raqueta) las partidas que
+    # todavía tienen tiempo en este tick. Se trabaja con los índices de
+    # esas partidas: después de la primera vuelta quedan muy pocas.
+    def _barrer(self, act):
+        x = self.pelota_x
+        y = self.pelota_y
+
+        # Solo puede chocar en este tick una pelota que está a menos de
+        # un paso (más un pixel de margen) de una pared o de la cara de
+        # una raqueta. Las demás avanzan el tick entero, lo mismo que
+        # da barrer sin choques (t_choque = 1)
+        paso_x = np.abs(self.dir_x) + 1
+        paso_y = np.abs(self.dir_y) + 1
+        cerca = (y <= paso_y) | (y >= H - PH - paso_y)
+        for plano in (RAQUETA_1_X - PA, RAQUETA_1_X + RA, RAQUETA_2_X - PA, RAQUETA_2_X + RA):
+            cerca |= np.abs(x - plano) <= paso_x
+
+        libres = act & ~cerca
+        self.pelota_x = np.where(libres, x + self.dir_x, x)
+        self.pelota_y = np.where(libres, y + self.dir_y, y)
+
+        indices = np.flatnonzero(act & cerca)
+        restante = np.ones(len(indices))
+
+        for _ in range(motor.MAX_IMPACTOS):
+            if not len(indices):
+                return
+
+            x = self.pelota_x[indices]
+            y = self.pelota_y[indices]
+            dir_x = self.dir_x[indices]
+            dir_y = self.dir_y[indices]
+            vx = dir_x * restante
+            vy = dir_y * restante
+
+            # Paredes de arriba y abajo (divisor 1 donde no se usa)
+            divisor = np.where(vy == 0, 1.0, vy)
+            t = np.where(vy < 0, -y / divisor, np.where(vy > 0, (H - PH - y) / divisor, 1.0))
+            pared = (t >= 0) & (t < 1.0)
+            t_choque = np.where(pared, t, 1.0)
+
+            # Cara de cada raqueta que mira hacia la pelota
+            golpe = np.zeros(len(indices), dtype=bool)
+            divisor = np.where(vx == 0, 1.0, vx)
+            for raqueta_x, raqueta_y in ((RAQUETA_1_X, self.raqueta_1_y[indices]),
+                                         (RAQUETA_2_X, self.raqueta_2_y[indices])):
+                desde_der = (vx < 0) & (x >= raqueta_x + RA)
+                desde_izq = (vx > 0) & (x + PA <= raqueta_x)
+                t = np.where(desde_der, (raqueta_x + RA - x) / divisor, (raqueta_x - x - PA) / divisor)
+                y_t = y + vy * t
+                choca = ((desde_der | desde_izq) & (t >= 0) & (t < t_choque)
+                         & (y_t + PH > raqueta_y) & (y_t < raqueta_y + RH))
+                t_choque = np.where(choca, t, t_choque)
+                golpe |= choca
+                pared &= ~choca
+
+            self.pelota_x[indices] = x + vx * t_choque
+            self.pelota_y[indices] = y + vy * t_choque
+            self.dir_x[indices] = np.where(golpe, -dir_x, dir_x)
+            self.dir_y[indices] = np.where(pared, -dir_y, dir_y)
+            self.toques[indices] += golpe
+
+            # Siguen las que chocaron y todavía tienen tiempo
+            restante = restante * (1.0 - t_choque)
+            sigue = (golpe | pared) & (restante > 0)
+            indices = indices[sigue]
+            restante = restante[sigue]
+
+    # Mueve la raqueta del jugador y la derecha (IA o entrada)
+    def _mover_raquetas(self, dir_1, dir_2, act):
+        # ---- Raqueta del jugador ----
+        nueva_y = self.raqueta_1_y + np.asarray(dir_1) * self.vel_jugador
+        nueva_y = np.clip(nueva_y, 0, H - RH)
+        self.raqueta_1_y = np.where(act, nueva_y, self.raqueta_1_y)
+
+        # ---- Raqueta derecha (IA o entrada) ----
+        if dir_2 is None and self.predictiva:
+            self._mover_ia_predictiva(act)
+        elif dir_2 is None:
+            paso = np.sign(self.pelota_y - self.raqueta_2_y) * self.ia_vel
+            self.raqueta_2_y = self.raqueta_2_y + paso * act
+        else:
+            nueva_y = self.raqueta_2_y + np.asarray(dir_2) * self.vel_jugador
+            nueva_y = np.clip(nueva_y, 0, H - RH)
+            self.raqueta_2_y = np.where(act, nueva_y, self.raqueta_2_y)
+
+    # Versión vectorizada de motor.IAPredictiva.mover
+    def _mover_ia_predictiva(self, act):
+        # Cambio de sentido → recalcular después de "reaccion" ticks
+        cambio = act & (self.dir_x != self.ia_dir_vista)
+        self.ia_dir_vista = np.where(act, self.dir_x, self.ia_dir_vista)
+        self.ia_espera = np.where(cambio, self.reaccion, self.ia_espera)
+        self.ia_pendiente |= cambio
+
+        pendiente = act & self.ia_pendiente
+        listas = pendiente & (self.ia_espera <= 0)
+        self.ia_espera -= pendiente & ~listas
+
+        if listas.any():
+            # Solo la raqueta derecha, con la misma regla que
+            # IAPredictiva.calcular_objetivo: la pelota se acerca si va
+            # hacia el lado de la raqueta (también desde atrás de ella).
+            # Si se aleja vuelve al centro, sin sortear error
+            acerca = listas & ((self.dir_x > 0) == (RAQUETA_2_X > self.pelota_x))
+            error = self._sortear_error(acerca)
+
+            # La trayectoria solo de las que recalculan en este tick,
+            # hasta la cara de la raqueta que la pelota va a tocar
+            i = np.flatnonzero(listas)
+            plano_x = np.where(self.dir_x[i] > 0, RAQUETA_2_X - PA, RAQUETA_2_X + RA)
+            y = motor.predecir_y(self.pelota_x[i], self.pelota_y[i], self.dir_x[i], self.dir_y[i],
+                                 plano_x, PH)
+            y = y + PH / 2 + self.error[i] * error[i]
+            self.ia_objetivo[i] = np.where(acerca[i], y, H / 2)
+            self.ia_pendiente &= ~listas
+
+        paso = np.clip(self.ia_objetivo - (self.raqueta_2_y + RH / 2), -self.ia_vel, self.ia_vel)
+        nueva_y = np.clip(self.raqueta_2_y + paso, 0, H - RH)
+        self.raqueta_2_y = np.where(act, nueva_y, self.raqueta_2_y)
+
+    def correr(self, dir_1=0, dir_2=None, max_ticks=1_000_000):
+        """
+        Avanza hasta que todas las partidas terminen (o max_ticks).
+        Devuelve la cantidad de ticks ejecutados.
+        """
+        t = 0
+        while t < max_ticks and self.activas().any():
+            self.step(dir_1, dir_2)
+            t += 1
+        return t
@@ -0,0 +1,275 @@
+# torneo.py
+# --------------------------------------------------------------
+# Torneo IA contra IA, en paralelo en todos los núcleos.
+#
+# Juega miles de partidas sin ventana (con las reglas de motor.py)
+# sobre una grilla de perfiles: velocidad de la IA izquierda, de la
+# IA derecha y velocidad de la pelota (los ia_vel / velocidad_base
+# de las dificultades). Las partidas se mandan en tandas a los
+# procesos (ProcessPoolExecutor) y cada tanda se suma apenas termina
+# (as_completed), aunque otra mandada antes siga jugando.
+#
+# Al terminar muestra, por cada combinación, cuántas ganó cada lado,
+# cuánto duran los peloteos y cuántas partidas por segundo se jugaron.
+# Una partida que llega a --max-ticks cuenta como empate; si hubo
+# empates se avisa al final. Por defecto la IA erra más que la del
+# juego (--error) para que casi todas las partidas terminen.
+# Con --ranking los ganadores se agregan al ranking en una sola
+# escritura.
+#
+# Ejemplos:
+#   python torneo.py --partidas 200
+#   python torneo.py --ia-vel 4,6,8 --velocidad 6 --procesos 4 --csv partidas.csv
+# --------------------------------------------------------------
+
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import motor
+import ranking
+
+# Valores por defecto de la grilla: los de las dificultades del juego
+IA_VEL = sorted({ia_vel for ia_vel, _, _ in motor.DIFICULTADES.values()})
+VELOCIDADES = sorted({velocidad for _, velocidad, _ in motor.DIFICULTADES.values()})
+
+# Error de puntería por defecto (pixeles). Con el de la IA del juego
+# (motor.PERFILES_IA) dos IA iguales pelotean casi sin fallar y muchas
+# partidas llegan a --max-ticks sin ganador
+ERROR = 80
+
+# Ticks máximos por defecto (más de 8 minutos de juego a 60 ticks/s)
+MAX_TICKS = 30_000
+
+# Partidas por tanda mandada a un proceso (menos overhead por viaje)
+TANDA = 16
+
+# Ganador de una partida
+EMPATE = 0
+GANA_IZQUIERDA = 1
+GANA_DERECHA = 2
+
+
+def jugar_partida(tarea):
+    """
+    Juega una partida IA contra IA y devuelve un diccionario con el
+    resultado. Corre en los procesos del pool: todo lo que recibe y
+    devuelve tiene que poder copiarse entre procesos (pickle).
+
+    tarea: (número, ia_vel izquierda, ia_vel derecha, velocidad_base,
+            semilla, reacción, error, máximo de ticks).
+    reacción None → las dos raquetas persiguen la pelota (IA clásica).
+    """
+    numero, ia_vel_1, ia_vel_2, velocidad_base, semilla, reaccion, error, max_ticks = tarea
+
+    estado = motor.Estado(ia_vel_2, velocidad_base, semilla, continua=True)
+    estado.ia_vel_1 = ia_vel_1
+    if reaccion is not None:
+        rng = random.Random(estado.rng.getrandbits(32))
+        estado.ia_1 = motor.IAPredictiva(reaccion, error, rng)
+        estado.ia = motor.IAPredictiva(reaccion, error, rng)
+
+    # Las dos raquetas las maneja la IA
+    entradas = motor.Entradas(None, None)
+    eventos = []
+    step = motor.step
+
+    toques = 0
+    peloteos = 0
+    toques_total = 0
+    peloteo_max = 0
+
+    while estado.ganador is None and estado.tick < max_ticks:
+        step(estado, entradas, eventos)
+        for tipo, _ in eventos:
+            if tipo == motor.EV_REBOTE_RAQUETA:
+                toques += 1
+            elif tipo == motor.EV_PUNTO:
+                peloteos += 1
+                toques_total += toques
+                peloteo_max = max(peloteo_max, toques)
+                toques = 0
+
+    if estado.ganador == motor.JUGADOR:
+        ganador = GANA_IZQUIERDA
+    elif estado.ganador == motor.IA:
+        ganador = GANA_DERECHA
+    else:
+        ganador = EMPATE  # se llegó a max_ticks
+
+    return {
+        "numero": numero,
+        "ia_vel_1": ia_vel_1,
+        "ia_vel_2": ia_vel_2,
+        "velocidad_base": velocidad_base,
+        "ganador": ganador,
+        "puntos_1": estado.pelota.puntuacion,
+        "puntos_2": estado.pelota.puntuacion_ia,
+        "ticks": estado.tick,
+        "peloteos": peloteos,
+        "toques": toques_total,
+        "peloteo_max": peloteo_max,
+    }
+
+
+def jugar_tanda(tareas):
+    """Juega varias partidas en un proceso del pool (menos viajes)."""
+    return [jugar_partida(tarea) for tarea in tareas]
+
+
+def _resultados_paralelos(pool, tareas_torneo):
+    # Cada tanda se devuelve apenas termina, no en el orden en que se mandó
+    futuros = []
+    tanda = []
+    for tarea in tareas_torneo:
+        tanda.append(tarea)
+        if len(tanda) == TANDA:
+            futuros.append(pool.submit(jugar_tanda, tanda))
+            tanda = []
+    if tanda:
+        futuros.append(pool.submit(jugar_tanda, tanda))
+
+    for futuro in as_completed(futuros):
+        yield from futuro.result()
+
+
+class Resumen:
+    """Totales de todas las partidas de una combinación de la grilla."""
+
+    def __init__(self):
+        self.partidas = 0
+        self.ganadas = [0, 0, 0]  # empates, izquierda, derecha
+        self.ticks = 0
+        self.peloteos = 0
+        self.toques = 0
+        self.peloteo_max = 0
+
+    def sumar(self, resultado):
+        self.partidas += 1
+        self.ganadas[resultado["ganador"]] += 1
+        self.ticks += resultado["ticks"]
+        self.peloteos += resultado["peloteos"]
+        self.toques += resultado["toques"]
+        self.peloteo_max = max(self.peloteo_max, resultado["peloteo_max"])
+
+
+def tareas(args):
+    numero = 0
+    for ia_vel_1, ia_vel_2, velocidad in itertools.product(args.ia_vel, args.ia_vel, args.velocidad):
+        for _ in range(args.partidas):
+            reaccion = None if args.clasica else args.reaccion
+            yield (numero, ia_vel_1, ia_vel_2, velocidad, args.semilla + numero,
+                   reaccion, args.error, args.max_ticks)
+            numero += 1
+
+
+def _lista(texto):
+    return [float(x) if "." in x else int(x) for x in texto.split(",")]
+
+
+def main(argv=None):
+    reaccion, _ = motor.PERFILES_IA["Normal"]
+
+    parser = argparse.ArgumentParser(description="Torneo IA contra IA en paralelo.")
+    parser.add_argument("--ia-vel", type=_lista, default=IA_VEL,
+                        help="velocidades de raqueta de la grilla, separadas por coma")
+    parser.add_argument("--velocidad", type=_lista, default=VELOCIDADES,
+                        help="velocidades de pelota (velocidad_base) de la grilla")
+    parser.add_argument("--partidas", type=int, default=20, help="partidas por combinación")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(),
+                        help="procesos en paralelo (1 = sin pool)")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla de la primera partida")
+    parser.add_argument("--reaccion", type=float, default=reaccion, help="reacción de la IA (segundos)")
+    parser.add_argument("--error", type=float, default=ERROR, help="error de puntería de la IA (pixeles)")
+    parser.add_argument("--clasica", action="store_true",
+                        help="IA que persigue la pelota en vez de la predictiva")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS,
+                        help="ticks máximos por partida (después cuenta como empate)")
+    parser.add_argument("--csv", help="escribe el resultado de cada partida en este archivo")
+    parser.add_argument("--ranking", action="store_true",
+                        help="agrega los ganadores al ranking (una sola escritura al final)")
+    args = parser.parse_args(argv)
+
+    resumenes = {}
+    puntajes = []
+    total = 0
+    ticks = 0
+
+    salida_csv = None
+    escritor_csv = None
+    if args.csv:
+        salida_csv = open(args.csv, "w", encoding="utf-8", newline="")
+
+    pool = None
+    inicio = time.perf_counter()
+    try:
+        if args.procesos > 1:
+            pool = ProcessPoolExecutor(max_workers=args.procesos)
+            resultados = _resultados_paralelos(pool, tareas(args))
+        else:
+            resultados = map(jugar_partida, tareas(args))
+
+        for resultado in resultados:
+            clave = (resultado["ia_vel_1"], resultado["ia_vel_2"], resultado["velocidad_base"])
+            resumenes.setdefault(clave, Resumen()).sumar(resultado)
+            total += 1
+            ticks += resultado["ticks"]
+
+            if salida_csv is not None:
+                if escritor_csv is None:
+                    escritor_csv = csv.DictWriter(salida_csv, fieldnames=list(resultado))
+                    escritor_csv.writeheader()
+                escritor_csv.writerow(resultado)
+
+            if args.ranking and resultado["ganador"] != EMPATE:
+                if resultado["ganador"] == GANA_IZQUIERDA:
+                    puntajes.append((f"IA v{resultado['ia_vel_1']}", resultado["puntos_1"]))
+                else:
+                    puntajes.append((f"IA v{resultado['ia_vel_2']}", resultado["puntos_2"]))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if salida_csv is not None:
+            salida_csv.close()
+
+    duracion = time.perf_counter() - inicio
+
+    # ---- Resumen por combinación ----
+    print(f"{'izq':>5} {'der':>5} {'pelota':>6} {'partidas':>8} {'gana izq':>9} {'gana der':>9} "
+          f"{'empates':>7} {'toques/punto':>12} {'peloteo máx':>11}")
+    for (ia_vel_1, ia_vel_2, velocidad), r in sorted(resumenes.items()):
+        por_punto = r.toques / r.peloteos if r.peloteos else 0
+        print(
+            f"{ia_vel_1:>5} {ia_vel_2:>5} {velocidad:>6} {r.partidas:>8} "
+            f"{r.ganadas[GANA_IZQUIERDA] / r.partidas:>9.1%} {r.ganadas[GANA_DERECHA] / r.partidas:>9.1%} "
+            f"{r.ganadas[EMPATE]:>7} {por_punto:>12.1f} {r.peloteo_max:>11}"
+        )
+
+    empates = sum(r.ganadas[EMPATE] for r in resumenes.values())
+    if empates:
+        print(
+            f"ATENCIÓN: {empates} de {total} partidas ({empates / total:.0%}) llegaron a "
+            f"--max-ticks {args.max_ticks} sin ganador; subir --max-ticks o --error",
+            file=sys.stderr,
+        )
+
+    if puntajes:
+        ranking.guardar_scores(puntajes)
+        print(f"{len(puntajes)} puntajes agregados al ranking")
+
+    por_segundo = total / duracion if duracion > 0 else 0
+    print(
+        f"{total} partidas ({ticks} ticks) en {duracion:.2f} s con {args.procesos} procesos → "
+        f"{por_segundo:,.1f} partidas/s, {ticks / duracion if duracion > 0 else 0:,.0f} ticks/s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+# video.py
+# --------------------------------------------------------------
+# Ventana del juego, con dos formas de llevar los cuadros a la
+# pantalla (config.BACKEND_RENDER o "python main.py --sdl2"):
+#
+#  - "software": pygame.display.set_mode + flip(), como siempre.
+#    La ventana mide 800x600 y se dibuja con blits en la CPU.
+#
+#  - "sdl2": ventana y Renderer de pygame._sdl2.video. El juego
+#    sigue dibujando en 800x600 ("tamaño lógico") y en cada cuadro
+#    eso se copia a la ventana que haya (cualquier tamaño, o pantalla
+#    completa) escalado a lo más grande que entra sin deformarse,
+#    centrado y con barras negras alrededor (ver presentar).
+#    Después de present() SDL no garantiza qué queda en la ventana,
+#    así que cada cuadro se copia entero. Lo que se dibuja solo donde
+#    cambió son las texturas de 800x600, que sí conservan lo anterior:
+#      * el partido usa RendererTexturas (render.py), que dibuja en
+#        "lienzo" (una textura destino) copiando texturas de sprites;
+#      * los menús y las pantallas de nombre / final siguen dibujando
+#        en una superficie de 800x600 (pantalla): mostrar(rects) sube
+#        a su textura solo las zonas que cambiaron.
+#    Con placa de video la GPU escala y a la CPU no le cuesta nada.
+#    Sin placa SDL usa su renderer por software y la copia escalada
+#    se hace pixel por pixel: es la mayor parte del cuadro en una
+#    ventana grande (ver benchmarks/bench_render.py).
+#
+# Si la ventana SDL2 no se puede crear, se vuelve al modo software.
+# --------------------------------------------------------------
+
+import os
+
+import pygame
+
+import config
+
+# Tamaño lógico del juego (donde se dibuja todo)
+ANCHO = 800
+ALTO = 600
+
+NEGRO = (0, 0, 0, 255)
+
+# Modo SDL2: ventana, renderer, la textura donde se sube "pantalla" y
+# la textura donde dibuja el partido
+ventana_sdl = None
+renderer_sdl = None
+_textura_pantalla = None
+lienzo = None
+
+# Tamaño de la ventana la última vez que se acomodó el dibujo, dónde
+# va el dibujo escalado y las barras negras que lo rodean
+_tamano = None
+_destino = None
+_barras = []
+
+# Superficie donde se dibujan los menús (la de set_mode en modo software)
+pantalla = None
+
+
+def iniciar(titulo):
+    """
+    Abre la ventana (o le cambia el título si ya está abierta) y
+    devuelve la superficie de 800x600 donde se dibuja.
+    """
+    global pantalla
+
+    if config.BACKEND_RENDER == "sdl2":
+        if renderer_sdl is None:
+            _abrir_sdl2(titulo)
+        if renderer_sdl is not None:
+            ventana_sdl.title = titulo
+            return pantalla
+
+    pantalla = pygame.display.set_mode((ANCHO, ALTO))
+    pygame.display.set_caption(titulo)
+    return pantalla
+
+
+def _abrir_sdl2(titulo):
+    global ventana_sdl, renderer_sdl, _textura_pantalla, lienzo, pantalla, _tamano
+
+    try:
+        from pygame._sdl2 import video as sdl2_video
+    except ImportError as e:
+        print("No se pudo usar el backend sdl2, se usa el software:", e)
+        return
+
+    pygame.display.init()
+    ventana = None
+    try:
+        ventana = sdl2_video.Window(
+            titulo,
+            size=config.TAMANO_VENTANA,
+            resizable=True,
+            fullscreen_desktop=config.PANTALLA_COMPLETA,
+        )
+        # Primero con la placa de video; si no hay, el de software de SDL
+        # (los errores de _sdl2 no son pygame.error: heredan de RuntimeError)
+        try:
+            renderer = sdl2_video.Renderer(ventana, accelerated=1, vsync=False)
+            con_placa = True
+        except (pygame.error, RuntimeError):
+            renderer = sdl2_video.Renderer(ventana, accelerated=0, vsync=False)
+            con_placa = False
+
+        # Filtro al escalar (SDL lo lee al crear cada textura): suavizado
+        # con placa; sin placa el más cercano, que a la CPU le cuesta
+        # la tercera parte
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear" if con_placa else "nearest")
+
+        textura = sdl2_video.Texture(renderer, (ANCHO, ALTO), streaming=True)
+        destino = sdl2_video.Texture(renderer, (ANCHO, ALTO), target=True)
+    except (pygame.error, RuntimeError) as e:
+        print("No se pudo usar el backend sdl2, se usa el software:", e)
+        if ventana is not None:
+            ventana.destroy()
+        return
+
+    ventana_sdl = ventana
+    renderer_sdl = renderer
+    _textura_pantalla = textura
+    lienzo = destino
+    _tamano = None
+    pantalla = pygame.Surface((ANCHO, ALTO))
+
+
+# True si la ventana es la de SDL2 (el partido dibuja con texturas)
+def usa_texturas():
+    return renderer_sdl is not None
+
+
+def _acomodar():
+    """Calcula dónde va el dibujo de 800x600 en el tamaño actual de la ventana."""
+    global _tamano, _destino, _barras
+
+    _tamano = ventana_sdl.size
+    ancho, alto = _tamano
+    escala = min(ancho / ANCHO, alto / ALTO)
+    w = round(ANCHO * escala)
+    h = round(ALTO * escala)
+    _destino = pygame.Rect((ancho - w) // 2, (alto - h) // 2, w, h)
+
+    # Barras arriba y abajo, o a los costados
+    barras = (
+        pygame.Rect(0, 0, ancho, _destino.top),
+        pygame.Rect(0, _destino.bottom, ancho, alto - _destino.bottom),
+        pygame.Rect(0, _destino.top, _destino.left, h),
+        pygame.Rect(_destino.right, _destino.top, ancho - _destino.right, h),
+    )
+    _barras = [barra for barra in barras if barra.w > 0 and barra.h > 0]
+
+
+def presentar(textura):
+    """
+    Copia una textura de 800x600 (lienzo o la de "pantalla") a toda la
+    ventana, escalada y con las barras negras, y la presenta.
+    Cada cuadro se copia entero: no se usa nada de lo presentado antes.
+    """
+    if ventana_sdl.size != _tamano:
+        _acomodar()
+
+    renderer_sdl.target = None
+    renderer_sdl.draw_color = NEGRO
+    for barra in _barras:
+        renderer_sdl.fill_rect(barra)
+    textura.draw(None, _destino)
+    renderer_sdl.present()
+
+
+def mostrar(rects=None):
+    """
+    Manda "pantalla" a la ventana (reemplaza a pygame.display.flip()).
+
+    rects: zonas de pantalla que cambiaron desde el mostrar() anterior
+    (como pygame.display.update); None = todo. Con el backend sdl2
+    solo esas zonas se suben a la textura, que después se presenta.
+    """
+    if renderer_sdl is None:
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        return
+
+    limites = pantalla.get_rect()
+    for zona in [limites] if rects is None else rects:
+        zona = limites.clip(zona)
+        if zona.w and zona.h:
+            _textura_pantalla.update(pantalla.subsurface(zona), zona)
+
+    presentar(_textura_pantalla)
+
+
+def cerrar():
+    """Cierra la ventana SDL2 (la próxima llamada a iniciar() abre otra)."""
+    global ventana_sdl, renderer_sdl, _textura_pantalla, lienzo, pantalla, _tamano
+
+    if ventana_sdl is not None:
+        ventana_sdl.destroy()
+    ventana_sdl = None
+    renderer_sdl = None
+    _textura_pantalla = None
+    lienzo = None
+    _tamano = None
+    pantalla = None
@@ -0,0 +1,22 @@
+# conftest.py
+# --------------------------------------------------------------
+# Configuración común de las pruebas (pytest):
+#  - deja importar los módulos del juego (carpeta juego_pong)
+#  - fuerza el video y el audio "dummy" de SDL (sin ventana ni sonido)
+#
+# Uso (desde la carpeta del repositorio):
+#   python -m pytest mi_juego/tests
+# --------------------------------------------------------------
+
+import os
+import sys
+
+# Antes de que alguien importe pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CARPETA_PRUEBAS = os.path.dirname(os.path.abspath(__file__))
+CARPETA_JUEGO = os.path.join(os.path.dirname(CARPETA_PRUEBAS), "juego_pong")
+
+if CARPETA_JUEGO not in sys.path:
+    sys.path.insert(0, CARPETA_JUEGO)
@@ -0,0 +1,134 @@
+# test_calibrar.py
+# --------------------------------------------------------------
+# La tabla de calibrar.py tiene que quedar ordenada (Facil se gana
+# más que Normal y Normal más que Dificil), sin dificultades cuyas
+# partidas no terminan y sin dificultades lejos de su objetivo.
+# --------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+import calibrar
+import motor
+import simulador_lote
+
+
+def _candidato(valores, ganadas, partidas, sin_terminar=0):
+    candidato = calibrar.Candidato(valores)
+    candidato.ganadas = ganadas
+    candidato.partidas = partidas
+    candidato.sin_terminar = sin_terminar
+    return candidato
+
+
+def _nivel(nombre, objetivo, candidatos, elegido):
+    nivel = calibrar.Nivel(nombre, objetivo, [])
+    nivel.candidatos = candidatos
+    nivel.elegido = candidatos[elegido]
+    return nivel
+
+
+def test_wilson():
+    assert calibrar.wilson(0, 0) == (0.0, 1.0)
+    bajo, alto = calibrar.wilson(50, 100)
+    assert bajo < 0.5 < alto
+    assert alto - 0.5 == pytest.approx(0.5 - bajo)
+    # Con más partidas el intervalo se achica
+    assert calibrar.wilson(500, 1000)[1] - calibrar.wilson(500, 1000)[0] < alto - bajo
+    assert calibrar.wilson(100, 100)[1] == pytest.approx(1.0)
+
+
+def test_revisar_elige_y_descarta():
+    nivel = calibrar.Nivel("Normal", 0.5, [(5, 6, 5), (3, 4, 5), (7, 8, 5)])
+    cerca, lejos, dudoso = nivel.candidatos
+    cerca.ganadas, cerca.partidas = 500, 1000
+    lejos.ganadas, lejos.partidas = 900, 1000
+    dudoso.ganadas, dudoso.partidas = 6, 10
+
+    assert nivel.revisar(0.05, 256)
+    assert lejos.descartado and not dudoso.descartado
+    assert nivel.elegido is cerca and nivel.aceptado
+
+
+def test_ordenar_cambia_el_elegido_que_no_baja():
+    facil = _nivel("Facil", 0.8, [_candidato((3, 4, 5), 70, 100)], 0)
+    # El más cercano al 50 % se gana más que Facil: queda el siguiente
+    normal = _nivel("Normal", 0.5, [_candidato((7, 8, 5), 95, 100), _candidato((5, 6, 5), 40, 100)], 0)
+    dificil = _nivel("Dificil", 0.25, [_candidato((6, 7, 5), 20, 100)], 0)
+
+    assert calibrar.ordenar([facil, normal, dificil]) == []
+    assert normal.elegido.valores == (5, 6, 5)
+    assert not normal.aceptado
+
+
+def test_ordenar_no_acepta_empates():
+    # Lo que pasaba con la grilla 2x2x1: Normal y Dificil los dos en 0 %
+    facil = _nivel("Facil", 0.8, [_candidato((7, 8, 5), 91, 100)], 0)
+    normal = _nivel("Normal", 0.5, [_candidato((3, 4, 5), 0, 100)], 0)
+    dificil = _nivel("Dificil", 0.25, [_candidato((3, 4, 5), 0, 100)], 0)
+
+    assert calibrar.ordenar([facil, normal, dificil]) == ["Dificil"]
+
+
+def test_ordenar_no_acepta_partidas_sin_fin():
+    facil = _nivel("Facil", 0.8, [_candidato((3, 4, 5), 80, 100)], 0)
+    normal = _nivel("Normal", 0.5, [_candidato((3, 4, 4), 0, 100, sin_terminar=90)], 0)
+    dificil = _nivel("Dificil", 0.25, [_candidato((7, 8, 5), 0, 100)], 0)
+
+    assert calibrar.ordenar([facil, normal, dificil]) == ["Normal"]
+
+
+def test_revisar_descarta_partidas_sin_fin():
+    nivel = calibrar.Nivel("Dificil", 0.25, [(3, 4, 5), (6, 7, 5)])
+    largo, bueno = nivel.candidatos
+    largo.ganadas, largo.sin_terminar, largo.partidas = 6, 18, 24
+    bueno.ganadas, bueno.partidas = 6, 24
+
+    nivel.revisar(0.08, 256)
+    assert largo.descartado
+    assert not bueno.descartado
+
+
+def test_objetivos_ordenados():
+    with pytest.raises(SystemExit):
+        calibrar.main(["--objetivos", "0.5,0.5,0.2"])
+
+
+def test_jugar_lote():
+    valores = np.array([(3, 4, 5), (8, 9, 4)] * 4, dtype=float)
+    tarea = (valores, np.full(8, 12), np.full(8, 40.0), 0, (0.2, 60, 10), (True, True), 20_000)
+
+    ganador = calibrar.jugar_lote(tarea)
+    assert ganador.shape == (8,)
+    assert set(ganador) <= {simulador_lote.SIN_GANADOR, simulador_lote.GANA_JUGADOR, simulador_lote.GANA_IA}
+    # Misma semilla, mismas partidas
+    assert (calibrar.jugar_lote(tarea) == ganador).all()
+
+
+def _calibrar_falso(ganadas, aceptados):
+    # En vez de jugar: el primer candidato de cada nivel con esas victorias
+    def calibrar_falso(niveles, args, pool):
+        for nivel, g, aceptado in zip(niveles, ganadas, aceptados):
+            nivel.elegido = _candidato(nivel.candidatos[0].valores, g, 100)
+            nivel.aceptado = aceptado
+        return 300
+    return calibrar_falso
+
+
+def test_no_escribe_dificultades_lejos_del_objetivo(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(calibrar, "calibrar", _calibrar_falso((73, 18, 1), (False, False, False)))
+    monkeypatch.setattr(motor, "DIFICULTADES", dict(motor.DIFICULTADES))
+    salida = tmp_path / "dificultades.json"
+    argumentos = ["--procesos", "1", "--salida", str(salida)]
+
+    assert calibrar.main(argumentos) == 1
+    assert not salida.exists()
+    assert "--forzar" in capsys.readouterr().err
+
+    # Con --forzar se escribe, pero el juego no carga esas dificultades
+    monkeypatch.setattr(calibrar, "calibrar", _calibrar_falso((73, 18, 1), (True, True, False)))
+    assert calibrar.main(argumentos + ["--forzar"]) == 0
+    antes = motor.parametros("Dificil")
+    cargadas = motor.cargar_dificultades(str(salida))
+    assert set(cargadas) == {"Facil", "Normal"}
+    assert motor.parametros("Dificil") == antes
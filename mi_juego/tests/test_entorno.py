@@ -0,0 +1,138 @@
+# test_entorno.py
+# --------------------------------------------------------------
+# Entornos de entrenamiento (entorno.py): con la misma semilla se
+# repiten los episodios, y las partidas de EntornoLote que terminan
+# vuelven a empezar como una partida nueva, también la IA
+# predictiva del rival.
+# --------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+import config
+import entorno
+import motor
+import simulador_lote
+
+
+def _jugar(env, acciones):
+    resultado = [env.reset()]
+    for accion in acciones:
+        obs, recompensa, hecho, _ = env.step(accion)
+        resultado.append((obs, recompensa, hecho))
+        if np.all(hecho) and isinstance(env, entorno.Entorno):
+            resultado.append(env.reset())
+    return resultado
+
+
+def test_misma_semilla_mismos_episodios():
+    acciones = np.random.default_rng(1).integers(-1, 2, size=(600, 8))
+    for crear, pasos in ((lambda: entorno.Entorno("Facil", semilla=3, max_ticks=200), acciones[:, 0]),
+                         (lambda: entorno.EntornoLote(8, "Facil", semilla=3, max_ticks=200), acciones)):
+        uno = _jugar(crear(), pasos)
+        otro = _jugar(crear(), pasos)
+        assert repr(uno) == repr(otro)
+
+
+def test_recompensas_suman_el_marcador():
+    env = entorno.Entorno("Dificil", semilla=0)
+    env.reset()
+    gen = np.random.default_rng(0)
+    total = 0.0
+    hecho = False
+    while not hecho:
+        _, recompensa, hecho, info = env.step(int(gen.integers(-1, 2)))
+        total += recompensa
+
+    pelota = env.estado.pelota
+    assert info["ganador"] is not None
+    assert total == pelota.puntuacion - pelota.puntuacion_ia
+
+
+def test_lote_reinicia_las_terminadas():
+    lote = entorno.EntornoLote(16, "Normal", semilla=0, max_ticks=50)
+    lote.reset()
+    for _ in range(49):
+        _, _, hecho, _ = lote.step(np.ones(16, dtype=int))
+        assert not hecho.any()
+
+    # Al llegar a max_ticks se cortan y vuelven a empezar solas
+    obs, _, hecho, info = lote.step(np.ones(16, dtype=int))
+    assert hecho.all() and info["truncado"].all()
+    assert not lote.sim.ticks.any()
+    assert not lote.sim.puntuacion.any() and not lote.sim.puntuacion_ia.any()
+    assert (obs[:, 4] == simulador_lote.RAQUETA_Y0 / motor.VENTANA_VERTI).all()
+
+
+def test_por_defecto_como_el_juego():
+    uno = entorno.Entorno()
+    lote = entorno.EntornoLote(4)
+    lote.reset(0)
+
+    assert uno.continua == lote.sim.continua == config.COLISION_CONTINUA
+    assert uno.ia_predictiva == lote.sim.predictiva == config.IA_PREDICTIVA
+
+
+def test_config_se_lee_al_crear(monkeypatch):
+    monkeypatch.setattr(config, "COLISION_CONTINUA", not config.COLISION_CONTINUA)
+    monkeypatch.setattr(config, "IA_PREDICTIVA", not config.IA_PREDICTIVA)
+    lote = entorno.EntornoLote(4)
+    lote.reset(0)
+
+    assert entorno.Entorno().continua == lote.sim.continua == config.COLISION_CONTINUA
+    assert entorno.Entorno().ia_predictiva == lote.sim.predictiva == config.IA_PREDICTIVA
+
+
+@pytest.mark.parametrize("accion", [2, -3, 0.5, "1"])
+def test_acciones_invalidas(accion):
+    uno = entorno.Entorno(semilla=0)
+    uno.reset()
+    with pytest.raises(ValueError):
+        uno.step(accion)
+
+    lote = entorno.EntornoLote(4, semilla=0)
+    lote.reset()
+    with pytest.raises(ValueError):
+        lote.step(np.array([0, 1, -1, accion]))
+
+
+def test_acciones_validas():
+    uno = entorno.Entorno(semilla=0)
+    uno.reset()
+    for accion in (-1, 0, 1, np.int64(1)):
+        uno.step(accion)
+
+    lote = entorno.EntornoLote(4, semilla=0)
+    lote.reset()
+    lote.step(np.array([-1, 0, 1, 1]))
+    with pytest.raises(ValueError):
+        lote.step(np.array([0, 1]))
+
+
+def test_reinicio_deja_la_partida_nueva():
+    lote = entorno.EntornoLote(16, "Facil", semilla=0, ia_predictiva=True)
+    lote.reset()
+    sim = lote.sim
+    gen = np.random.default_rng(0)
+
+    # Que las IA ya hayan calculado algo y la pelota haya rebotado
+    for _ in range(300):
+        lote.step(gen.integers(-1, 2, size=16))
+
+    # Lo mismo que hace step() con las partidas que terminan
+    hecho = np.arange(16) % 2 == 0
+    lote._reiniciar(hecho)
+
+    assert not sim.ticks[hecho].any()
+    assert not sim.toques[hecho].any()
+    assert (sim.ganador[hecho] == simulador_lote.SIN_GANADOR).all()
+    assert (sim.raqueta_2_y[hecho] == simulador_lote.RAQUETA_Y0).all()
+    assert (sim.ia_objetivo[hecho] == simulador_lote.H / 2).all()
+    assert not sim.ia_pendiente[hecho].any()
+    assert not sim.ia_espera[hecho].any()
+    assert not sim.ia_dir_vista[hecho].any()
+
+    # Las que no terminaron siguen con lo suyo
+    assert (sim.ticks[~hecho] == 300).all()
+    assert sim.toques[~hecho].any()
+    assert sim.ia_dir_vista[~hecho].all()
@@ -0,0 +1,202 @@
+# test_ranking.py
+# --------------------------------------------------------------
+# Almacenamientos del ranking (ranking.txt y SQLite) y la
+# herramienta que junta rankings (fusionar_ranking.py).
+# --------------------------------------------------------------
+
+import pytest
+
+import config
+import fusionar_ranking
+import ranking
+
+
+@pytest.fixture
+def archivo(tmp_path, monkeypatch):
+    ruta = tmp_path / "ranking.txt"
+    monkeypatch.setattr(ranking, "RUTA_RANKING", str(ruta))
+    monkeypatch.setattr(config, "RANKING_FSYNC", False)
+    ranking.servicio.invalidar()
+    return ruta
+
+
+def test_sqlite_igual_a_texto(archivo, tmp_path):
+    texto = ranking.AlmacenTexto()
+    texto.agregar_lote([("a", 3), ("b", 9), ("a", 7), ("c", 7), ("b", 1)])
+
+    # La base nueva se llena con lo que ya había en ranking.txt
+    sqlite = ranking.AlmacenSQLite(str(tmp_path / "ranking.db"))
+    assert sqlite.top(10) == texto.top(10) == [("b", 9), ("a", 7), ("c", 7), ("a", 3), ("b", 1)]
+
+    for almacen in (texto, sqlite):
+        almacen.agregar("d", 8)
+        almacen.agregar("c", 9)
+    assert sqlite.top(3) == texto.top(3) == [("b", 9), ("c", 9), ("d", 8)]
+    assert sqlite.mejores_por_jugador(10) == texto.mejores_por_jugador(10) == [("b", 9), ("c", 9), ("d", 8), ("a", 7)]
+    sqlite.cerrar()
+
+
+def test_escritura_diferida(archivo, monkeypatch):
+    monkeypatch.setattr(config, "RANKING_ESCRITURA_DIFERIDA", True)
+    monkeypatch.setattr(config, "RANKING_BACKEND", "texto")
+    monkeypatch.setattr(ranking, "_almacen", None)
+
+    for i in range(10):
+        ranking.guardar_score(f"j{i}", i)
+    ranking.vaciar_escrituras()
+    assert ranking.obtener_top(3) == [("j9", 9), ("j8", 8), ("j7", 7)]
+    assert len(ranking.cargar_ranking()) == 10
+
+
+def test_fusionar_top_k(tmp_path):
+    uno = tmp_path / "uno.txt"
+    dos = tmp_path / "dos.txt"
+    uno.write_bytes(b"a:3\nb:9\nbasura\n")
+    dos.write_bytes(b"c:3\nd:5\n")
+    contador = fusionar_ranking.Contador()
+    assert fusionar_ranking.top_k([str(uno), str(dos)], 3, contador) == [("b", 9), ("d", 5), ("a", 3)]
+    assert (contador.lineas, contador.corruptas) == (5, 1)
+
+
+def test_ordenar_todo_por_tandas(tmp_path):
+    uno = tmp_path / "uno.txt"
+    dos = tmp_path / "dos.txt"
+    uno.write_bytes(b"a:3\nb:9\nc:1\n")
+    dos.write_bytes(b"d:3\ne:5\nf:9\ng:0\n")
+    salida = tmp_path / "global.txt"
+
+    # De a 2 puntajes por tanda: 4 tandas que se mezclan
+    escritos = fusionar_ranking.ordenar_todo([str(uno), str(dos)], str(salida), 2, fusionar_ranking.Contador())
+    assert escritos == 7
+    # A igual puntaje, primero el más viejo
+    assert salida.read_text(encoding="utf-8").split() == ["b:9", "f:9", "e:5", "a:3", "d:3", "c:1", "g:0"]
+
+
+def test_ultima_linea_sin_salto_se_lee(archivo):
+    archivo.write_bytes(b"a:3\nd:5")
+    assert ranking.cargar_ranking() == [("d", 5), ("a", 3)]
+
+
+def test_agregar_descarta_linea_a_medio_escribir(archivo):
+    archivo.write_bytes(b"a:3\nJuli")
+    ranking.AlmacenTexto().agregar("b", 4)
+    assert archivo.read_bytes().split() == [b"a:3", b"b:4"]
+
+
+def test_agregar_descarta_puntaje_a_medio_escribir(archivo):
+    # "Julian:21" cortado en "Julian:2": parece válido, pero no tiene
+    # el salto de línea que marca el lote como completo
+    archivo.write_bytes(b"a:3\nJulian:2")
+    ranking.AlmacenTexto().agregar("b", 4)
+    assert archivo.read_bytes().split() == [b"a:3", b"b:4"]
+
+
+def test_lote_cortado_antes_de_su_marca(archivo, monkeypatch):
+    monkeypatch.setattr(config, "RANKING_FSYNC", True)
+    fsync = ranking.os.fsync
+    llamadas = []
+
+    # Se corta la luz al mandar el lote al disco, antes del salto final
+    def cortar(fd):
+        llamadas.append(fd)
+        if len(llamadas) == 1:
+            raise KeyboardInterrupt
+        fsync(fd)
+
+    monkeypatch.setattr(ranking.os, "fsync", cortar)
+    with pytest.raises(KeyboardInterrupt):
+        ranking.AlmacenTexto().agregar_lote([("Julian", 21)])
+    assert not archivo.read_bytes().endswith(b"\n")
+
+    ranking.AlmacenTexto().agregar("b", 4)
+    assert archivo.read_bytes().split() == [b"b:4"]
+
+
+def test_terminar_archivo_editado_a_mano(archivo, capsys):
+    archivo.write_bytes(b"a:3\nd:5")
+    ranking.main(["--archivo", str(archivo), "--terminar"])
+    assert "d:5" in capsys.readouterr().out
+
+    ranking.AlmacenTexto().agregar("b", 4)
+    assert ranking.cargar_ranking() == [("d", 5), ("b", 4), ("a", 3)]
+    # Ya terminado no cambia nada
+    assert ranking.terminar_archivo(str(archivo)) is None
+
+
+def test_fusionar_incluye_ultima_linea(tmp_path):
+    uno = tmp_path / "uno.txt"
+    dos = tmp_path / "dos.txt"
+    uno.write_bytes(b"a:3\nb:9\n")
+    dos.write_bytes(b"c:1\nd:5")
+    contador = fusionar_ranking.Contador()
+    assert fusionar_ranking.top_k([str(uno), str(dos)], 3, contador) == [("b", 9), ("d", 5), ("a", 3)]
+    assert contador.corruptas == 0
+
+
+def test_fusionar_top_cero(tmp_path):
+    uno = tmp_path / "uno.txt"
+    uno.write_bytes(b"a:3\n")
+    assert fusionar_ranking.top_k([str(uno)], 0, fusionar_ranking.Contador()) == []
+    with pytest.raises(SystemExit):
+        fusionar_ranking.main([str(uno), "--top", "0"])
+
+
+def test_migracion_cortada_se_reintenta(archivo, tmp_path, monkeypatch):
+    archivo.write_text("a:3\nb:9\nc:5\n", encoding="utf-8")
+    ruta_db = str(tmp_path / "ranking.db")
+
+    # La migración se corta después de insertar el primer lote
+    insertar = ranking.AlmacenSQLite._insertar
+
+    def cortar(self, puntajes):
+        insertar(self, puntajes[:1])
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(ranking.AlmacenSQLite, "_insertar", cortar)
+    with pytest.raises(KeyboardInterrupt):
+        ranking.AlmacenSQLite(ruta_db)
+    monkeypatch.setattr(ranking.AlmacenSQLite, "_insertar", insertar)
+
+    # La base ya existe, pero sin la marca: se migra entero
+    almacen = ranking.AlmacenSQLite(ruta_db)
+    assert almacen.top(10) == [("b", 9), ("c", 5), ("a", 3)]
+    almacen.cerrar()
+
+    # Con la marca no se vuelve a migrar
+    almacen = ranking.AlmacenSQLite(ruta_db)
+    assert almacen.top(10) == [("b", 9), ("c", 5), ("a", 3)]
+    almacen.cerrar()
+
+
+def test_ordenar_todo_en_varias_pasadas(tmp_path, monkeypatch):
+    entrada = tmp_path / "uno.txt"
+    entrada.write_text("".join(f"j{i}:{(i * 7) % 10}\n" for i in range(40)), encoding="utf-8")
+    salida = tmp_path / "global.txt"
+
+    # Cuenta las tandas abiertas a la vez durante la mezcla
+    abiertas = []
+    maximo = []
+
+    class Tanda:
+        def __init__(self, ruta, *args, **kwargs):
+            self.f = open(ruta, *args, **kwargs)
+
+        def __enter__(self):
+            abiertas.append(self)
+            maximo.append(len(abiertas))
+            return self.f.__enter__()
+
+        def __exit__(self, *error):
+            abiertas.remove(self)
+            return self.f.__exit__(*error)
+
+    monkeypatch.setattr(fusionar_ranking, "open", Tanda, raising=False)
+
+    # Una tanda por puntaje: 40 tandas, de a 3 por mezcla
+    escritos = fusionar_ranking.ordenar_todo([str(entrada)], str(salida), 1,
+                                             fusionar_ranking.Contador(), max_tandas=3)
+
+    esperado = sorted(((f"j{i}", (i * 7) % 10) for i in range(40)), key=lambda x: -x[1])
+    assert escritos == 40
+    assert [ranking.parsear_linea(linea) for linea in salida.read_text(encoding="utf-8").splitlines()] == esperado
+    assert max(maximo) <= 3 + 1  # más el archivo de salida
@@ -0,0 +1,101 @@
+# test_recursos.py
+# --------------------------------------------------------------
+# Cache horneada de recursos (hornear_recursos.py / recursos.py).
+# --------------------------------------------------------------
+
+import os
+
+import pygame
+import pytest
+
+import hornear_recursos
+import recursos
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    ruta = str(tmp_path / "recursos.cache")
+    pygame.display.init()
+    hornear_recursos.hornear(ruta)
+    monkeypatch.setattr(recursos, "RUTA_CACHE", ruta)
+    monkeypatch.setattr(recursos, "_horneado", None)
+    yield ruta
+    pygame.mixer.quit()
+    pygame.display.quit()
+
+
+def test_imagenes_horneadas_iguales_a_las_originales(cache, monkeypatch):
+    pygame.display.set_mode((800, 600))
+    horneadas = []
+    monkeypatch.setattr(recursos, "imagenes", {})
+
+    # De la cache: sin abrir los PNG
+    with monkeypatch.context() as m:
+        m.setattr(pygame.image, "load", None)
+        for nombre, tamano, alpha in recursos.IMAGENES_HORNEADAS:
+            horneadas.append(recursos.imagen(nombre, tamano, alpha))
+
+    monkeypatch.setattr(recursos, "imagenes", {})
+    monkeypatch.setattr(recursos, "_horneado", {})
+    for superficie, (nombre, tamano, alpha) in zip(horneadas, recursos.IMAGENES_HORNEADAS):
+        original = recursos.imagen(nombre, tamano, alpha)
+        assert superficie.get_size() == original.get_size()
+        assert pygame.image.tobytes(superficie, "RGBA") == pygame.image.tobytes(original, "RGBA"), nombre
+
+
+def test_fuente_cambiada_invalida_la_cache(cache, monkeypatch):
+    fuente = os.path.join(recursos.CARPETA_ASSETS, "pelota.png")
+    st = os.stat(fuente)
+    monkeypatch.setattr(recursos, "huella", lambda ruta: "otra")
+    try:
+        os.utime(fuente, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert recursos._abrir_cache() == {}
+    finally:
+        os.utime(fuente, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _contar_huellas(monkeypatch):
+    llamadas = []
+    original = recursos.huella
+
+    def huella(ruta):
+        llamadas.append(ruta)
+        return original(ruta)
+
+    monkeypatch.setattr(recursos, "huella", huella)
+    return llamadas
+
+
+def test_cache_al_dia_sin_leer_las_fuentes(cache, monkeypatch):
+    llamadas = _contar_huellas(monkeypatch)
+    abierta = recursos._abrir_cache()
+    assert abierta["imagenes"]
+    assert llamadas == []
+
+
+def test_fecha_distinta_compara_la_huella(cache, monkeypatch):
+    fuente = os.path.join(recursos.CARPETA_ASSETS, "pelota.png")
+    st = os.stat(fuente)
+    llamadas = _contar_huellas(monkeypatch)
+    try:
+        os.utime(fuente, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        abierta = recursos._abrir_cache()
+    finally:
+        os.utime(fuente, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    # El contenido es el mismo: la cache sigue sirviendo
+    assert abierta["imagenes"]
+    assert llamadas == [fuente]
+
+
+def test_sonidos_segun_el_mixer_de_cada_momento(cache):
+    # La cache se abre antes de que el mixer esté listo (el audio arranca
+    # en otro hilo): los sonidos horneados tienen que seguir disponibles
+    pygame.mixer.quit()
+    ruta = next(iter(recursos._cache()["sonidos"]), None)
+    if ruta is None:
+        pytest.skip("no hay sonidos para hornear")
+
+    assert recursos._sonido_horneado(ruta) is None
+    pygame.mixer.init()
+    assert recursos._sonido_horneado(ruta) is not None
@@ -0,0 +1,217 @@
+# test_render.py
+# --------------------------------------------------------------
+# El render "sucio" de render.py tiene que dejar en la pantalla
+# exactamente lo mismo que dibujar el cuadro entero.
+# --------------------------------------------------------------
+
+import gc
+import random
+
+import pygame
+import pytest
+
+import config
+import perfilador
+import render
+import video
+
+
+@pytest.fixture
+def ventana():
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((800, 600))
+    pygame.display.quit()
+
+
+def _fondo():
+    # Fondo con dibujo (no liso): un pixel mal repuesto se nota
+    fondo = pygame.Surface((800, 600))
+    for x in range(0, 800, 40):
+        for y in range(0, 600, 40):
+            fondo.fill(((x * 3) % 256, (y * 5) % 256, (x + y) % 256), (x, y, 40, 40))
+    return fondo
+
+
+def _sprite_alpha(tamano, color):
+    # Bordes semitransparentes: dibujarlo dos veces encima cambia el color
+    superficie = pygame.Surface(tamano, pygame.SRCALPHA)
+    superficie.fill(color + (255,))
+    superficie.fill(color + (90,), (0, 0, tamano[0], 3))
+    return superficie
+
+
+def _cuadros(cantidad=500):
+    """Los mismos sprites que se mueven, se quedan quietos o desaparecen."""
+    pelota = _sprite_alpha((30, 30), (250, 250, 250))
+    raqueta = _sprite_alpha((22, 136), (200, 40, 40))
+    fuente = pygame.font.Font(None, 60)
+
+    sprites = [render.Sprite("pelota", pelota), render.Sprite("r1", raqueta),
+               render.Sprite("r2", raqueta), render.Sprite("texto")]
+    sprites[3].mover(350, 40)
+    posiciones = [[400, 300], [60, 232], [718, 232]]
+    textos = {}
+    rnd = random.Random(1)
+
+    for cuadro in range(cantidad):
+        for posicion in posiciones:
+            posicion[0] += rnd.randint(-9, 9)
+            posicion[1] += rnd.randint(-9, 9)
+        for sprite, (x, y) in zip(sprites, posiciones):
+            # Algunos cuadros quietos (el caso "quieto" del render)
+            if cuadro % 7:
+                sprite.mover(x, y)
+
+        texto = str(cuadro // 50)
+        if texto not in textos:
+            textos[texto] = fuente.render(texto, True, (0, 0, 0))
+        sprites[3].superficie = textos[texto]
+        sprites[3].visible = cuadro % 97 != 0
+        yield cuadro, sprites
+
+
+def test_sucio_igual_a_completo(ventana):
+    fondo = _fondo()
+    renderer = render.Renderer(ventana, fondo, sucio=True)
+    referencia = pygame.Surface((800, 600))
+
+    for cuadro, sprites in _cuadros():
+        renderer.dibujar(sprites)
+
+        referencia.blit(fondo, (0, 0))
+        for sprite in sprites:
+            if sprite.visible:
+                referencia.blit(sprite.superficie, sprite.rect)
+
+        assert pygame.image.tobytes(ventana, "RGB") == pygame.image.tobytes(referencia, "RGB"), cuadro
+
+
+def test_texturas_se_suben_una_vez(monkeypatch):
+    # Renderer de SDL por software (el "dummy" no tiene placa de video)
+    monkeypatch.setattr(config, "BACKEND_RENDER", "sdl2")
+    monkeypatch.setattr(config, "TAMANO_VENTANA", (800, 600))
+    monkeypatch.setattr(config, "PANTALLA_COMPLETA", False)
+    pygame.display.init()
+    video.iniciar("prueba")
+    try:
+        assert video.usa_texturas()
+        fondo = _fondo()
+        renderer = render.RendererTexturas(video.renderer_sdl, video.lienzo, video.presentar, fondo)
+        pelota = render.Sprite("pelota", _sprite_alpha((30, 30), (250, 250, 250)))
+
+        # El fondo y la pelota se suben una vez; después solo se copian
+        for x in (400, 405, 410):
+            pelota.mover(x, 300)
+            renderer.dibujar([pelota])
+            assert set(renderer.texturas.keys()) == {fondo, pelota.superficie}
+
+        leida = video.renderer_sdl.to_surface(pygame.Surface((800, 600)))
+        assert leida.get_at((425, 315)) == (250, 250, 250, 255)
+        assert leida.get_at((100, 100)) == fondo.get_at((100, 100))
+
+        # Otra superficie: se sube, y la textura de la anterior se libera
+        pelota.superficie = _sprite_alpha((20, 20), (0, 0, 250))
+        gc.collect()
+        renderer.dibujar([pelota])
+        assert set(renderer.texturas.keys()) == {fondo, pelota.superficie}
+    finally:
+        video.cerrar()
+        pygame.display.quit()
+
+
+def _hay_color(superficie, color):
+    return pygame.mask.from_threshold(superficie, color, (1, 1, 1, 255)).count()
+
+
+@pytest.mark.parametrize("tamano, destino", [
+    ((1920, 1080), (240, 0, 1440, 1080)),   # barras a los costados
+    ((1280, 1024), (0, 32, 1280, 960)),     # barras arriba y abajo
+    ((800, 600), (0, 0, 800, 600)),
+])
+def test_texturas_sucio_en_ventana_grande(monkeypatch, tamano, destino):
+    # Renderer de SDL por software (el "dummy" no tiene placa de video)
+    monkeypatch.setattr(config, "BACKEND_RENDER", "sdl2")
+    monkeypatch.setattr(config, "TAMANO_VENTANA", tamano)
+    monkeypatch.setattr(config, "PANTALLA_COMPLETA", False)
+    pygame.display.init()
+    pygame.font.init()
+    video.iniciar("prueba")
+    try:
+        assert video.usa_texturas()
+        fondo = _fondo()
+        renderer = render.RendererTexturas(video.renderer_sdl, video.lienzo, video.presentar, fondo, sucio=True)
+        destino = pygame.Rect(destino)
+        leida = pygame.Surface(tamano)
+        magenta = (255, 0, 255)
+
+        def mostrado():
+            return video.renderer_sdl.to_surface(leida).copy()
+
+        for cuadro, sprites in _cuadros(150):
+            # Lo que queda en la ventana después de present() no está
+            # definido: se la ensucia antes de cada cuadro
+            video.renderer_sdl.target = None
+            video.renderer_sdl.draw_color = magenta + (255,)
+            video.renderer_sdl.clear()
+
+            renderer.dibujar(sprites)
+            sucio = mostrado()
+
+            # Todo se redibujó, y fuera del dibujo escalado solo hay negro
+            assert not _hay_color(sucio, magenta), cuadro
+            for barra in (pygame.Rect(0, 0, destino.left, tamano[1]),
+                          pygame.Rect(destino.right, 0, tamano[0] - destino.right, tamano[1]),
+                          pygame.Rect(0, 0, tamano[0], destino.top),
+                          pygame.Rect(0, destino.bottom, tamano[0], tamano[1] - destino.bottom)):
+                if barra.w and barra.h:
+                    assert _hay_color(sucio.subsurface(barra), (0, 0, 0)) == barra.w * barra.h, cuadro
+
+            # Escalado: el centro de cada cuadrado del fondo (lejos de los
+            # sprites) cae en su lugar escalado dentro del destino
+            tapado = [s.rect.inflate(4, 4) for s in sprites if s.visible]
+            for x in range(20, 800, 40):
+                for y in range(20, 600, 40):
+                    if pygame.Rect(x, y, 1, 1).collidelist(tapado) >= 0:
+                        continue
+                    punto = (destino.x + int((x + 0.5) * destino.w / 800),
+                             destino.y + int((y + 0.5) * destino.h / 600))
+                    assert sucio.get_at(punto) == fondo.get_at((x, y)), (cuadro, x, y)
+
+            # El mismo cuadro dibujado entero
+            renderer.forzar_completo()
+            renderer.dibujar(sprites)
+            completo = mostrado()
+
+            assert pygame.image.tobytes(sucio, "RGB") == pygame.image.tobytes(completo, "RGB"), cuadro
+    finally:
+        video.cerrar()
+        pygame.display.quit()
+
+
+def test_pixeles_sin_contar_dos_veces(ventana):
+    assert render.area_cubierta([]) == 0
+    assert render.area_cubierta([pygame.Rect(0, 0, 10, 10)]) == 100
+    # Lugar viejo y nuevo de una pelota que se movió 5 pixeles
+    assert render.area_cubierta([pygame.Rect(0, 0, 30, 30), pygame.Rect(5, 5, 30, 30)]) == 30 * 30 * 2 - 25 * 25
+    # Uno adentro de otro, y uno vacío
+    assert render.area_cubierta([pygame.Rect(0, 0, 50, 50), pygame.Rect(10, 10, 5, 5), pygame.Rect(3, 3, 0, 0)]) == 2500
+    # Tres que se pisan en la misma zona
+    rects = [pygame.Rect(0, 0, 20, 20), pygame.Rect(10, 0, 20, 20), pygame.Rect(5, 10, 20, 20)]
+    cubiertos = {(x, y) for r in rects for x in range(r.left, r.right) for y in range(r.top, r.bottom)}
+    assert render.area_cubierta(rects) == len(cubiertos)
+
+
+def test_pixeles_en_el_perfilador(ventana):
+    perfil = perfilador.Perfilador(True)
+    renderer = render.Renderer(ventana, _fondo(), sucio=True, perfil=perfil)
+    pelota = render.Sprite("pelota", _sprite_alpha((30, 30), (250, 250, 250)))
+
+    for x in (100, 105):
+        perfil.empezar_cuadro()
+        pelota.mover(x, 100)
+        renderer.dibujar([pelota])
+
+    # Primer cuadro completo; después la pelota vieja y la nueva, sin repetir
+    assert list(perfil.pixeles) == [800 * 600, 35 * 30]
+    assert any(linea.startswith("pixeles") for linea in perfil.lineas())
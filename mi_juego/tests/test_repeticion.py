@@ -0,0 +1,62 @@
+# test_repeticion.py
+# --------------------------------------------------------------
+# Las partidas grabadas de tests/datos tienen que terminar igual
+# que cuando se grabaron: si una cambia, cambió la física.
+#
+# Para agregar una partida alcanza con copiar a tests/datos un
+# .pong de la carpeta repeticiones (config.GRABAR_PARTIDAS).
+# --------------------------------------------------------------
+
+import glob
+import os
+
+import pytest
+
+import motor
+import repeticion
+
+CARPETA_DATOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos")
+PARTIDAS = sorted(glob.glob(os.path.join(CARPETA_DATOS, "*" + repeticion.EXTENSION)))
+
+
+def test_hay_partidas_grabadas():
+    assert PARTIDAS
+
+
+@pytest.mark.parametrize("ruta", PARTIDAS, ids=os.path.basename)
+def test_partida_grabada_termina_igual(ruta):
+    grabacion = repeticion.Grabacion.cargar(ruta)
+    estado, _ = grabacion.repetir()
+    assert repeticion.resumir(estado) == grabacion.resumen
+
+
+def test_guardar_y_cargar(tmp_path):
+    grabacion = repeticion.Grabacion("Dificil", semilla=5, continua=True, ia_predictiva=True)
+    estado = grabacion.estado_inicial()
+    entradas = motor.Entradas()
+    for tick in range(500):
+        entradas.dir_1 = (tick // 40) % 3 - 1
+        grabacion.registrar(entradas)
+        motor.step(estado, entradas)
+
+    ruta = str(tmp_path / ("partida" + repeticion.EXTENSION))
+    grabacion.guardar(ruta, estado)
+    cargada = repeticion.Grabacion.cargar(ruta)
+
+    assert cargada.valores == grabacion.valores
+    assert cargada.entradas == grabacion.entradas
+    assert repeticion.resumir(cargada.repetir()[0]) == repeticion.resumir(estado)
+
+
+def test_archivo_cortado_es_un_error(tmp_path, capsys):
+    with open(PARTIDAS[0], "rb") as f:
+        datos = f.read()
+    cortado = tmp_path / ("cortado" + repeticion.EXTENSION)
+    cortado.write_bytes(datos[:20])
+    otro = tmp_path / ("otro" + repeticion.EXTENSION)
+    otro.write_bytes(b"no es una partida")
+
+    assert repeticion.main([str(tmp_path)]) == 1
+    salida = capsys.readouterr().out
+    assert "ERROR   cortado.pong" in salida
+    assert "ERROR   otro.pong" in salida
@@ -0,0 +1,134 @@
+# test_simulador_lote.py
+# --------------------------------------------------------------
+# simulador_lote.py tiene que dar exactamente lo mismo que
+# motor.step partida por partida, con las reglas originales y con
+# la colisión continua.
+#
+# Para comparar, el lote sortea con un random.Random por partida,
+# sembrado igual que el de cada motor.Estado: así los dos lados
+# reciben los mismos números al azar en el mismo orden.
+# --------------------------------------------------------------
+
+import random
+
+import numpy as np
+import pytest
+
+import motor
+import simulador_lote
+
+N = 24
+TICKS = 6000
+
+
+class LoteComparable(simulador_lote.SimuladorLote):
+    """SimuladorLote que sortea como N motor.Estado (uno por partida)."""
+
+    def __init__(self, semillas, semillas_ia, *args, **kwargs):
+        self.rngs = [random.Random(s) for s in semillas]
+        self.rngs_ia = [random.Random(s) for s in semillas_ia]
+        super().__init__(len(semillas), *args, **kwargs)
+
+    def _sortear(self, mascara):
+        valores = np.zeros(self.n)
+        for i in np.flatnonzero(mascara):
+            valores[i] = self.rngs[i].choice([-5, 5])
+        return valores
+
+    def _sortear_error(self, mascara):
+        valores = np.zeros(self.n)
+        for i in np.flatnonzero(mascara):
+            valores[i] = self.rngs_ia[i].gauss(0, 1)
+        return valores
+
+
+def _partida(estado):
+    p = estado.pelota
+    ganador = {None: simulador_lote.SIN_GANADOR, motor.JUGADOR: simulador_lote.GANA_JUGADOR,
+               motor.IA: simulador_lote.GANA_IA}[estado.ganador]
+    return (p.x, p.y, p.dir_x, p.dir_y, p.puntuacion, p.puntuacion_ia,
+            estado.raqueta_1.y, estado.raqueta_2.y, ganador)
+
+
+def _lote(lote, i):
+    return (lote.pelota_x[i], lote.pelota_y[i], lote.dir_x[i], lote.dir_y[i],
+            lote.puntuacion[i], lote.puntuacion_ia[i], lote.raqueta_1_y[i],
+            lote.raqueta_2_y[i], lote.ganador[i])
+
+
+@pytest.mark.parametrize("continua", [False, True], ids=["discreta", "continua"])
+@pytest.mark.parametrize("predictiva", [False, True], ids=["persigue", "predictiva"])
+def test_lote_igual_a_motor(predictiva, continua):
+    dificultades = [("Facil", "Normal", "Dificil")[i % 3] for i in range(N)]
+    ia_vel = np.array([motor.parametros(d)[0] for d in dificultades], dtype=float)
+    velocidad = np.array([motor.parametros(d)[1] for d in dificultades], dtype=float)
+    reaccion, error = motor.PERFILES_IA["Normal"]
+
+    estados = []
+    for i in range(N):
+        estado = motor.Estado(ia_vel[i], velocidad[i], semilla=i, continua=continua)
+        if predictiva:
+            estado.ia = motor.IAPredictiva(reaccion, error, random.Random(1000 + i))
+        estados.append(estado)
+
+    kwargs = {"continua": continua}
+    if predictiva:
+        kwargs.update(reaccion=round(reaccion * motor.TICKS_BASE), error=error)
+    lote = LoteComparable(range(N), range(1000, 1000 + N), ia_vel, velocidad, **kwargs)
+
+    entradas = [motor.Entradas() for _ in range(N)]
+    teclas = np.random.default_rng(0)
+
+    for tick in range(TICKS):
+        dir_1 = teclas.integers(-1, 2, N)
+        lote.step(dir_1)
+        for i in range(N):
+            entradas[i].dir_1 = int(dir_1[i])
+            motor.step(estados[i], entradas[i])
+
+        for i in range(N):
+            assert _lote(lote, i) == pytest.approx(_partida(estados[i])), (i, tick)
+
+        if not lote.activas().any():
+            break
+
+    # Que la prueba haya llegado a jugar partidas enteras
+    assert (lote.ganador != simulador_lote.SIN_GANADOR).any()
+
+
+def test_sorteos_solo_de_las_partidas_marcadas():
+    lote = simulador_lote.SimuladorLote(8, 5, 6, semilla=3)
+    otro = simulador_lote.SimuladorLote(8, 5, 6, semilla=3)
+
+    mascara = np.zeros(8, dtype=bool)
+    mascara[[1, 6]] = True
+    valores = lote._sortear(mascara)
+
+    assert set(valores[mascara]) <= {-5.0, 5.0}
+    assert not valores[~mascara].any()
+    # Se sortearon solo dos valores: el generador siguió desde ahí
+    otro.gen.choice(np.array([-5.0, 5.0]), size=2)
+    assert lote.gen.random() == otro.gen.random()
+
+
+def test_ia_predictiva_con_la_pelota_detras_de_la_raqueta():
+    # El juego no llega a este estado, pero las dos IA tienen que decidir
+    # igual: se acerca desde atrás (va a la izquierda) y se aleja
+    x = simulador_lote.RAQUETA_2_X + 40
+    pelotas = [(x, 100.0, -5.0, 3.0), (x, 400.0, 5.0, -4.0)]
+
+    lote = LoteComparable([0, 0], [7, 8], 5, 6, reaccion=0, error=40.0)
+    for i, (px, py, dx, dy) in enumerate(pelotas):
+        lote.pelota_x[i], lote.pelota_y[i], lote.dir_x[i], lote.dir_y[i] = px, py, dx, dy
+    lote.ia_dir_vista[:] = lote.dir_x
+    lote.ia_pendiente[:] = True
+    lote._mover_ia_predictiva(np.ones(2, dtype=bool))
+
+    for i, (px, py, dx, dy) in enumerate(pelotas):
+        estado = motor.Estado(5, 6, semilla=0)
+        pelota = estado.pelota
+        pelota.x, pelota.y, pelota.dir_x, pelota.dir_y = px, py, dx, dy
+        ia = motor.IAPredictiva(0, 40.0, random.Random(7 + i))
+        assert lote.ia_objetivo[i] == pytest.approx(ia.calcular_objetivo(estado.raqueta_2, pelota))
+
+    assert lote.ia_objetivo[1] == simulador_lote.H / 2